@@ -0,0 +1,67 @@
+"""
+Benchmark: text cleaning throughput
+
+Compares the original multi-pass clean_text with the single-pass
+TextProcessor.clean_texts on synthetic crawled pages, plain ASCII and with
+typographic quotes and other non-ASCII characters, and reports MB/s.
+
+Run from the repository root:
+
+    python -m benchmarks.clean_text
+"""
+
+import random
+import re
+import time
+from src.utils.text_processing import TextProcessor
+
+
+N_PAGES = 2000
+PAGE_WORDS = 3000
+WORDS = (
+    "elasticsearch index query shard cluster node replica mapping analyzer "
+    "vector search relevance ranking latency throughput kibana logstash beats"
+).split()
+ASCII_NOISE = ['.', ',', '!', '?', ';', ':', '-', '"', "'", '(', ')', '<p>', '</p>', '&amp;', '#', '@', '$']
+UNICODE_NOISE = ['“', '”', '‘', '’', '—', 'été', ' ', '™']
+
+
+def legacy_clean_text(text):
+    """The original clean_text."""
+    text = re.sub(r'\s+', ' ', text)
+    text = re.sub(r'[^\w\s.,!?;:-]', '', text)
+    text = text.replace('"', '"').replace('"', '"')
+    return text.strip()
+
+
+def build_pages(noise, seed=0):
+    """Build synthetic pages mixing words, punctuation, markup and whitespace runs."""
+    rng = random.Random(seed)
+    tokens = WORDS * 4 + noise + ['\n\n', '\t', '   ']
+    return [' '.join(rng.choices(tokens, k=PAGE_WORDS)) for _ in range(N_PAGES)]
+
+
+def main():
+    """Run the benchmark."""
+    print(f"{'corpus':>8} {'MB':>7} {'legacy (MB/s)':>14} {'single-pass (MB/s)':>19} {'speedup':>9}")
+    for name, noise in [('ascii', ASCII_NOISE), ('unicode', ASCII_NOISE + UNICODE_NOISE)]:
+        pages = build_pages(noise)
+        megabytes = sum(len(page.encode('utf-8')) for page in pages) / 1e6
+        
+        start = time.perf_counter()
+        legacy = [legacy_clean_text(page) for page in pages]
+        legacy_seconds = time.perf_counter() - start
+        
+        start = time.perf_counter()
+        cleaned = list(TextProcessor.clean_texts(pages))
+        seconds = time.perf_counter() - start
+        
+        assert cleaned == legacy
+        print(
+            f"{name:>8} {megabytes:>7.1f} {megabytes / legacy_seconds:>14.1f} "
+            f"{megabytes / seconds:>19.1f} {legacy_seconds / seconds:>8.1f}x"
+        )
+
+
+if __name__ == "__main__":
+    main()
\ No newline at end of file
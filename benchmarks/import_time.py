@@ -0,0 +1,72 @@
+"""
+Benchmark: package import time
+
+Imports common entry points in fresh interpreters and reports the wall
+time of each import and which heavy dependencies it loaded. A CLI call
+that only needs ConfigManager should not load spaCy, NLTK, textstat,
+pandas, openai or pydantic.
+
+Run from the repository root:
+
+    python -m benchmarks.import_time
+"""
+
+import statistics
+import subprocess
+import sys
+
+
+HEAVY_MODULES = ["spacy", "nltk", "textstat", "pandas", "openai", "pydantic", "numpy"]
+STATEMENTS = [
+    "import src",
+    "from src.config import ConfigManager",
+    "from src.utils import TextProcessor",
+    "from src.api_clients import OpenAIClient",
+    "from src.persona_builder import ThemeMatcher",
+    "from src.persona_builder import PersonaBuilder",
+    "from src.entity_extraction import EntityExtractor"
+]
+REPEATS = 5
+
+PROBE = """
+import sys, time
+start = time.perf_counter()
+{statement}
+elapsed = time.perf_counter() - start
+heavy = [name for name in {heavy!r} if name in sys.modules]
+print(elapsed, ",".join(heavy) or "-")
+"""
+
+
+def time_import(statement):
+    """Time one import statement in a fresh interpreter.
+    
+    Returns:
+        Tuple of (median seconds, loaded heavy modules), or (None, error)
+        if the import fails
+    """
+    timings = []
+    for _ in range(REPEATS):
+        result = subprocess.run(
+            [sys.executable, "-c", PROBE.format(statement=statement, heavy=HEAVY_MODULES)],
+            capture_output=True,
+            text=True
+        )
+        if result.returncode != 0:
+            return None, result.stderr.strip().splitlines()[-1]
+        elapsed, heavy = result.stdout.strip().splitlines()[-1].split(" ", 1)
+        timings.append(float(elapsed))
+    return statistics.median(timings), heavy
+
+
+def main():
+    """Run the benchmark."""
+    print(f"{'statement':<50} {'median (s)':>10}  heavy modules loaded")
+    for statement in STATEMENTS:
+        seconds, heavy = time_import(statement)
+        timing = f"{seconds:>10.3f}" if seconds is not None else f"{'failed':>10}"
+        print(f"{statement:<50} {timing}  {heavy}")
+
+
+if __name__ == "__main__":
+    main()
\ No newline at end of file
@@ -0,0 +1,95 @@
+"""
+Benchmark: relationship extraction scaling with entity count
+
+Compares the original all-pairs, all-sentences scan with the
+sentence-indexed RelationshipExtractor on synthetic documents where every
+sentence holds a fixed number of entities, so the number of co-occurring
+pairs grows linearly with the entity count.
+
+Run from the repository root:
+
+    python -m benchmarks.relationship_extraction
+"""
+
+import time
+import spacy
+from src.entity_extraction.entity_extractor import Entity
+from src.entity_extraction.relationship_extractor import RelationshipExtractor
+
+
+ENTITIES_PER_SENTENCE = 4
+ENTITY_COUNTS = [100, 200, 400, 800, 1600]
+
+
+def build_document(nlp, n_entities):
+    """Build a synthetic document and its entities."""
+    sentence = "Elasticsearch indexes Kibana dashboards with Logstash and Beats today. "
+    names = ["Elasticsearch", "Kibana", "Logstash", "Beats"]
+    n_sentences = n_entities // ENTITIES_PER_SENTENCE
+    text = sentence * n_sentences
+    
+    entities = []
+    offset = 0
+    for _ in range(n_sentences):
+        for name in names:
+            start = text.index(name, offset)
+            entities.append(Entity(text=name, label="PRODUCT", start=start, end=start + len(name), confidence=1.0))
+        offset += len(sentence)
+    
+    return nlp(text), entities
+
+
+def legacy_relationships(doc, entities):
+    """The original O(E^2 * S) co-occurrence scan."""
+    relationships = []
+    for i, entity1 in enumerate(entities):
+        for j, entity2 in enumerate(entities[i+1:], i+1):
+            sent1 = None
+            sent2 = None
+            for sent in doc.sents:
+                if entity1.start >= sent.start_char and entity1.end <= sent.end_char:
+                    sent1 = sent
+                if entity2.start >= sent.start_char and entity2.end <= sent.end_char:
+                    sent2 = sent
+            if sent1 and sent2 and sent1 == sent2:
+                relationships.append({
+                    'entity1': entity1.text,
+                    'entity2': entity2.text,
+                    'sentence': sent1.text,
+                    'type': 'co_occurrence',
+                    'confidence': 0.7
+                })
+    return relationships
+
+
+def timed(func, *args):
+    """Run a function once and return (result, seconds)."""
+    start = time.perf_counter()
+    result = func(*args)
+    return result, time.perf_counter() - start
+
+
+def main():
+    """Main benchmark function."""
+    
+    nlp = spacy.blank("en")
+    nlp.add_pipe("sentencizer")
+    extractor = RelationshipExtractor(nlp)
+    
+    print(f"{'entities':>10} {'legacy (s)':>12} {'indexed (s)':>12} {'speedup':>10}")
+    
+    for n_entities in ENTITY_COUNTS:
+        doc, entities = build_document(nlp, n_entities)
+        
+        indexed, indexed_time = timed(extractor.extract, doc.text, entities, doc)
+        
+        if n_entities <= 400:
+            legacy, legacy_time = timed(legacy_relationships, doc, entities)
+            assert legacy == indexed
+            print(f"{n_entities:>10} {legacy_time:>12.4f} {indexed_time:>12.4f} {legacy_time / indexed_time:>9.1f}x")
+        else:
+            print(f"{n_entities:>10} {'skipped':>12} {indexed_time:>12.4f} {'':>10}")
+
+
+if __name__ == "__main__":
+    main()
\ No newline at end of file
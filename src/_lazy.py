@@ -0,0 +1,37 @@
+"""Lazy attribute loading for package exports."""
+
+from importlib import import_module
+from typing import Any, Callable, Dict, List, Tuple
+
+
+def lazy_exports(package: str, exports: Dict[str, str]) -> Tuple[Callable[[str], Any], Callable[[], List[str]], List[str]]:
+    """Build module-level ``__getattr__``, ``__dir__`` and ``__all__`` for a package.
+    
+    Exports are imported on first access (PEP 562), so importing a package
+    stays cheap and only loads the dependencies of the names actually used.
+    Usage in a package ``__init__``::
+    
+        __getattr__, __dir__, __all__ = lazy_exports(__name__, {
+            "TextProcessor": ".text_processing",
+        })
+    
+    Args:
+        package: Name of the package, i.e. its ``__name__``
+        exports: Mapping of exported name to the (relative) module defining it
+        
+    Returns:
+        Tuple of (``__getattr__``, ``__dir__``, ``__all__``)
+    """
+    namespace = import_module(package).__dict__
+    
+    def __getattr__(name: str) -> Any:
+        if name not in exports:
+            raise AttributeError(f"module {package!r} has no attribute {name!r}")
+        value = getattr(import_module(exports[name], package), name)
+        namespace[name] = value
+        return value
+    
+    def __dir__() -> List[str]:
+        return sorted(set(namespace) | set(exports))
+    
+    return __getattr__, __dir__, list(exports)
\ No newline at end of file
@@ -1,13 +1,20 @@
 """API clients for external services."""
 
-from .openai_client import OpenAIClient
-from .anthropic_client import AnthropicClient
-from .google_nlp_client import GoogleNLPClient
-from .elasticsearch_client import ElasticsearchClient
+from typing import TYPE_CHECKING
+from .._lazy import lazy_exports
 
-__all__ = [
-    "OpenAIClient",
-    "AnthropicClient", 
-    "GoogleNLPClient",
-    "ElasticsearchClient"
-]
\ No newline at end of file
+if TYPE_CHECKING:
+    from .openai_client import OpenAIClient
+    from .async_openai_client import AsyncOpenAIClient
+    from .embedding_cache import EmbeddingCache
+    from .rate_limiter import RateLimiter, RetryPolicy
+    from .response_cache import ResponseCache
+
+__getattr__, __dir__, __all__ = lazy_exports(__name__, {
+    "OpenAIClient": ".openai_client",
+    "AsyncOpenAIClient": ".async_openai_client",
+    "EmbeddingCache": ".embedding_cache",
+    "RateLimiter": ".rate_limiter",
+    "RetryPolicy": ".rate_limiter",
+    "ResponseCache": ".response_cache"
+})
\ No newline at end of file
@@ -0,0 +1,98 @@
+"""Asynchronous OpenAI API client for concurrent LLM interactions."""
+
+import asyncio
+from functools import partial
+from typing import Any, Optional
+from ..config import ConfigManager
+from .openai_base import BaseOpenAIClient
+from .rate_limiter import estimate_tokens
+from .response_cache import ResponseCache
+
+
+class AsyncOpenAIClient(BaseOpenAIClient):
+    """Asyncio client for OpenAI API interactions.
+    
+    Mirrors ``OpenAIClient.generate_text`` and shares its configuration and
+    response cache, so many requests can be awaited concurrently. Response
+    cache reads and writes hit SQLite, so they run in the loop's default
+    executor rather than blocking the event loop.
+    """
+    
+    def __init__(self, config_manager: ConfigManager):
+        """Initialize the async OpenAI client.
+        
+        Args:
+            config_manager: Configuration manager instance
+        """
+        import openai
+        
+        super().__init__(config_manager)
+        # Retries are handled by retry_policy so they can share the rate limiter
+        self.client = openai.AsyncOpenAI(api_key=self.api_key, max_retries=0)
+    
+    async def generate_text(
+        self,
+        prompt: str,
+        model: Optional[str] = None,
+        temperature: Optional[float] = None,
+        max_tokens: Optional[int] = None,
+        use_cache: bool = True,
+        **kwargs
+    ) -> str:
+        """Generate text using OpenAI API.
+        
+        Args:
+            prompt: Input prompt
+            model: Model to use (overrides config)
+            temperature: Temperature setting (overrides config)
+            max_tokens: Max tokens (overrides config)
+            use_cache: Read and write the response cache, if one is configured
+            **kwargs: Additional parameters
+            
+        Returns:
+            Generated text
+        """
+        model = model or self.model
+        temperature = temperature or self.temperature
+        max_tokens = max_tokens or self.max_tokens
+        
+        cache_key = None
+        if use_cache and self.response_cache is not None:
+            cache_key = ResponseCache.make_key(
+                model=model,
+                prompt=prompt,
+                temperature=temperature,
+                max_tokens=max_tokens,
+                **kwargs
+            )
+            cached = await self._run_blocking(self.response_cache.get, cache_key)
+            if cached is not None:
+                return cached
+        
+        estimated_tokens = estimate_tokens(prompt, max_tokens)
+        response = await self.retry_policy.acall(
+            self.client.chat.completions.create,
+            limiter=self.rate_limiter,
+            tokens=estimated_tokens,
+            model=model,
+            messages=[{"role": "user", "content": prompt}],
+            temperature=temperature,
+            max_tokens=max_tokens,
+            **kwargs
+        )
+        self._record_usage(estimated_tokens, response)
+        
+        content = response.choices[0].message.content
+        if cache_key is not None and content is not None:
+            await self._run_blocking(self.response_cache.set, cache_key, content)
+        
+        return content
+    
+    @staticmethod
+    async def _run_blocking(function: Any, *args: Any) -> Any:
+        """Run a blocking call in the default executor (``asyncio.to_thread`` on Python 3.9+)."""
+        return await asyncio.get_running_loop().run_in_executor(None, partial(function, *args))
+    
+    async def close(self) -> None:
+        """Close the underlying HTTP connections."""
+        await self.client.close()
\ No newline at end of file
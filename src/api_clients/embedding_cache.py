@@ -0,0 +1,131 @@
+"""Persistent cache of embedding vectors keyed by model and text hash."""
+
+import hashlib
+import os
+import sqlite3
+import threading
+import numpy as np
+from typing import Any, Dict, List, Optional
+
+
+class EmbeddingCache:
+    """SQLite-backed store of float32 embedding vectors.
+    
+    Vectors are stored as raw float32 bytes under (model, SHA-256 of the
+    text), so a text is embedded once per model across runs.
+    """
+    
+    # SQLite's default limit on host parameters per statement is 999
+    LOOKUP_BATCH = 900
+    
+    def __init__(self, path: str):
+        """Initialize the embedding cache.
+        
+        Args:
+            path: Path to the SQLite database file
+        """
+        self.path = path
+        self.hits = 0
+        self.misses = 0
+        
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS embeddings ("
+            "model TEXT NOT NULL, text_hash TEXT NOT NULL, vector BLOB NOT NULL, "
+            "PRIMARY KEY (model, text_hash))"
+        )
+        self._conn.commit()
+    
+    @classmethod
+    def from_config(cls, config_manager: Any, prefix: str) -> Optional["EmbeddingCache"]:
+        """Create a cache from configuration, if enabled.
+        
+        Args:
+            config_manager: Configuration manager instance
+            prefix: Configuration section, e.g. 'apis.openai.embedding_cache'
+            
+        Returns:
+            Embedding cache, or None if caching is disabled
+        """
+        if not config_manager.get(f"{prefix}.enabled", False):
+            return None
+        return cls(config_manager.get(f"{prefix}.path", ".cache/embeddings.sqlite"))
+    
+    @staticmethod
+    def text_hash(text: str) -> str:
+        """Get the cache key for a text.
+        
+        Args:
+            text: Embedded text
+            
+        Returns:
+            Hex digest of the text
+        """
+        return hashlib.sha256(text.encode('utf-8')).hexdigest()
+    
+    def get_many(self, model: str, hashes: List[str]) -> Dict[str, np.ndarray]:
+        """Look up cached vectors.
+        
+        Args:
+            model: Embedding model name
+            hashes: Text hashes to look up
+            
+        Returns:
+            Dictionary mapping found hashes to float32 vectors
+        """
+        found = {}
+        
+        with self._lock:
+            for start in range(0, len(hashes), self.LOOKUP_BATCH):
+                batch = hashes[start:start + self.LOOKUP_BATCH]
+                placeholders = ",".join("?" * len(batch))
+                rows = self._conn.execute(
+                    f"SELECT text_hash, vector FROM embeddings "
+                    f"WHERE model = ? AND text_hash IN ({placeholders})",
+                    [model, *batch]
+                ).fetchall()
+                for text_hash, vector in rows:
+                    found[text_hash] = np.frombuffer(vector, dtype=np.float32)
+            
+            self.hits += len(found)
+            self.misses += len(hashes) - len(found)
+        
+        return found
+    
+    def set_many(self, model: str, vectors: Dict[str, np.ndarray]) -> None:
+        """Store vectors.
+        
+        Args:
+            model: Embedding model name
+            vectors: Dictionary mapping text hashes to vectors
+        """
+        with self._lock:
+            self._conn.executemany(
+                "INSERT OR REPLACE INTO embeddings (model, text_hash, vector) VALUES (?, ?, ?)",
+                [
+                    (model, text_hash, np.asarray(vector, dtype=np.float32).tobytes())
+                    for text_hash, vector in vectors.items()
+                ]
+            )
+            self._conn.commit()
+    
+    def stats(self) -> Dict[str, Any]:
+        """Get cache usage statistics.
+        
+        Returns:
+            Dictionary with entry count, hits and misses
+        """
+        with self._lock:
+            entries = self._conn.execute("SELECT COUNT(*) FROM embeddings").fetchone()[0]
+        return {"entries": entries, "hits": self.hits, "misses": self.misses}
+    
+    def close(self) -> None:
+        """Close the underlying database connection."""
+        with self._lock:
+            self._conn.close()
\ No newline at end of file
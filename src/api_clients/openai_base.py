@@ -0,0 +1,62 @@
+"""Configuration and bookkeeping shared by the OpenAI clients."""
+
+from typing import Dict, Any
+from ..config import ConfigManager
+from .rate_limiter import RateLimiter, RetryPolicy
+from .response_cache import ResponseCache
+
+
+class BaseOpenAIClient:
+    """Settings, quota and response cache common to ``OpenAIClient`` and ``AsyncOpenAIClient``.
+    
+    Subclasses create ``self.client`` for their transport.
+    """
+    
+    def __init__(self, config_manager: ConfigManager):
+        """Read the shared OpenAI settings.
+        
+        Args:
+            config_manager: Configuration manager instance
+        """
+        import openai
+        
+        self.config = config_manager
+        self.api_key = config_manager.get_api_key("openai")
+        
+        # Get model settings
+        self.model = config_manager.get("apis.openai.model", "gpt-4")
+        self.temperature = config_manager.get("apis.openai.temperature", 0.7)
+        self.max_tokens = config_manager.get("apis.openai.max_tokens", 2000)
+        
+        # Persistent response cache; each client opens its own connection, and
+        # clients configured with the same path see the same entries
+        self.response_cache = ResponseCache.from_config(config_manager, "apis.openai.cache")
+        
+        # Client-side quota shared by all OpenAI clients in the process
+        self.rate_limiter = RateLimiter.from_config(config_manager, "apis.openai.rate_limit")
+        self.retry_policy = RetryPolicy.from_config(
+            config_manager,
+            "apis.openai.retry",
+            retryable_exceptions=(openai.APIConnectionError,)
+        )
+    
+    def _record_usage(self, estimated_tokens: int, response: Any) -> None:
+        """Correct the rate limiter with the token usage a response reports.
+        
+        Args:
+            estimated_tokens: Tokens reserved before the request
+            response: API response
+        """
+        usage = getattr(response, 'usage', None)
+        if self.rate_limiter is not None and usage is not None:
+            self.rate_limiter.record_usage(estimated_tokens, usage.total_tokens)
+    
+    def cache_stats(self) -> Dict[str, Any]:
+        """Get response cache statistics.
+        
+        Returns:
+            Cache statistics, or an empty dictionary if caching is disabled
+        """
+        if self.response_cache is None:
+            return {}
+        return self.response_cache.stats()
\ No newline at end of file
@@ -1,11 +1,16 @@
 """OpenAI API client for LLM interactions."""
 
-import openai
-from typing import List, Dict, Any, Optional
+import numpy as np
+from concurrent.futures import ThreadPoolExecutor
+from typing import List, Dict, Any, Optional, Union
 from ..config import ConfigManager
+from .embedding_cache import EmbeddingCache
+from .openai_base import BaseOpenAIClient
+from .rate_limiter import estimate_tokens
+from .response_cache import ResponseCache
 
 
-class OpenAIClient:
+class OpenAIClient(BaseOpenAIClient):
     """Client for OpenAI API interactions."""
     
     def __init__(self, config_manager: ConfigManager):
@@ -14,14 +19,17 @@ class OpenAIClient:
         Args:
             config_manager: Configuration manager instance
         """
-        self.config = config_manager
-        self.api_key = config_manager.get_api_key("openai")
-        self.client = openai.OpenAI(api_key=self.api_key)
-        
-        # Get model settings
-        self.model = config_manager.get("apis.openai.model", "gpt-4")
-        self.temperature = config_manager.get("apis.openai.temperature", 0.7)
-        self.max_tokens = config_manager.get("apis.openai.max_tokens", 2000)
+        import openai
+        
+        super().__init__(config_manager)
+        # Retries are handled by retry_policy so they can share the rate limiter
+        self.client = openai.OpenAI(api_key=self.api_key, max_retries=0)
+        
+        # Embedding request limits and persistent vector cache
+        self.embedding_batch_size = config_manager.get("apis.openai.embedding_batch_size", 2048)
+        self.embedding_max_tokens_per_request = config_manager.get("apis.openai.embedding_max_tokens_per_request", 300000)
+        self.embedding_concurrency = config_manager.get("apis.openai.embedding_concurrency", 4)
+        self.embedding_cache = EmbeddingCache.from_config(config_manager, "apis.openai.embedding_cache")
     
     def generate_text(
         self,
@@ -29,6 +37,7 @@ class OpenAIClient:
         model: Optional[str] = None,
         temperature: Optional[float] = None,
         max_tokens: Optional[int] = None,
+        use_cache: bool = True,
         **kwargs
     ) -> str:
         """Generate text using OpenAI API.
@@ -38,41 +47,150 @@ class OpenAIClient:
             model: Model to use (overrides config)
             temperature: Temperature setting (overrides config)
             max_tokens: Max tokens (overrides config)
+            use_cache: Read and write the response cache, if one is configured
             **kwargs: Additional parameters
             
         Returns:
             Generated text
         """
-        response = self.client.chat.completions.create(
-            model=model or self.model,
+        model = model or self.model
+        temperature = temperature or self.temperature
+        max_tokens = max_tokens or self.max_tokens
+        
+        cache_key = None
+        if use_cache and self.response_cache is not None:
+            cache_key = ResponseCache.make_key(
+                model=model,
+                prompt=prompt,
+                temperature=temperature,
+                max_tokens=max_tokens,
+                **kwargs
+            )
+            cached = self.response_cache.get(cache_key)
+            if cached is not None:
+                return cached
+        
+        estimated_tokens = estimate_tokens(prompt, max_tokens)
+        response = self.retry_policy.call(
+            self.client.chat.completions.create,
+            limiter=self.rate_limiter,
+            tokens=estimated_tokens,
+            model=model,
             messages=[{"role": "user", "content": prompt}],
-            temperature=temperature or self.temperature,
-            max_tokens=max_tokens or self.max_tokens,
+            temperature=temperature,
+            max_tokens=max_tokens,
             **kwargs
         )
+        self._record_usage(estimated_tokens, response)
+        
+        content = response.choices[0].message.content
+        if cache_key is not None and content is not None:
+            self.response_cache.set(cache_key, content)
         
-        return response.choices[0].message.content
+        return content
     
     def generate_embeddings(
         self,
         texts: List[str],
-        model: str = "text-embedding-ada-002"
-    ) -> List[List[float]]:
+        model: str = "text-embedding-ada-002",
+        as_numpy: bool = False,
+        use_cache: bool = True
+    ) -> Union[List[List[float]], np.ndarray]:
         """Generate embeddings for texts.
         
+        Identical texts are embedded once, cached vectors are reused, and the
+        remaining texts are split into requests within the API's input and
+        token limits that are sent concurrently.
+        
         Args:
             texts: List of texts to embed
             model: Embedding model to use
+            as_numpy: Return a contiguous float32 matrix instead of lists
+            use_cache: Read and write the embedding cache, if one is configured
+            
+        Returns:
+            List of embedding vectors, or a matrix with one row per text
+        """
+        unique_texts = list(dict.fromkeys(texts))
+        vectors = {}
+        
+        cache = self.embedding_cache if use_cache else None
+        if cache is not None:
+            hashes = {text: cache.text_hash(text) for text in unique_texts}
+            cached = cache.get_many(model, list(hashes.values()))
+            vectors = {text: cached[hashes[text]] for text in unique_texts if hashes[text] in cached}
+        
+        missing = [text for text in unique_texts if text not in vectors]
+        if missing:
+            chunks = self._chunk_embedding_inputs(missing)
+            with ThreadPoolExecutor(max_workers=max(1, min(self.embedding_concurrency, len(chunks)))) as pool:
+                for chunk, embeddings in zip(chunks, pool.map(lambda c: self._embed_chunk(c, model), chunks)):
+                    vectors.update(zip(chunk, embeddings))
+            
+            if cache is not None:
+                cache.set_many(model, {hashes[text]: vectors[text] for text in missing})
+        
+        if not texts:
+            return np.empty((0, 0), dtype=np.float32) if as_numpy else []
+        
+        unique_matrix = np.stack([vectors[text] for text in unique_texts]).astype(np.float32, copy=False)
+        positions = {text: index for index, text in enumerate(unique_texts)}
+        matrix = unique_matrix[[positions[text] for text in texts]]
+        
+        return matrix if as_numpy else matrix.tolist()
+    
+    def _chunk_embedding_inputs(self, texts: List[str]) -> List[List[str]]:
+        """Split texts into request-sized chunks.
+        
+        Args:
+            texts: Texts to embed
+            
+        Returns:
+            Chunks within the per-request input count and token limits
+        """
+        chunks = []
+        chunk = []
+        chunk_tokens = 0
+        
+        for text in texts:
+            tokens = estimate_tokens(text)
+            if chunk and (
+                len(chunk) >= self.embedding_batch_size
+                or chunk_tokens + tokens > self.embedding_max_tokens_per_request
+            ):
+                chunks.append(chunk)
+                chunk = []
+                chunk_tokens = 0
+            chunk.append(text)
+            chunk_tokens += tokens
+        
+        if chunk:
+            chunks.append(chunk)
+        
+        return chunks
+    
+    def _embed_chunk(self, texts: List[str], model: str) -> List[np.ndarray]:
+        """Embed one chunk of texts with a single API request.
+        
+        Args:
+            texts: Texts in the chunk
+            model: Embedding model to use
             
         Returns:
-            List of embedding vectors
+            List of float32 vectors in input order
         """
-        response = self.client.embeddings.create(
+        estimated_tokens = sum(estimate_tokens(text) for text in texts)
+        response = self.retry_policy.call(
+            self.client.embeddings.create,
+            limiter=self.rate_limiter,
+            tokens=estimated_tokens,
             model=model,
             input=texts
         )
+        self._record_usage(estimated_tokens, response)
         
-        return [data.embedding for data in response.data]
+        data = sorted(response.data, key=lambda item: item.index)
+        return [np.asarray(item.embedding, dtype=np.float32) for item in data]
     
     def classify_text(
         self,
@@ -0,0 +1,381 @@
+"""Client-side rate limiting and retry with backoff for API clients."""
+
+import asyncio
+import random
+import threading
+import time
+from email.utils import parsedate_to_datetime
+from typing import Any, Callable, Dict, Optional, Tuple, Type
+
+
+def estimate_tokens(text: str, max_tokens: int = 0) -> int:
+    """Estimate the tokens a request counts against a tokens-per-minute quota.
+    
+    Uses the common approximation of four characters per token. Providers
+    reserve ``max_tokens`` for the completion up front, so it is included.
+    
+    Args:
+        text: Prompt or input text
+        max_tokens: Completion tokens requested
+        
+    Returns:
+        Estimated token count
+    """
+    return len(text) // 4 + 1 + max_tokens
+
+
+class TokenBucket:
+    """Token bucket that hands out reservations instead of rejecting.
+    
+    The balance may go negative; the deficit tells the caller how long to
+    wait. Callers that wait for their reservation are therefore admitted at
+    exactly the refill rate.
+    """
+    
+    def __init__(self, per_minute: float):
+        """Initialize the bucket full.
+        
+        Args:
+            per_minute: Units refilled per minute, also the bucket capacity
+        """
+        self.capacity = float(per_minute)
+        self.rate = per_minute / 60.0
+        self.tokens = self.capacity
+        self.updated = time.monotonic()
+    
+    def reserve(self, amount: float, now: float) -> float:
+        """Take units from the bucket.
+        
+        Args:
+            amount: Units to take
+            now: Current monotonic time
+            
+        Returns:
+            Seconds to wait before the reservation may be used
+        """
+        self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+        self.updated = now
+        self.tokens -= min(amount, self.capacity)
+        return max(0.0, -self.tokens / self.rate)
+    
+    def refund(self, amount: float) -> None:
+        """Return units, or take more if ``amount`` is negative.
+        
+        Args:
+            amount: Units to return
+        """
+        self.tokens = min(self.capacity, self.tokens + amount)
+
+
+class RateLimiter:
+    """Requests-per-minute and tokens-per-minute limiter shared by callers.
+    
+    Thread-safe and usable from both threads (``acquire``) and asyncio
+    tasks (``acquire_async``). After a 429, ``pause`` holds back every
+    caller sharing the limiter instead of letting each retry on its own.
+    """
+    
+    def __init__(
+        self,
+        requests_per_minute: Optional[float] = None,
+        tokens_per_minute: Optional[float] = None
+    ):
+        """Initialize the rate limiter.
+        
+        Args:
+            requests_per_minute: Request quota; unlimited if None
+            tokens_per_minute: Token quota; unlimited if None
+        """
+        self.requests = TokenBucket(requests_per_minute) if requests_per_minute else None
+        self.tokens = TokenBucket(tokens_per_minute) if tokens_per_minute else None
+        self.paused_until = 0.0
+        self._lock = threading.Lock()
+    
+    def reserve(self, tokens: int = 0) -> float:
+        """Reserve capacity for one request.
+        
+        Args:
+            tokens: Estimated tokens the request will use
+            
+        Returns:
+            Seconds to wait before sending the request
+        """
+        with self._lock:
+            now = time.monotonic()
+            wait = max(0.0, self.paused_until - now)
+            if self.requests is not None:
+                wait = max(wait, self.requests.reserve(1, now))
+            if self.tokens is not None and tokens:
+                wait = max(wait, self.tokens.reserve(tokens, now))
+            return wait
+    
+    def acquire(self, tokens: int = 0) -> None:
+        """Block until a request may be sent.
+        
+        Args:
+            tokens: Estimated tokens the request will use
+        """
+        wait = self.reserve(tokens)
+        if wait > 0:
+            time.sleep(wait)
+    
+    async def acquire_async(self, tokens: int = 0) -> None:
+        """Wait without blocking the event loop until a request may be sent.
+        
+        Args:
+            tokens: Estimated tokens the request will use
+        """
+        wait = self.reserve(tokens)
+        if wait > 0:
+            await asyncio.sleep(wait)
+    
+    def record_usage(self, estimated: int, actual: int) -> None:
+        """Correct the token bucket once the real usage is known.
+        
+        Args:
+            estimated: Tokens reserved for the request
+            actual: Tokens the provider reported
+        """
+        if self.tokens is not None:
+            with self._lock:
+                self.tokens.refund(estimated - actual)
+    
+    def pause(self, seconds: float) -> None:
+        """Hold back all callers, e.g. for a server-sent Retry-After.
+        
+        Args:
+            seconds: Pause duration from now
+        """
+        with self._lock:
+            self.paused_until = max(self.paused_until, time.monotonic() + seconds)
+    
+    @classmethod
+    def from_config(cls, config_manager: Any, prefix: str) -> Optional["RateLimiter"]:
+        """Get the process-wide limiter for a configuration section.
+        
+        Every client configured from the same section shares one limiter,
+        so their combined traffic stays within the quota.
+        
+        Args:
+            config_manager: Configuration manager instance
+            prefix: Configuration section, e.g. 'apis.openai.rate_limit'
+            
+        Returns:
+            Shared rate limiter, or None if no limits are configured
+        """
+        requests_per_minute = config_manager.get(f"{prefix}.requests_per_minute")
+        tokens_per_minute = config_manager.get(f"{prefix}.tokens_per_minute")
+        if not requests_per_minute and not tokens_per_minute:
+            return None
+        
+        key = (prefix, requests_per_minute, tokens_per_minute)
+        with _registry_lock:
+            if key not in _limiters:
+                _limiters[key] = cls(requests_per_minute, tokens_per_minute)
+            return _limiters[key]
+
+
+_limiters: Dict[Tuple[str, Any, Any], RateLimiter] = {}
+_registry_lock = threading.Lock()
+
+
+class RetryPolicy:
+    """Retries rate-limited and transient API failures with backoff.
+    
+    Waits honor the server's ``Retry-After`` header when present and fall
+    back to exponential backoff with jitter otherwise.
+    """
+    
+    RETRYABLE_STATUS_CODES = {408, 409, 429, 500, 502, 503, 504}
+    
+    def __init__(
+        self,
+        max_retries: int = 5,
+        base_delay: float = 1.0,
+        max_delay: float = 60.0,
+        retryable_exceptions: Tuple[Type[BaseException], ...] = ()
+    ):
+        """Initialize the retry policy.
+        
+        Args:
+            max_retries: Retries after the first attempt
+            base_delay: Backoff for the first retry in seconds
+            max_delay: Upper bound for a single wait in seconds
+            retryable_exceptions: Exception types retried regardless of
+                status code, e.g. connection errors
+        """
+        self.max_retries = max_retries
+        self.base_delay = base_delay
+        self.max_delay = max_delay
+        self.retryable_exceptions = retryable_exceptions
+    
+    @classmethod
+    def from_config(
+        cls,
+        config_manager: Any,
+        prefix: str,
+        retryable_exceptions: Tuple[Type[BaseException], ...] = ()
+    ) -> "RetryPolicy":
+        """Create a retry policy from configuration.
+        
+        Args:
+            config_manager: Configuration manager instance
+            prefix: Configuration section, e.g. 'apis.openai.retry'
+            retryable_exceptions: Exception types always retried
+            
+        Returns:
+            Retry policy
+        """
+        return cls(
+            max_retries=config_manager.get(f"{prefix}.max_retries", 5),
+            base_delay=config_manager.get(f"{prefix}.base_delay", 1.0),
+            max_delay=config_manager.get(f"{prefix}.max_delay", 60.0),
+            retryable_exceptions=retryable_exceptions
+        )
+    
+    def is_retryable(self, error: BaseException) -> bool:
+        """Check whether a failed request should be retried.
+        
+        Args:
+            error: Raised exception
+            
+        Returns:
+            True for rate limits, server errors and configured exceptions
+        """
+        if isinstance(error, self.retryable_exceptions):
+            return True
+        return getattr(error, 'status_code', None) in self.RETRYABLE_STATUS_CODES
+    
+    def delay(self, attempt: int, error: BaseException) -> float:
+        """Get the wait before the next attempt.
+        
+        Args:
+            attempt: Zero-based index of the failed attempt
+            error: Raised exception
+            
+        Returns:
+            Seconds to wait
+        """
+        retry_after = _retry_after(error)
+        if retry_after is not None:
+            return min(retry_after, self.max_delay)
+        
+        backoff = self.base_delay * (2 ** attempt)
+        return min(self.max_delay, backoff * (0.5 + random.random() / 2))
+    
+    def call(
+        self,
+        func: Callable[..., Any],
+        *args,
+        limiter: Optional[RateLimiter] = None,
+        tokens: int = 0,
+        **kwargs
+    ) -> Any:
+        """Call a function, rate limited and retried on retryable errors.
+        
+        Args:
+            func: Function performing the request
+            *args: Positional arguments for ``func``
+            limiter: Rate limiter to acquire before each attempt
+            tokens: Estimated tokens per attempt
+            **kwargs: Keyword arguments for ``func``
+            
+        Returns:
+            Result of ``func``
+        """
+        for attempt in range(self.max_retries + 1):
+            if limiter is not None:
+                limiter.acquire(tokens)
+            try:
+                return func(*args, **kwargs)
+            except Exception as e:
+                if attempt == self.max_retries or not self.is_retryable(e):
+                    raise
+                time.sleep(self._backoff(attempt, e, limiter))
+    
+    async def acall(
+        self,
+        func: Callable[..., Any],
+        *args,
+        limiter: Optional[RateLimiter] = None,
+        tokens: int = 0,
+        **kwargs
+    ) -> Any:
+        """Await a coroutine function, rate limited and retried on errors.
+        
+        Args:
+            func: Coroutine function performing the request
+            *args: Positional arguments for ``func``
+            limiter: Rate limiter to acquire before each attempt
+            tokens: Estimated tokens per attempt
+            **kwargs: Keyword arguments for ``func``
+            
+        Returns:
+            Result of ``func``
+        """
+        for attempt in range(self.max_retries + 1):
+            if limiter is not None:
+                await limiter.acquire_async(tokens)
+            try:
+                return await func(*args, **kwargs)
+            except Exception as e:
+                if attempt == self.max_retries or not self.is_retryable(e):
+                    raise
+                await asyncio.sleep(self._backoff(attempt, e, limiter))
+    
+    def _backoff(
+        self,
+        attempt: int,
+        error: BaseException,
+        limiter: Optional[RateLimiter]
+    ) -> float:
+        """Compute the wait after a failure and pause the limiter on a 429.
+        
+        Args:
+            attempt: Zero-based index of the failed attempt
+            error: Raised exception
+            limiter: Rate limiter shared with other callers
+            
+        Returns:
+            Seconds to wait before retrying
+        """
+        wait = self.delay(attempt, error)
+        if limiter is not None and getattr(error, 'status_code', None) == 429:
+            limiter.pause(wait)
+        return wait
+
+
+def _retry_after(error: BaseException) -> Optional[float]:
+    """Read the server-requested wait from an error's response headers.
+    
+    Args:
+        error: Raised exception
+        
+    Returns:
+        Seconds to wait, or None if the response carries no hint
+    """
+    response = getattr(error, 'response', None)
+    headers = getattr(response, 'headers', None)
+    if not headers:
+        return None
+    
+    retry_after_ms = headers.get('retry-after-ms')
+    if retry_after_ms:
+        try:
+            return float(retry_after_ms) / 1000.0
+        except ValueError:
+            pass
+    
+    retry_after = headers.get('retry-after')
+    if not retry_after:
+        return None
+    
+    try:
+        return max(0.0, float(retry_after))
+    except ValueError:
+        pass
+    
+    try:
+        return max(0.0, parsedate_to_datetime(retry_after).timestamp() - time.time())
+    except (TypeError, ValueError):
+        return None
\ No newline at end of file
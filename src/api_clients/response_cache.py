@@ -0,0 +1,197 @@
+"""Persistent, content-addressed cache for API responses."""
+
+import hashlib
+import json
+import os
+import sqlite3
+import threading
+import time
+from typing import Any, Dict, Optional
+
+
+class ResponseCache:
+    """SQLite-backed response cache with TTL expiry and LRU size eviction.
+    
+    Entries are keyed by a SHA-256 hash of the request parameters, so the
+    same prompt sent with the same model and settings is answered from disk
+    across runs and processes.
+    """
+    
+    def __init__(
+        self,
+        path: str,
+        ttl_seconds: Optional[float] = None,
+        max_size_bytes: Optional[int] = None
+    ):
+        """Initialize the response cache.
+        
+        Args:
+            path: Path to the SQLite database file
+            ttl_seconds: Entry lifetime; entries never expire if None
+            max_size_bytes: Total size of stored values before the least
+                recently used entries are evicted; unbounded if None
+        """
+        self.path = path
+        self.ttl_seconds = ttl_seconds
+        self.max_size_bytes = max_size_bytes
+        self.hits = 0
+        self.misses = 0
+        
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS responses ("
+            "key TEXT PRIMARY KEY, value TEXT NOT NULL, size INTEGER NOT NULL, "
+            "created_at REAL NOT NULL, accessed_at REAL NOT NULL)"
+        )
+        self._conn.execute(
+            "CREATE INDEX IF NOT EXISTS responses_accessed_at ON responses (accessed_at)"
+        )
+        self._conn.commit()
+        self._total_size = self._conn.execute(
+            "SELECT COALESCE(SUM(size), 0) FROM responses"
+        ).fetchone()[0]
+    
+    @classmethod
+    def from_config(cls, config_manager: Any, prefix: str) -> Optional["ResponseCache"]:
+        """Create a cache from configuration, if enabled.
+        
+        Args:
+            config_manager: Configuration manager instance
+            prefix: Configuration section, e.g. 'apis.openai.cache'
+            
+        Returns:
+            Response cache, or None if caching is disabled
+        """
+        if not config_manager.get(f"{prefix}.enabled", False):
+            return None
+        
+        max_size_mb = config_manager.get(f"{prefix}.max_size_mb", 512)
+        return cls(
+            config_manager.get(f"{prefix}.path", ".cache/responses.sqlite"),
+            ttl_seconds=config_manager.get(f"{prefix}.ttl_seconds"),
+            max_size_bytes=max_size_mb * 1024 * 1024 if max_size_mb else None
+        )
+    
+    @staticmethod
+    def make_key(**parts: Any) -> str:
+        """Build a cache key from request parameters.
+        
+        Args:
+            **parts: Parameters that determine the response
+            
+        Returns:
+            Hex digest identifying the request
+        """
+        payload = json.dumps(parts, sort_keys=True, default=str)
+        return hashlib.sha256(payload.encode('utf-8')).hexdigest()
+    
+    def get(self, key: str) -> Optional[str]:
+        """Look up a cached response.
+        
+        Args:
+            key: Cache key from ``make_key``
+            
+        Returns:
+            Cached value, or None on a miss or an expired entry
+        """
+        now = time.time()
+        
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT value, size, created_at FROM responses WHERE key = ?", (key,)
+            ).fetchone()
+            
+            if row is None:
+                self.misses += 1
+                return None
+            
+            value, size, created_at = row
+            if self.ttl_seconds is not None and now - created_at > self.ttl_seconds:
+                self._conn.execute("DELETE FROM responses WHERE key = ?", (key,))
+                self._conn.commit()
+                self._total_size -= size
+                self.misses += 1
+                return None
+            
+            self._conn.execute("UPDATE responses SET accessed_at = ? WHERE key = ?", (now, key))
+            self._conn.commit()
+            self.hits += 1
+            return value
+    
+    def set(self, key: str, value: str) -> None:
+        """Store a response, evicting least recently used entries if needed.
+        
+        Args:
+            key: Cache key from ``make_key``
+            value: Response to store
+        """
+        now = time.time()
+        size = len(value.encode('utf-8'))
+        
+        with self._lock:
+            previous = self._conn.execute(
+                "SELECT size FROM responses WHERE key = ?", (key,)
+            ).fetchone()
+            self._conn.execute(
+                "INSERT OR REPLACE INTO responses (key, value, size, created_at, accessed_at) "
+                "VALUES (?, ?, ?, ?, ?)",
+                (key, value, size, now, now)
+            )
+            self._total_size += size - (previous[0] if previous else 0)
+            self._evict()
+            self._conn.commit()
+    
+    def _evict(self) -> None:
+        """Delete least recently used entries until under the size limit."""
+        if self.max_size_bytes is None:
+            return
+        
+        while self._total_size > self.max_size_bytes:
+            rows = self._conn.execute(
+                "SELECT key, size FROM responses ORDER BY accessed_at LIMIT 100"
+            ).fetchall()
+            if not rows:
+                self._total_size = 0
+                return
+            
+            for key, size in rows:
+                self._conn.execute("DELETE FROM responses WHERE key = ?", (key,))
+                self._total_size -= size
+                if self._total_size <= self.max_size_bytes:
+                    return
+    
+    def clear(self) -> None:
+        """Delete all cached responses."""
+        with self._lock:
+            self._conn.execute("DELETE FROM responses")
+            self._conn.commit()
+            self._total_size = 0
+    
+    def stats(self) -> Dict[str, Any]:
+        """Get cache usage statistics.
+        
+        Returns:
+            Dictionary with entry count, stored bytes, hits, misses and hit rate
+        """
+        with self._lock:
+            entries = self._conn.execute("SELECT COUNT(*) FROM responses").fetchone()[0]
+        
+        lookups = self.hits + self.misses
+        return {
+            "entries": entries,
+            "size_bytes": self._total_size,
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": self.hits / lookups if lookups else 0.0
+        }
+    
+    def close(self) -> None:
+        """Close the underlying database connection."""
+        with self._lock:
+            self._conn.close()
\ No newline at end of file
@@ -1,6 +1,13 @@
 """Configuration management for the semantic SEO strategy framework."""
 
-from .config_manager import ConfigManager
-from .settings import Settings
+from typing import TYPE_CHECKING
+from .._lazy import lazy_exports
 
-__all__ = ["ConfigManager", "Settings"]
\ No newline at end of file
+if TYPE_CHECKING:
+    from .config_manager import ConfigManager
+    from .settings import Settings
+
+__getattr__, __dir__, __all__ = lazy_exports(__name__, {
+    "ConfigManager": ".config_manager",
+    "Settings": ".settings"
+})
\ No newline at end of file
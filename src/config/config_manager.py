@@ -5,7 +5,6 @@ import yaml
 from pathlib import Path
 from typing import Any, Dict, Optional
 from dotenv import load_dotenv
-from pydantic import BaseModel, Field
 
 
 class ConfigManager:
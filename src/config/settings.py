@@ -10,6 +10,20 @@ class APISettings(BaseModel):
     openai_model: str = Field(default="gpt-4", description="OpenAI model to use")
     openai_temperature: float = Field(default=0.7, ge=0.0, le=2.0)
     openai_max_tokens: int = Field(default=2000, gt=0)
+    openai_cache_enabled: bool = Field(default=False)
+    openai_cache_path: str = Field(default=".cache/openai_responses.sqlite")
+    openai_cache_ttl_seconds: Optional[float] = Field(default=None, gt=0)
+    openai_cache_max_size_mb: Optional[int] = Field(default=512, gt=0)
+    openai_requests_per_minute: Optional[float] = Field(default=None, gt=0)
+    openai_tokens_per_minute: Optional[float] = Field(default=None, gt=0)
+    openai_max_retries: int = Field(default=5, ge=0)
+    openai_retry_base_delay: float = Field(default=1.0, gt=0.0)
+    openai_retry_max_delay: float = Field(default=60.0, gt=0.0)
+    openai_embedding_batch_size: int = Field(default=2048, gt=0)
+    openai_embedding_max_tokens_per_request: int = Field(default=300000, gt=0)
+    openai_embedding_concurrency: int = Field(default=4, gt=0)
+    openai_embedding_cache_enabled: bool = Field(default=False)
+    openai_embedding_cache_path: str = Field(default=".cache/openai_embeddings.sqlite")
     
     anthropic_model: str = Field(default="claude-3-sonnet-20240229")
     anthropic_max_tokens: int = Field(default=2000, gt=0)
@@ -18,6 +32,31 @@ class APISettings(BaseModel):
     google_nlp_confidence_threshold: float = Field(default=0.7, ge=0.0, le=1.0)
 
 
+class PersonaBuildingSettings(BaseModel):
+    """Persona building configuration."""
+    
+    chunk_size: Optional[int] = Field(default=None, gt=0)
+    grouping_dimensions: List[str] = Field(default=["company_size", "industry"])
+    min_pattern_frequency: int = Field(default=5, gt=0)
+    max_pain_points: int = Field(default=10, gt=0)
+    max_workers: int = Field(default=32, gt=0)
+    theme_discovery_n_themes: Optional[int] = Field(default=None, gt=0)
+    theme_discovery_batch_size: int = Field(default=1000, gt=0)
+    theme_discovery_embedding_model: str = Field(default="text-embedding-ada-002")
+    theme_discovery_samples_per_theme: int = Field(default=5, gt=0)
+    theme_keywords: Dict[str, List[str]] = Field(default={
+        "performance": ["slow", "performance", "speed", "optimization"],
+        "scalability": ["scale", "scaling", "large", "volume"],
+        "integration": ["integrate", "api", "connect", "setup"],
+        "cost": ["cost", "price", "expensive", "budget"],
+        "security": ["security", "secure", "compliance", "privacy"]
+    })
+    cache_enabled: bool = Field(default=False)
+    cache_path: str = Field(default=".cache/personas.sqlite")
+    cache_ttl_seconds: Optional[float] = Field(default=None, gt=0)
+    cache_max_size_mb: Optional[int] = Field(default=64, gt=0)
+
+
 class EntityExtractionSettings(BaseModel):
     """Entity extraction configuration."""
     
@@ -26,6 +65,17 @@ class EntityExtractionSettings(BaseModel):
     entity_types: List[str] = Field(default=[
         "PERSON", "ORG", "GPE", "PRODUCT", "TECHNOLOGY", "CONCEPT"
     ])
+    batch_size: int = Field(default=64, gt=0)
+    n_process: int = Field(default=1, gt=0)
+    n_workers: Optional[int] = Field(default=None, gt=0)
+    chunk_size: int = Field(default=256, gt=0)
+    max_in_flight_chunks: Optional[int] = Field(default=None, gt=0)
+    max_in_flight_chars: int = Field(default=200_000_000, gt=0)
+    preload_model: bool = Field(default=True)
+    pipeline_rows_per_part: int = Field(default=10000, gt=0)
+    pipeline_read_batch_size: int = Field(default=1024, gt=0)
+    pipeline_output_format: str = Field(default="jsonl")
+    document_cache_size: int = Field(default=32, gt=0)
 
 
 class SemanticClusteringSettings(BaseModel):
@@ -35,6 +85,9 @@ class SemanticClusteringSettings(BaseModel):
     n_clusters: int = Field(default=10, gt=0)
     min_cluster_size: int = Field(default=5, gt=0)
     similarity_threshold: float = Field(default=0.7, ge=0.0, le=1.0)
+    batch_size: int = Field(default=4096, gt=0)
+    random_state: int = Field(default=42)
+    track_memory: bool = Field(default=False)
 
 
 class QueryClassificationSettings(BaseModel):
@@ -47,6 +100,11 @@ class QueryClassificationSettings(BaseModel):
     entity_types: List[str] = Field(default=[
         "product", "technology", "concept", "use_case"
     ])
+    max_concurrency: int = Field(default=8, gt=0)
+    pack_size: int = Field(default=20, gt=0)
+    pack_tokens_per_query: int = Field(default=150, gt=0)
+    embedding_model: str = Field(default="text-embedding-ada-002")
+    local_confidence_threshold: float = Field(default=0.8, ge=0.0, le=1.0)
 
 
 class GapAnalysisSettings(BaseModel):
@@ -96,6 +154,7 @@ class Settings(BaseModel):
     log_level: str = Field(default="INFO")
     
     apis: APISettings = Field(default_factory=APISettings)
+    persona_building: PersonaBuildingSettings = Field(default_factory=PersonaBuildingSettings)
     entity_extraction: EntityExtractionSettings = Field(default_factory=EntityExtractionSettings)
     semantic_clustering: SemanticClusteringSettings = Field(default_factory=SemanticClusteringSettings)
     query_classification: QueryClassificationSettings = Field(default_factory=QueryClassificationSettings)
@@ -1,7 +1,17 @@
 """Entity extraction module for identifying and extracting entities from content."""
 
-from .entity_extractor import EntityExtractor
-from .entity_validator import EntityValidator
-from .entity_ranker import EntityRanker
+from typing import TYPE_CHECKING
+from .._lazy import lazy_exports
 
-__all__ = ["EntityExtractor", "EntityValidator", "EntityRanker"]
\ No newline at end of file
+if TYPE_CHECKING:
+    from .entity_extractor import EntityExtractor
+    from .parallel_extractor import ParallelEntityExtractor
+    from .document_pipeline import DocumentPipeline
+    from .relationship_extractor import RelationshipExtractor
+
+__getattr__, __dir__, __all__ = lazy_exports(__name__, {
+    "EntityExtractor": ".entity_extractor",
+    "ParallelEntityExtractor": ".parallel_extractor",
+    "DocumentPipeline": ".document_pipeline",
+    "RelationshipExtractor": ".relationship_extractor"
+})
\ No newline at end of file
@@ -0,0 +1,282 @@
+"""Streaming, resumable entity extraction over JSONL and Parquet document exports."""
+
+import json
+import os
+import re
+from collections import deque
+from dataclasses import asdict
+from typing import List, Dict, Any, Optional, Tuple, Iterator, Union
+from ..config import ConfigManager
+from .entity_extractor import EntityExtractor
+from .parallel_extractor import ParallelEntityExtractor
+
+
+JSONL_EXTENSIONS = (".jsonl", ".ndjson")
+PARQUET_EXTENSIONS = (".parquet", ".pq")
+OUTPUT_FORMATS = ("jsonl", "parquet")
+CHECKPOINT_FILE = "_checkpoint.json"
+PART_PATTERN = re.compile(r"^part-(\d+)\.(jsonl|parquet)$")
+
+
+def iter_jsonl_documents(path: str, start: int = 0) -> Iterator[Tuple[Dict[str, Any], int]]:
+    """Read documents from a JSONL file lazily.
+    
+    Args:
+        path: Path to a JSONL file, one document per line
+        start: Byte offset to start reading at, as yielded by a previous read
+        
+    Yields:
+        Tuples of (document, byte offset just past the document)
+    """
+    with open(path, 'rb') as file:
+        file.seek(start)
+        offset = start
+        for line in file:
+            offset += len(line)
+            if line.strip():
+                yield json.loads(line), offset
+
+
+def iter_parquet_documents(
+    path: str,
+    start: int = 0,
+    columns: Optional[List[str]] = None,
+    batch_size: int = 1024
+) -> Iterator[Tuple[Dict[str, Any], int]]:
+    """Read documents from a Parquet file lazily, one record batch at a time.
+    
+    Args:
+        path: Path to a Parquet file
+        start: Row to start reading at, as yielded by a previous read
+        columns: Columns to read; columns missing from the file are skipped
+            and all columns are read if not given
+        batch_size: Rows per record batch
+        
+    Yields:
+        Tuples of (document, row number just past the document)
+    """
+    import pyarrow.parquet as pq
+    
+    parquet_file = pq.ParquetFile(path)
+    if columns is not None:
+        columns = [column for column in columns if column in parquet_file.schema_arrow.names]
+    
+    # Row groups entirely before the start row are never read
+    row = 0
+    first_group = 0
+    for group in range(parquet_file.num_row_groups):
+        group_rows = parquet_file.metadata.row_group(group).num_rows
+        if row + group_rows > start:
+            break
+        row += group_rows
+        first_group += 1
+    else:
+        return
+    
+    for batch in parquet_file.iter_batches(
+        batch_size=batch_size,
+        row_groups=range(first_group, parquet_file.num_row_groups),
+        columns=columns
+    ):
+        for document in batch.to_pylist():
+            row += 1
+            if row > start:
+                yield document, row
+
+
+class DocumentPipeline:
+    """Extract entities from a document export to part files, resumably.
+    
+    Documents are read lazily from a JSONL or Parquet file and streamed
+    through the extractor. Results are written to numbered part files
+    (``part-00000.jsonl`` or ``.parquet``) of ``rows_per_part`` documents
+    each. After every part, a checkpoint records the input offset it
+    covers, so memory stays constant and an interrupted run resumes after
+    the last complete part. Parts and checkpoints are written to a
+    temporary file and renamed into place.
+    
+    Documents should carry an 'id'; otherwise the extractor's fallback ID
+    is used, which is not stable across runs. IDs are written as strings
+    in both output formats.
+    """
+    
+    def __init__(
+        self,
+        extractor: Union[EntityExtractor, ParallelEntityExtractor],
+        config_manager: ConfigManager,
+        text_field: str = "content"
+    ):
+        """Initialize the document pipeline.
+        
+        Args:
+            extractor: Extractor providing ``iter_entities_from_documents``
+            config_manager: Configuration manager instance
+            text_field: Field containing the text content
+        """
+        self.extractor = extractor
+        self.text_field = text_field
+        self.rows_per_part = config_manager.get("entity_extraction.pipeline.rows_per_part", 10000)
+        self.read_batch_size = config_manager.get("entity_extraction.pipeline.read_batch_size", 1024)
+        self.output_format = config_manager.get("entity_extraction.pipeline.output_format", "jsonl")
+    
+    def run(
+        self,
+        input_path: str,
+        output_dir: str,
+        resume: bool = True,
+        output_format: Optional[str] = None
+    ) -> Dict[str, Any]:
+        """Extract entities from every document of an export.
+        
+        Args:
+            input_path: JSONL or Parquet file of documents
+            output_dir: Directory for part files and the checkpoint
+            resume: Continue from the checkpoint in ``output_dir``; if
+                False, ``output_dir`` must be empty
+            output_format: 'jsonl' or 'parquet' (overrides config)
+            
+        Returns:
+            Dictionary with documents (extracted in total), parts (written
+            in total), offset (input position reached) and complete
+        """
+        output_format = output_format or self.output_format
+        if output_format not in OUTPUT_FORMATS:
+            raise ValueError(f"Unsupported output format: {output_format}")
+        
+        os.makedirs(output_dir, exist_ok=True)
+        if not resume and os.listdir(output_dir):
+            raise ValueError(f"Output directory must be empty when not resuming: {output_dir}")
+        
+        checkpoint = self._load_checkpoint(output_dir, input_path)
+        if checkpoint['complete']:
+            return checkpoint
+        self._remove_uncommitted_parts(output_dir, checkpoint['parts'])
+        source = self._iter_documents(input_path, checkpoint['offset'])
+        
+        # Input offsets of documents handed to the extractor and not yet
+        # written, with whether each has text (and so produces a result)
+        pending = deque()
+        
+        def documents():
+            for document, offset in source:
+                has_text = bool(document.get(self.text_field))
+                pending.append((offset, has_text))
+                if has_text:
+                    yield document
+        
+        rows = []
+        offset = checkpoint['offset']
+        results = self.extractor.iter_entities_from_documents(documents(), text_field=self.text_field)
+        for doc_id, entities in results:
+            offset, has_text = pending.popleft()
+            while not has_text:
+                offset, has_text = pending.popleft()
+            
+            rows.append({'id': str(doc_id), 'entities': [asdict(entity) for entity in entities]})
+            if len(rows) >= self.rows_per_part:
+                self._commit_part(output_dir, checkpoint, rows, offset, output_format)
+                rows = []
+        
+        # Documents without text after the last result
+        if pending:
+            offset = pending[-1][0]
+        if rows:
+            self._commit_part(output_dir, checkpoint, rows, offset, output_format)
+        
+        checkpoint.update(offset=offset, complete=True)
+        self._save_checkpoint(output_dir, checkpoint)
+        return checkpoint
+    
+    def _iter_documents(self, path: str, start: int) -> Iterator[Tuple[Dict[str, Any], int]]:
+        """Read documents from a JSONL or Parquet file, chosen by extension."""
+        if path.lower().endswith(PARQUET_EXTENSIONS):
+            return iter_parquet_documents(path, start, ['id', self.text_field], self.read_batch_size)
+        if path.lower().endswith(JSONL_EXTENSIONS):
+            return iter_jsonl_documents(path, start)
+        raise ValueError(f"Unsupported document file: {path}")
+    
+    def _commit_part(
+        self,
+        output_dir: str,
+        checkpoint: Dict[str, Any],
+        rows: List[Dict[str, Any]],
+        offset: int,
+        output_format: str
+    ) -> None:
+        """Write one part file, then record it and its input offset in the checkpoint."""
+        part_path = os.path.join(output_dir, f"part-{checkpoint['parts']:05d}.{output_format}")
+        tmp_path = part_path + ".tmp"
+        
+        if output_format == "parquet":
+            import pyarrow as pa
+            import pyarrow.parquet as pq
+            
+            pq.write_table(pa.Table.from_pylist(rows, schema=_result_schema()), tmp_path)
+        else:
+            with open(tmp_path, 'w', encoding='utf-8') as file:
+                for row in rows:
+                    file.write(json.dumps(row, default=str) + "\n")
+        os.replace(tmp_path, part_path)
+        
+        checkpoint.update(
+            offset=offset,
+            parts=checkpoint['parts'] + 1,
+            documents=checkpoint['documents'] + len(rows)
+        )
+        self._save_checkpoint(output_dir, checkpoint)
+    
+    @staticmethod
+    def _load_checkpoint(output_dir: str, input_path: str) -> Dict[str, Any]:
+        """Load the checkpoint of a previous run, or start a new one.
+        
+        Raises:
+            ValueError: If the checkpoint belongs to a different input file
+        """
+        checkpoint_path = os.path.join(output_dir, CHECKPOINT_FILE)
+        if not os.path.exists(checkpoint_path):
+            return {
+                'input_path': os.path.abspath(input_path),
+                'offset': 0,
+                'parts': 0,
+                'documents': 0,
+                'complete': False
+            }
+        
+        with open(checkpoint_path) as file:
+            checkpoint = json.load(file)
+        if checkpoint['input_path'] != os.path.abspath(input_path):
+            raise ValueError(f"Checkpoint in {output_dir} is for {checkpoint['input_path']}")
+        return checkpoint
+    
+    @staticmethod
+    def _save_checkpoint(output_dir: str, checkpoint: Dict[str, Any]) -> None:
+        """Write the checkpoint atomically."""
+        checkpoint_path = os.path.join(output_dir, CHECKPOINT_FILE)
+        with open(checkpoint_path + ".tmp", 'w') as file:
+            json.dump(checkpoint, file)
+        os.replace(checkpoint_path + ".tmp", checkpoint_path)
+    
+    @staticmethod
+    def _remove_uncommitted_parts(output_dir: str, parts: int) -> None:
+        """Delete part files written after the last checkpoint and leftover temporary files."""
+        for name in os.listdir(output_dir):
+            match = PART_PATTERN.match(name)
+            if name.endswith(".tmp") or (match and int(match.group(1)) >= parts):
+                os.remove(os.path.join(output_dir, name))
+
+
+def _result_schema() -> Any:
+    """Parquet schema of extraction results, matching the ``Entity`` fields."""
+    import pyarrow as pa
+    
+    entity = pa.struct([
+        ('text', pa.string()),
+        ('label', pa.string()),
+        ('start', pa.int64()),
+        ('end', pa.int64()),
+        ('confidence', pa.float64()),
+        ('description', pa.string()),
+        ('category', pa.string()),
+        ('source', pa.string())
+    ])
+    return pa.schema([('id', pa.string()), ('entities', pa.list_(entity))])
\ No newline at end of file
@@ -1,10 +1,11 @@
 """Entity extractor using spaCy and Google NLP API."""
 
-import spacy
-from typing import List, Dict, Any, Optional, Tuple
+from typing import List, Dict, Any, Optional, Tuple, Iterable, Iterator
 from dataclasses import dataclass
 from ..config import ConfigManager
-from ..api_clients import GoogleNLPClient, OpenAIClient
+from ..api_clients import OpenAIClient
+from ..utils import DocumentCache, load_spacy_model
+from .relationship_extractor import RelationshipExtractor
 
 
 @dataclass
@@ -21,28 +22,55 @@ class Entity:
     source: str = "spacy"  # spacy, google_nlp, or hybrid
 
 
+# Pipeline components that entity extraction never reads. Batched runs switch
+# them off so nlp.pipe only pays for tokenization and NER.
+NER_UNUSED_PIPES = ["parser", "tagger", "attribute_ruler", "lemmatizer", "senter"]
+
+
 class EntityExtractor:
     """Extracts entities from text using multiple methods."""
     
-    def __init__(self, config_manager: ConfigManager):
+    def __init__(
+        self,
+        config_manager: ConfigManager,
+        document_cache: Optional[DocumentCache] = None
+    ):
         """Initialize the entity extractor.
         
         Args:
             config_manager: Configuration manager instance
+            document_cache: Shared parse cache; its spaCy pipeline is used
+                instead of loading the configured model
         """
         self.config = config_manager
         self.confidence_threshold = config_manager.get("entity_extraction.confidence_threshold", 0.8)
+        self.batch_size = config_manager.get("entity_extraction.batch_size", 64)
+        self.n_process = config_manager.get("entity_extraction.n_process", 1)
         
         # Initialize spaCy
-        spacy_model = config_manager.get("entity_extraction.spacy_model", "en_core_web_lg")
-        try:
-            self.nlp = spacy.load(spacy_model)
-        except OSError:
-            print(f"Warning: {spacy_model} not found. Using en_core_web_sm.")
-            self.nlp = spacy.load("en_core_web_sm")
-        
-        # Initialize API clients
+        if document_cache is not None:
+            self.nlp = document_cache.nlp
+        else:
+            spacy_model = config_manager.get("entity_extraction.spacy_model", "en_core_web_lg")
+            try:
+                self.nlp = load_spacy_model(spacy_model)
+            except OSError:
+                print(f"Warning: {spacy_model} not found. Using en_core_web_sm.")
+                self.nlp = load_spacy_model("en_core_web_sm")
+            document_cache = DocumentCache(
+                self.nlp,
+                max_size=config_manager.get("entity_extraction.document_cache_size", 32)
+            )
+        
+        self.document_cache = document_cache
+        
+        self.relationship_extractor = RelationshipExtractor(self.nlp)
+        
+        # Initialize API clients; Google NLP is optional and its client
+        # module is not part of every installation
         try:
+            from ..api_clients.google_nlp_client import GoogleNLPClient
+            
             self.google_nlp_client = GoogleNLPClient(config_manager)
         except Exception as e:
             print(f"Warning: Google NLP client not available: {e}")
@@ -54,7 +82,8 @@ class EntityExtractor:
         self,
         text: str,
         methods: List[str] = None,
-        entity_types: List[str] = None
+        entity_types: List[str] = None,
+        doc: Any = None
     ) -> List[Entity]:
         """Extract entities from text using specified methods.
         
@@ -62,10 +91,35 @@ class EntityExtractor:
             text: Input text
             methods: List of extraction methods ['spacy', 'google_nlp', 'hybrid']
             entity_types: List of entity types to extract
-            
+            doc: Already-parsed spaCy Doc for ``text``; taken from the
+                document cache if omitted
+                
         Returns:
             List of extracted entities
         """
+        methods, entity_types = self._resolve_options(methods, entity_types)
+        
+        # Extract using spaCy
+        spacy_entities = []
+        if 'spacy' in methods:
+            spacy_entities = self._extract_with_spacy(text, entity_types, doc)
+        
+        return self._complete_extraction(text, spacy_entities, methods, entity_types)
+    
+    def _resolve_options(
+        self,
+        methods: Optional[List[str]],
+        entity_types: Optional[List[str]]
+    ) -> Tuple[List[str], List[str]]:
+        """Fill in default extraction methods and entity types.
+        
+        Args:
+            methods: Requested extraction methods, or None
+            entity_types: Requested entity types, or None
+            
+        Returns:
+            Tuple of (methods, entity_types)
+        """
         if methods is None:
             methods = ['spacy']
         
@@ -74,12 +128,27 @@ class EntityExtractor:
                 "PERSON", "ORG", "GPE", "PRODUCT", "TECHNOLOGY", "CONCEPT"
             ])
         
-        entities = []
+        return methods, entity_types
+    
+    def _complete_extraction(
+        self,
+        text: str,
+        spacy_entities: List[Entity],
+        methods: List[str],
+        entity_types: List[str]
+    ) -> List[Entity]:
+        """Run the non-spaCy methods and merge them with spaCy entities.
         
-        # Extract using spaCy
-        if 'spacy' in methods:
-            spacy_entities = self._extract_with_spacy(text, entity_types)
-            entities.extend(spacy_entities)
+        Args:
+            text: Input text
+            spacy_entities: Entities already extracted by spaCy
+            methods: Extraction methods to apply
+            entity_types: List of entity types to extract
+            
+        Returns:
+            Deduplicated entities above the confidence threshold
+        """
+        entities = list(spacy_entities)
         
         # Extract using Google NLP
         if 'google_nlp' in methods and self.google_nlp_client:
@@ -97,17 +166,38 @@ class EntityExtractor:
         
         return entities
     
-    def _extract_with_spacy(self, text: str, entity_types: List[str]) -> List[Entity]:
+    def _extract_with_spacy(
+        self,
+        text: str,
+        entity_types: List[str],
+        doc: Any = None
+    ) -> List[Entity]:
         """Extract entities using spaCy.
         
         Args:
             text: Input text
             entity_types: List of entity types to extract
+            doc: Already-parsed spaCy Doc for ``text``; taken from the
+                document cache if omitted
+                
+        Returns:
+            List of entities
+        """
+        if doc is None:
+            doc = self.document_cache.parse(text)
+        return self.entities_from_doc(doc, entity_types)
+    
+    @staticmethod
+    def entities_from_doc(doc: Any, entity_types: List[str]) -> List[Entity]:
+        """Convert the named entities of a parsed spaCy Doc.
+        
+        Args:
+            doc: Parsed spaCy Doc
+            entity_types: List of entity types to keep
             
         Returns:
             List of entities
         """
-        doc = self.nlp(text)
         entities = []
         
         for ent in doc.ents:
@@ -210,7 +300,8 @@ class EntityExtractor:
             print(f"Error in hybrid entity extraction: {e}")
             return []
     
-    def _deduplicate_entities(self, entities: List[Entity]) -> List[Entity]:
+    @staticmethod
+    def _deduplicate_entities(entities: List[Entity]) -> List[Entity]:
         """Remove duplicate entities based on text and position.
         
         Args:
@@ -233,39 +324,110 @@ class EntityExtractor:
     def extract_entities_from_documents(
         self,
         documents: List[Dict[str, Any]],
-        text_field: str = "content"
+        text_field: str = "content",
+        batch_size: Optional[int] = None,
+        n_process: Optional[int] = None
     ) -> Dict[str, List[Entity]]:
         """Extract entities from multiple documents.
         
         Args:
             documents: List of documents
             text_field: Field containing the text content
+            batch_size: Documents per spaCy batch (overrides config)
+            n_process: spaCy worker processes (overrides config)
             
         Returns:
             Dictionary mapping document ID to entities
         """
-        results = {}
+        return dict(self.iter_entities_from_documents(
+            documents,
+            text_field=text_field,
+            batch_size=batch_size,
+            n_process=n_process
+        ))
+    
+    def iter_entities_from_documents(
+        self,
+        documents: Iterable[Dict[str, Any]],
+        text_field: str = "content",
+        methods: List[str] = None,
+        entity_types: List[str] = None,
+        batch_size: Optional[int] = None,
+        n_process: Optional[int] = None
+    ) -> Iterator[Tuple[str, List[Entity]]]:
+        """Stream entities for many documents using batched spaCy parsing.
+        
+        Texts are fed through ``nlp.pipe`` with the components entity
+        extraction does not need disabled, and results are yielded per
+        document as soon as their batch is parsed. Documents without text
+        are skipped. Batched parsing bypasses the document cache: the
+        parsed Docs are neither looked up in nor added to it.
         
-        for doc in documents:
-            doc_id = doc.get('id', str(hash(doc.get(text_field, ''))))
-            text = doc.get(text_field, '')
+        Args:
+            documents: Iterable of documents
+            text_field: Field containing the text content
+            methods: List of extraction methods ['spacy', 'google_nlp', 'hybrid']
+            entity_types: List of entity types to extract
+            batch_size: Documents per spaCy batch (overrides config)
+            n_process: spaCy worker processes (overrides config)
             
-            if text:
-                entities = self.extract_entities(text)
-                results[doc_id] = entities
+        Yields:
+            Tuples of (document ID, entities)
+        """
+        methods, entity_types = self._resolve_options(methods, entity_types)
+        
+        records = (
+            (doc.get(text_field, ''), self._document_id(doc, text_field))
+            for doc in documents
+        )
+        records = ((text, doc_id) for text, doc_id in records if text)
+        
+        if 'spacy' not in methods:
+            for text, doc_id in records:
+                yield doc_id, self._complete_extraction(text, [], methods, entity_types)
+            return
+        
+        disabled = [name for name in NER_UNUSED_PIPES if name in self.nlp.pipe_names]
+        parsed = self.nlp.pipe(
+            records,
+            as_tuples=True,
+            batch_size=batch_size or self.batch_size,
+            n_process=n_process or self.n_process,
+            disable=disabled
+        )
+        
+        for doc, doc_id in parsed:
+            spacy_entities = self.entities_from_doc(doc, entity_types)
+            yield doc_id, self._complete_extraction(doc.text, spacy_entities, methods, entity_types)
+    
+    @staticmethod
+    def _document_id(document: Dict[str, Any], text_field: str) -> str:
+        """Get the ID of a document, falling back to a hash of its text.
         
-        return results
+        Args:
+            document: Document data
+            text_field: Field containing the text content
+            
+        Returns:
+            Document ID
+        """
+        return document.get('id', str(hash(document.get(text_field, ''))))
     
     def extract_entity_relationships(
         self,
         text: str,
-        entities: List[Entity]
+        entities: List[Entity],
+        doc: Any = None,
+        include_dependencies: bool = False
     ) -> List[Dict[str, Any]]:
         """Extract relationships between entities.
         
         Args:
             text: Input text
             entities: List of entities
+            doc: Already-parsed spaCy Doc for ``text``; taken from the
+                document cache if omitted
+            include_dependencies: Also emit dependency-path relations
             
         Returns:
             List of relationships
@@ -273,31 +435,12 @@ class EntityExtractor:
         if not self.nlp:
             return []
         
-        doc = self.nlp(text)
-        relationships = []
+        if doc is None:
+            doc = self.document_cache.parse(text)
         
-        # Find co-occurrences and dependencies
-        for i, entity1 in enumerate(entities):
-            for j, entity2 in enumerate(entities[i+1:], i+1):
-                # Check if entities are in the same sentence
-                sent1 = None
-                sent2 = None
-                
-                for sent in doc.sents:
-                    if entity1.start >= sent.start_char and entity1.end <= sent.end_char:
-                        sent1 = sent
-                    if entity2.start >= sent.start_char and entity2.end <= sent.end_char:
-                        sent2 = sent
-                
-                if sent1 and sent2 and sent1 == sent2:
-                    # Entities are in the same sentence
-                    relationship = {
-                        'entity1': entity1.text,
-                        'entity2': entity2.text,
-                        'sentence': sent1.text,
-                        'type': 'co_occurrence',
-                        'confidence': 0.7
-                    }
-                    relationships.append(relationship)
-        
-        return relationships
\ No newline at end of file
+        return self.relationship_extractor.extract(
+            text,
+            entities,
+            doc=doc,
+            include_dependencies=include_dependencies
+        )
\ No newline at end of file
@@ -0,0 +1,246 @@
+"""Multi-process entity extraction over sharded document corpora."""
+
+import gc
+import multiprocessing
+import os
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from typing import List, Dict, Any, Optional, Tuple, Iterable, Iterator
+from ..config import ConfigManager
+from ..utils import load_spacy_model, preload_spacy_model
+from .entity_extractor import Entity, EntityExtractor, NER_UNUSED_PIPES
+
+
+# Per-process worker state, set once by _init_worker when a worker starts so
+# the spaCy model is loaded per worker rather than per task.
+_worker_nlp = None
+_worker_options: Dict[str, Any] = {}
+
+
+def _load_model(spacy_model: str, preload: bool = False) -> Any:
+    """Get the extraction model from the registry, falling back to en_core_web_sm.
+    
+    Args:
+        spacy_model: spaCy model to load
+        preload: Load for sharing with forked workers (see
+            ``preload_spacy_model``)
+            
+    Returns:
+        Loaded spaCy pipeline
+    """
+    load = preload_spacy_model if preload else load_spacy_model
+    try:
+        return load(spacy_model)
+    except OSError:
+        print(f"Warning: {spacy_model} not found. Using en_core_web_sm.")
+        return load("en_core_web_sm")
+
+
+def _init_worker(
+    spacy_model: str,
+    entity_types: List[str],
+    confidence_threshold: float,
+    batch_size: int
+) -> None:
+    """Load the spaCy model and extraction options in a worker process.
+    
+    Args:
+        spacy_model: spaCy model to load
+        entity_types: List of entity types to extract
+        confidence_threshold: Minimum entity confidence
+        batch_size: Documents per spaCy batch inside the worker
+    """
+    global _worker_nlp
+    
+    # A model preloaded by a forking parent is inherited through the registry
+    _worker_nlp = _load_model(spacy_model)
+    
+    _worker_options.update(
+        entity_types=entity_types,
+        confidence_threshold=confidence_threshold,
+        batch_size=batch_size,
+        disable=[name for name in NER_UNUSED_PIPES if name in _worker_nlp.pipe_names]
+    )
+
+
+def _extract_chunk(chunk: List[Tuple[str, str]]) -> List[Tuple[str, List[Entity]]]:
+    """Extract entities from one shard of documents in a worker process.
+    
+    Args:
+        chunk: List of (document ID, text) pairs
+        
+    Returns:
+        List of (document ID, entities) pairs in the order of the chunk
+    """
+    docs = _worker_nlp.pipe(
+        (text for _, text in chunk),
+        batch_size=_worker_options['batch_size'],
+        disable=_worker_options['disable']
+    )
+    threshold = _worker_options['confidence_threshold']
+    results = []
+    
+    for (doc_id, _), doc in zip(chunk, docs):
+        entities = EntityExtractor.entities_from_doc(doc, _worker_options['entity_types'])
+        entities = EntityExtractor._deduplicate_entities(entities)
+        results.append((doc_id, [e for e in entities if e.confidence >= threshold]))
+    
+    return results
+
+
+class ParallelEntityExtractor:
+    """Extracts spaCy entities from a document corpus with a pool of processes."""
+    
+    def __init__(
+        self,
+        config_manager: ConfigManager,
+        n_workers: Optional[int] = None,
+        chunk_size: Optional[int] = None,
+        max_in_flight_chunks: Optional[int] = None,
+        max_in_flight_chars: Optional[int] = None
+    ):
+        """Initialize the parallel entity extractor.
+        
+        Args:
+            config_manager: Configuration manager instance
+            n_workers: Number of worker processes (overrides config)
+            chunk_size: Documents per shard sent to a worker (overrides config)
+            max_in_flight_chunks: Maximum shards submitted but not yet merged
+            max_in_flight_chars: Maximum characters of text submitted but not
+                yet merged, bounding parent-side memory
+        """
+        self.config = config_manager
+        self.spacy_model = config_manager.get("entity_extraction.spacy_model", "en_core_web_lg")
+        self.confidence_threshold = config_manager.get("entity_extraction.confidence_threshold", 0.8)
+        self.batch_size = config_manager.get("entity_extraction.batch_size", 64)
+        self.preload_model = config_manager.get("entity_extraction.preload_model", True)
+        
+        self.n_workers = (
+            n_workers
+            or config_manager.get("entity_extraction.n_workers")
+            or os.cpu_count()
+            or 1
+        )
+        self.chunk_size = chunk_size or config_manager.get("entity_extraction.chunk_size", 256)
+        self.max_in_flight_chunks = (
+            max_in_flight_chunks
+            or config_manager.get("entity_extraction.max_in_flight_chunks")
+            or 2 * self.n_workers
+        )
+        self.max_in_flight_chars = (
+            max_in_flight_chars
+            or config_manager.get("entity_extraction.max_in_flight_chars", 200_000_000)
+        )
+    
+    def extract_entities_from_documents(
+        self,
+        documents: Iterable[Dict[str, Any]],
+        text_field: str = "content",
+        entity_types: List[str] = None
+    ) -> Dict[str, List[Entity]]:
+        """Extract entities from multiple documents across worker processes.
+        
+        Args:
+            documents: Iterable of documents
+            text_field: Field containing the text content
+            entity_types: List of entity types to extract
+            
+        Returns:
+            Dictionary mapping document ID to entities, in input order
+        """
+        return dict(self.iter_entities_from_documents(documents, text_field, entity_types))
+    
+    def iter_entities_from_documents(
+        self,
+        documents: Iterable[Dict[str, Any]],
+        text_field: str = "content",
+        entity_types: List[str] = None
+    ) -> Iterator[Tuple[str, List[Entity]]]:
+        """Stream entities for a corpus, sharded across worker processes.
+        
+        Shards are merged strictly in submission order, so the output order
+        matches the input order regardless of which worker finishes first.
+        Submission pauses whenever the in-flight shard or character limits
+        would be exceeded.
+        
+        Args:
+            documents: Iterable of documents
+            text_field: Field containing the text content
+            entity_types: List of entity types to extract
+            
+        Yields:
+            Tuples of (document ID, entities)
+        """
+        if entity_types is None:
+            entity_types = self.config.get("entity_extraction.entity_types", [
+                "PERSON", "ORG", "GPE", "PRODUCT", "TECHNOLOGY", "CONCEPT"
+            ])
+        
+        share_model = self.preload_model and multiprocessing.get_start_method() == "fork"
+        if share_model:
+            # Forked workers share the parent's copy of the model. Freezing
+            # the collector keeps worker collections from writing to (and so
+            # copying) its pages; the parent unfreezes once the pool is done.
+            _load_model(self.spacy_model, preload=True)
+            gc.freeze()
+        
+        try:
+            with ProcessPoolExecutor(
+                max_workers=self.n_workers,
+                initializer=_init_worker,
+                initargs=(self.spacy_model, entity_types, self.confidence_threshold, self.batch_size)
+            ) as pool:
+                pending = deque()
+                in_flight_chars = 0
+                
+                for chunk, n_chars in self._shard(documents, text_field):
+                    while pending and (
+                        len(pending) >= self.max_in_flight_chunks
+                        or in_flight_chars + n_chars > self.max_in_flight_chars
+                    ):
+                        future, size = pending.popleft()
+                        in_flight_chars -= size
+                        yield from future.result()
+                    
+                    pending.append((pool.submit(_extract_chunk, chunk), n_chars))
+                    in_flight_chars += n_chars
+                
+                while pending:
+                    future, _ = pending.popleft()
+                    yield from future.result()
+        finally:
+            if share_model:
+                gc.unfreeze()
+    
+    def _shard(
+        self,
+        documents: Iterable[Dict[str, Any]],
+        text_field: str
+    ) -> Iterator[Tuple[List[Tuple[str, str]], int]]:
+        """Group documents with text into shards of at most chunk_size.
+        
+        Args:
+            documents: Iterable of documents
+            text_field: Field containing the text content
+            
+        Yields:
+            Tuples of (shard of (document ID, text) pairs, total characters)
+        """
+        chunk = []
+        n_chars = 0
+        
+        for document in documents:
+            text = document.get(text_field, '')
+            if not text:
+                continue
+            
+            chunk.append((EntityExtractor._document_id(document, text_field), text))
+            n_chars += len(text)
+            
+            if len(chunk) >= self.chunk_size:
+                yield chunk, n_chars
+                chunk = []
+                n_chars = 0
+        
+        if chunk:
+            yield chunk, n_chars
\ No newline at end of file
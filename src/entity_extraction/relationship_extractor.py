@@ -0,0 +1,175 @@
+"""Sentence-indexed relationship extraction between entities."""
+
+from bisect import bisect_right
+from typing import List, Dict, Any, Optional, Tuple, TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from .entity_extractor import Entity
+
+
+class RelationshipExtractor:
+    """Extracts co-occurrence and dependency relationships between entities.
+    
+    Entities are bucketed into sentences once with a binary search over the
+    sorted sentence offsets, so the cost is linear in the number of entities
+    plus the number of pairs that actually share a sentence.
+    """
+    
+    def __init__(self, nlp: Any = None, max_dependency_hops: int = 4):
+        """Initialize the relationship extractor.
+        
+        Args:
+            nlp: spaCy pipeline used when no parsed Doc is supplied
+            max_dependency_hops: Longest dependency path reported as a relation
+        """
+        self.nlp = nlp
+        self.max_dependency_hops = max_dependency_hops
+    
+    def extract(
+        self,
+        text: str,
+        entities: List["Entity"],
+        doc: Any = None,
+        include_dependencies: bool = False
+    ) -> List[Dict[str, Any]]:
+        """Extract relationships between entities.
+        
+        Args:
+            text: Input text
+            entities: List of entities
+            doc: Already-parsed spaCy Doc for ``text``; parsed if omitted
+            include_dependencies: Also emit dependency-path relations
+            
+        Returns:
+            List of relationships, ordered by entity pair
+        """
+        if doc is None or not doc.has_annotation("SENT_START"):
+            if self.nlp is None:
+                return []
+            doc = self.nlp(text)
+        
+        sentences = list(doc.sents)
+        buckets = self._bucket_by_sentence(sentences, entities)
+        anchors = {}
+        relationships = []
+        
+        for sent_index, members in buckets.items():
+            sentence = sentences[sent_index]
+            
+            for a, i in enumerate(members):
+                for j in members[a + 1:]:
+                    relationships.append(((i, j, 0), {
+                        'entity1': entities[i].text,
+                        'entity2': entities[j].text,
+                        'sentence': sentence.text,
+                        'type': 'co_occurrence',
+                        'confidence': 0.7
+                    }))
+                    
+                    if include_dependencies:
+                        dependency = self._dependency_path(doc, entities, i, j, anchors)
+                        if dependency:
+                            relation, path = dependency
+                            relationships.append(((i, j, 1), {
+                                'entity1': entities[i].text,
+                                'entity2': entities[j].text,
+                                'sentence': sentence.text,
+                                'type': 'dependency',
+                                'relation': relation,
+                                'path': path,
+                                'confidence': 0.8
+                            }))
+        
+        relationships.sort(key=lambda item: item[0])
+        return [relationship for _, relationship in relationships]
+    
+    @staticmethod
+    def _bucket_by_sentence(
+        sentences: List[Any],
+        entities: List["Entity"]
+    ) -> Dict[int, List[int]]:
+        """Group entity indices by the sentence that fully contains them.
+        
+        Args:
+            sentences: Sentence spans in document order
+            entities: List of entities
+            
+        Returns:
+            Dictionary mapping sentence index to entity indices, in entity order
+        """
+        starts = [sent.start_char for sent in sentences]
+        buckets = {}
+        
+        for index, entity in enumerate(entities):
+            sent_index = bisect_right(starts, entity.start) - 1
+            if sent_index >= 0 and entity.end <= sentences[sent_index].end_char:
+                buckets.setdefault(sent_index, []).append(index)
+        
+        return buckets
+    
+    def _dependency_path(
+        self,
+        doc: Any,
+        entities: List["Entity"],
+        i: int,
+        j: int,
+        anchors: Dict[int, Optional[List[Any]]]
+    ) -> Optional[Tuple[str, List[str]]]:
+        """Find a short verbal dependency path between two entities.
+        
+        Args:
+            doc: Parsed spaCy Doc
+            entities: List of entities
+            i: Index of the first entity
+            j: Index of the second entity
+            anchors: Cache of each entity's root-to-head token chain
+            
+        Returns:
+            Tuple of (verb lemma, path token texts), or None if the entities
+            are not linked through a verb within ``max_dependency_hops``
+        """
+        chain1 = self._head_chain(doc, entities, i, anchors)
+        chain2 = self._head_chain(doc, entities, j, anchors)
+        if not chain1 or not chain2:
+            return None
+        
+        positions = {token.i: depth for depth, token in enumerate(chain1)}
+        for depth2, token in enumerate(chain2):
+            if token.i in positions:
+                path = chain1[:positions[token.i] + 1] + chain2[:depth2][::-1]
+                break
+        else:
+            return None
+        
+        if len(path) - 1 > self.max_dependency_hops:
+            return None
+        
+        verbs = [token for token in path[1:-1] if token.pos_ in ('VERB', 'AUX')]
+        if not verbs:
+            return None
+        
+        return verbs[0].lemma_ or verbs[0].text, [token.text for token in path]
+    
+    @staticmethod
+    def _head_chain(
+        doc: Any,
+        entities: List["Entity"],
+        index: int,
+        anchors: Dict[int, Optional[List[Any]]]
+    ) -> Optional[List[Any]]:
+        """Get the chain from an entity's root token up to the sentence root.
+        
+        Args:
+            doc: Parsed spaCy Doc
+            entities: List of entities
+            index: Entity index
+            anchors: Cache of already computed chains
+            
+        Returns:
+            List of tokens, or None if the entity does not align with tokens
+        """
+        if index not in anchors:
+            entity = entities[index]
+            span = doc.char_span(entity.start, entity.end, alignment_mode="expand")
+            anchors[index] = None if span is None else [span.root] + list(span.root.ancestors)
+        return anchors[index]
\ No newline at end of file
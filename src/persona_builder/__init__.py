@@ -1,7 +1,16 @@
 """Persona building module for creating user personas from customer data."""
 
-from .persona_builder import PersonaBuilder
-from .persona_analyzer import PersonaAnalyzer
-from .persona_validator import PersonaValidator
+from typing import TYPE_CHECKING
+from .._lazy import lazy_exports
 
-__all__ = ["PersonaBuilder", "PersonaAnalyzer", "PersonaValidator"]
\ No newline at end of file
+if TYPE_CHECKING:
+    from .persona_builder import PersonaBuilder, Persona
+    from .theme_matcher import ThemeMatcher
+    from .theme_discovery import ThemeDiscovery
+
+__getattr__, __dir__, __all__ = lazy_exports(__name__, {
+    "PersonaBuilder": ".persona_builder",
+    "Persona": ".persona_builder",
+    "ThemeMatcher": ".theme_matcher",
+    "ThemeDiscovery": ".theme_discovery"
+})
\ No newline at end of file
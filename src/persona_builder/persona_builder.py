@@ -1,10 +1,16 @@
 """Persona builder for creating user personas from customer data."""
 
-import pandas as pd
-from typing import List, Dict, Any, Optional
-from dataclasses import dataclass
+import json
+from concurrent.futures import ThreadPoolExecutor
+from typing import List, Dict, Any, Optional, Iterable, Iterator, Callable, Tuple, TYPE_CHECKING
+from dataclasses import dataclass, asdict
 from ..config import ConfigManager
-from ..api_clients import OpenAIClient
+from ..api_clients import OpenAIClient, ResponseCache
+from .theme_matcher import ThemeMatcher, DEFAULT_THEME_KEYWORDS
+from .theme_discovery import ThemeDiscovery
+
+if TYPE_CHECKING:
+    import pandas as pd
 
 
 @dataclass
@@ -27,6 +33,55 @@ class Persona:
     llm_prompts: List[str]
 
 
+# Columns read by pattern analysis. Streaming ingestion loads only these
+# (plus any configured grouping dimensions), as categoricals, so memory is
+# bounded by the chunk size.
+DEFAULT_GROUPING_DIMENSIONS = ['company_size', 'industry']
+SALES_PATTERN_COLUMNS = ['pain_points']
+PARQUET_EXTENSIONS = ('.parquet', '.pq')
+DEFAULT_CHUNK_SIZE = 65536
+
+# Name of the placeholder persona returned when generating a persona fails.
+# Placeholders are never cached.
+FALLBACK_PERSONA_NAME = "Default Persona"
+
+# Persona prompts. They are part of the persona cache keys, so editing one
+# invalidates the personas generated with it.
+PATTERN_PERSONA_PROMPT = """
+        Based on the following customer data pattern, create a detailed user persona:
+        
+        Pattern: {pattern}
+        
+        Create a persona with the following structure:
+        - Name: A realistic name
+        - Role: Their job title/role
+        - Company Size: {company_size}
+        - Industry: {industry}
+        - Pain Points: 3-5 specific pain points
+        - Goals: 3-5 specific goals
+        - Use Cases: 3-5 specific use cases
+        - Decision Context: How they make decisions
+        - Technical Level: Beginner/Intermediate/Advanced
+        - Budget Range: Low/Medium/High
+        - Timeline: Urgency level
+        - Preferred Content Formats: List of formats they prefer
+        - Search Behavior: How they search for information
+        - LLM Prompts: 3-5 example prompts they might use with LLMs
+        
+        Return the response as a structured JSON object.
+        """
+
+THEME_PERSONA_PROMPT = """
+        Based on community discussions about {theme}, create a user persona:
+        
+        Theme: {theme}
+        Sample discussions: {discussions}  # First 3 discussions
+        
+        Create a persona that represents users who discuss {theme} issues.
+        Include their pain points, goals, and how they would interact with LLMs.
+        """
+
+
 class PersonaBuilder:
     """Builds user personas from customer data and feedback."""
     
@@ -38,52 +93,108 @@ class PersonaBuilder:
         """
         self.config = config_manager
         self.openai_client = OpenAIClient(config_manager)
+        self.chunk_size = config_manager.get("persona_building.chunk_size", None)
+        self.grouping_dimensions = config_manager.get(
+            "persona_building.grouping_dimensions", DEFAULT_GROUPING_DIMENSIONS
+        )
+        self.min_pattern_frequency = config_manager.get("persona_building.min_pattern_frequency", 5)
+        self.max_pain_points = config_manager.get("persona_building.max_pain_points", 10)
+        self.max_workers = config_manager.get("persona_building.max_workers", 32)
+        
+        self.theme_matcher = ThemeMatcher(
+            config_manager.get("persona_building.theme_keywords", DEFAULT_THEME_KEYWORDS)
+        )
+        self.theme_discovery = ThemeDiscovery(config_manager, self.openai_client)
+        
+        # Generated personas, keyed by pattern or theme contents, reused across runs
+        self.persona_cache = ResponseCache.from_config(config_manager, "persona_building.cache")
     
     def build_from_data(
         self,
         customer_data_path: str,
         sales_feedback_path: Optional[str] = None,
-        community_data_path: Optional[str] = None
+        community_data_path: Optional[str] = None,
+        chunksize: Optional[int] = None
     ) -> List[Persona]:
         """Build personas from customer data files.
         
+        With a chunk size (or ``persona_building.chunk_size``), or when an
+        input is Parquet, the files are streamed: only the columns pattern
+        analysis needs are read, chunk by chunk, and group counts are
+        accumulated incrementally.
+        
         Args:
-            customer_data_path: Path to customer data CSV
-            sales_feedback_path: Path to sales feedback CSV
+            customer_data_path: Path to customer data CSV or Parquet file
+            sales_feedback_path: Path to sales feedback CSV or Parquet file
             community_data_path: Path to community discussion data
+            chunksize: Rows per chunk for streaming ingestion
             
         Returns:
             List of constructed personas
         """
-        # Load customer data
-        customer_df = pd.read_csv(customer_data_path)
-        
-        # Load additional data if available
-        sales_df = None
-        community_df = None
+        chunksize = chunksize or self.chunk_size
+        paths = [customer_data_path, sales_feedback_path]
         
-        if sales_feedback_path:
-            sales_df = pd.read_csv(sales_feedback_path)
+        if chunksize or any(self._is_parquet(path) for path in paths if path):
+            # Pattern analysis does not read community data, so streaming skips it
+            persona_patterns = self._pattern_records(self._stream_persona_patterns(
+                customer_data_path, sales_feedback_path, chunksize
+            ))
+        else:
+            import pandas as pd
+            
+            # Load customer data
+            customer_df = pd.read_csv(customer_data_path)
+            
+            # Load additional data if available
+            sales_df = None
+            community_df = None
+            
+            if sales_feedback_path:
+                sales_df = pd.read_csv(sales_feedback_path)
+            
+            if community_data_path:
+                community_df = pd.read_csv(community_data_path)
+            
+            # Analyze data to identify persona patterns
+            persona_patterns = self._analyze_persona_patterns(customer_df, sales_df, community_df)
         
-        if community_data_path:
-            community_df = pd.read_csv(community_data_path)
+        # Generate personas using LLM
+        return self._generate_personas(
+            persona_patterns, self._generate_persona_from_pattern, self._pattern_cache_key
+        )
+    
+    def mine_persona_patterns(
+        self,
+        customer_df: "pd.DataFrame",
+        sales_df: Optional["pd.DataFrame"] = None
+    ) -> "pd.DataFrame":
+        """Find frequent customer segments and top sales pain points.
         
-        # Analyze data to identify persona patterns
-        persona_patterns = self._analyze_persona_patterns(customer_df, sales_df, community_df)
+        Args:
+            customer_df: Customer data
+            sales_df: Sales feedback data
+            
+        Returns:
+            Pattern table with one column per grouping dimension, plus
+            pain_point, frequency and source, ranked by frequency within
+            each source
+        """
+        group_counts = None
+        if all(column in customer_df.columns for column in self.grouping_dimensions):
+            group_counts = customer_df.groupby(self.grouping_dimensions, observed=True).size()
         
-        # Generate personas using LLM
-        personas = []
-        for pattern in persona_patterns:
-            persona = self._generate_persona_from_pattern(pattern)
-            personas.append(persona)
+        pain_point_counts = None
+        if sales_df is not None and 'pain_points' in sales_df.columns:
+            pain_point_counts = sales_df['pain_points'].value_counts()
         
-        return personas
+        return self._pattern_table(group_counts, pain_point_counts)
     
     def _analyze_persona_patterns(
         self,
-        customer_df: pd.DataFrame,
-        sales_df: Optional[pd.DataFrame],
-        community_df: Optional[pd.DataFrame]
+        customer_df: "pd.DataFrame",
+        sales_df: Optional["pd.DataFrame"],
+        community_df: Optional["pd.DataFrame"]
     ) -> List[Dict[str, Any]]:
         """Analyze data to identify persona patterns.
         
@@ -95,32 +206,188 @@ class PersonaBuilder:
         Returns:
             List of persona patterns
         """
-        patterns = []
+        return self._pattern_records(self.mine_persona_patterns(customer_df, sales_df))
+    
+    def _stream_persona_patterns(
+        self,
+        customer_data_path: str,
+        sales_feedback_path: Optional[str],
+        chunksize: Optional[int]
+    ) -> "pd.DataFrame":
+        """Identify persona patterns by streaming the data files in chunks.
         
-        # Analyze customer data
-        if 'company_size' in customer_df.columns and 'industry' in customer_df.columns:
-            size_industry_groups = customer_df.groupby(['company_size', 'industry']).size().reset_index(name='count')
+        Produces the same table as ``mine_persona_patterns`` while holding
+        one chunk and the running counts in memory.
+        
+        Args:
+            customer_data_path: Path to customer data CSV or Parquet file
+            sales_feedback_path: Path to sales feedback CSV or Parquet file
+            chunksize: Rows per chunk
+            
+        Returns:
+            Pattern table
+        """
+        group_parts = []
+        for chunk in self._iter_column_chunks(customer_data_path, self.grouping_dimensions, chunksize):
+            if all(column in chunk.columns for column in self.grouping_dimensions):
+                group_parts.append(chunk.groupby(self.grouping_dimensions, observed=True).size())
+                group_parts = self._collapse_counts(group_parts)
+        
+        pain_point_parts = []
+        if sales_feedback_path:
+            for chunk in self._iter_column_chunks(sales_feedback_path, SALES_PATTERN_COLUMNS, chunksize):
+                if 'pain_points' in chunk.columns:
+                    pain_point_parts.append(chunk['pain_points'].value_counts())
+                    pain_point_parts = self._collapse_counts(pain_point_parts)
+        
+        return self._pattern_table(
+            self._collapse_counts(group_parts, force=True)[0] if group_parts else None,
+            self._collapse_counts(pain_point_parts, force=True)[0] if pain_point_parts else None
+        )
+    
+    @staticmethod
+    def _collapse_counts(parts: List["pd.Series"], force: bool = False, max_parts: int = 32) -> List["pd.Series"]:
+        """Sum per-chunk count series into one once enough have piled up.
+        
+        Args:
+            parts: Count series indexed by group key
+            force: Collapse regardless of the number of parts
+            max_parts: Number of parts that triggers a collapse
             
-            for _, row in size_industry_groups.iterrows():
-                if row['count'] >= 5:  # Minimum threshold for pattern
-                    patterns.append({
-                        'company_size': row['company_size'],
-                        'industry': row['industry'],
-                        'frequency': row['count'],
-                        'source': 'customer_data'
-                    })
+        Returns:
+            List holding the collapsed series, or the parts unchanged
+        """
+        if len(parts) < 2 or (not force and len(parts) < max_parts):
+            return parts
+        
+        import pandas as pd
+        
+        combined = pd.concat(parts)
+        return [combined.groupby(level=list(range(combined.index.nlevels)), observed=True).sum()]
+    
+    def _pattern_table(
+        self,
+        group_counts: Optional["pd.Series"],
+        pain_point_counts: Optional["pd.Series"]
+    ) -> "pd.DataFrame":
+        """Filter and rank aggregated counts into a pattern table.
+        
+        Ties in frequency are ordered by key, so in-memory and streamed
+        inputs give identical tables.
+        
+        Args:
+            group_counts: Customer count per combination of grouping dimensions
+            pain_point_counts: Sales feedback count per pain point
+            
+        Returns:
+            Pattern table
+        """
+        import pandas as pd
+        
+        columns = [*self.grouping_dimensions, 'pain_point', 'frequency', 'source']
+        tables = []
+        
+        # Analyze customer data
+        if group_counts is not None:
+            frequent = group_counts[group_counts >= self.min_pattern_frequency]
+            customer_table = (
+                frequent.sort_index()
+                .sort_values(ascending=False, kind='stable')
+                .rename('frequency')
+                .reset_index()
+            )
+            customer_table['source'] = 'customer_data'
+            tables.append(customer_table)
         
         # Analyze sales feedback for pain points and goals
-        if sales_df is not None and 'pain_points' in sales_df.columns:
-            pain_point_patterns = sales_df['pain_points'].value_counts().head(10)
-            for pain_point, count in pain_point_patterns.items():
-                patterns.append({
-                    'pain_point': pain_point,
-                    'frequency': count,
-                    'source': 'sales_feedback'
-                })
-        
-        return patterns
+        if pain_point_counts is not None:
+            sales_table = (
+                pain_point_counts[pain_point_counts > 0]
+                .sort_index()
+                .sort_values(ascending=False, kind='stable')
+                .head(self.max_pain_points)
+                .rename_axis('pain_point')
+                .rename('frequency')
+                .reset_index()
+            )
+            sales_table['source'] = 'sales_feedback'
+            tables.append(sales_table)
+        
+        tables = [table for table in tables if len(table)]
+        if not tables:
+            return pd.DataFrame(columns=columns)
+        if len(tables) > 1:
+            # Sales rows have no dimension values; as objects, integer
+            # dimensions are not upcast to floats to hold the missing values
+            tables = [
+                table.astype({dimension: object for dimension in self.grouping_dimensions if dimension in table})
+                for table in tables
+            ]
+        return pd.concat(tables, ignore_index=True).reindex(columns=columns)
+    
+    @staticmethod
+    def _pattern_records(table: "pd.DataFrame") -> List[Dict[str, Any]]:
+        """Convert a pattern table into pattern dictionaries.
+        
+        Args:
+            table: Pattern table
+            
+        Returns:
+            List of persona patterns without the columns that do not apply
+        """
+        import pandas as pd
+        
+        return [
+            {key: value for key, value in record.items() if not pd.isna(value)}
+            for record in table.to_dict('records')
+        ]
+    
+    @staticmethod
+    def _is_parquet(path: str) -> bool:
+        """Check whether a data file is Parquet by its extension."""
+        return path.lower().endswith(PARQUET_EXTENSIONS)
+    
+    def _iter_column_chunks(
+        self,
+        path: str,
+        columns: List[str],
+        chunksize: Optional[int]
+    ) -> Iterator["pd.DataFrame"]:
+        """Read selected columns of a CSV or Parquet file in chunks.
+        
+        Columns missing from the file are skipped; the rest are returned
+        as categoricals over their inferred types, so numeric dimensions
+        keep numeric values as in a full ``pd.read_csv``.
+        
+        Args:
+            path: Path to a CSV or Parquet file
+            columns: Columns to read
+            chunksize: Rows per chunk
+            
+        Yields:
+            DataFrame chunks
+        """
+        chunksize = chunksize or DEFAULT_CHUNK_SIZE
+        
+        if self._is_parquet(path):
+            import pyarrow.parquet as pq
+            
+            parquet_file = pq.ParquetFile(path)
+            present = [column for column in columns if column in parquet_file.schema_arrow.names]
+            for batch in parquet_file.iter_batches(
+                batch_size=chunksize,
+                columns=present
+            ):
+                yield batch.to_pandas().astype({column: 'category' for column in present})
+        else:
+            import pandas as pd
+            
+            for chunk in pd.read_csv(
+                path,
+                usecols=lambda column: column in columns,
+                chunksize=chunksize
+            ):
+                yield chunk.astype({column: 'category' for column in chunk.columns})
     
     def _generate_persona_from_pattern(self, pattern: Dict[str, Any]) -> Persona:
         """Generate a persona from a pattern using LLM.
@@ -130,88 +397,183 @@ class PersonaBuilder:
             
         Returns:
             Generated persona
+            
+        Raises:
+            ValueError: If the response is not a JSON object
         """
-        prompt = f"""
-        Based on the following customer data pattern, create a detailed user persona:
+        prompt = PATTERN_PERSONA_PROMPT.format(
+            pattern=pattern,
+            company_size=pattern.get('company_size', 'Unknown'),
+            industry=pattern.get('industry', 'Unknown')
+        )
         
-        Pattern: {pattern}
+        response = self.openai_client.generate_text(prompt)
         
-        Create a persona with the following structure:
-        - Name: A realistic name
-        - Role: Their job title/role
-        - Company Size: {pattern.get('company_size', 'Unknown')}
-        - Industry: {pattern.get('industry', 'Unknown')}
-        - Pain Points: 3-5 specific pain points
-        - Goals: 3-5 specific goals
-        - Use Cases: 3-5 specific use cases
-        - Decision Context: How they make decisions
-        - Technical Level: Beginner/Intermediate/Advanced
-        - Budget Range: Low/Medium/High
-        - Timeline: Urgency level
-        - Preferred Content Formats: List of formats they prefer
-        - Search Behavior: How they search for information
-        - LLM Prompts: 3-5 example prompts they might use with LLMs
+        # Parse response and create Persona object
+        persona_data = json.loads(response)
+        if not isinstance(persona_data, dict):
+            raise ValueError(f"Expected a JSON object, got {type(persona_data).__name__}")
         
-        Return the response as a structured JSON object.
-        """
+        return Persona(
+            name=persona_data.get('name', 'Unknown'),
+            role=persona_data.get('role', 'Unknown'),
+            company_size=persona_data.get('company_size', 'Unknown'),
+            industry=persona_data.get('industry', 'Unknown'),
+            pain_points=persona_data.get('pain_points', []),
+            goals=persona_data.get('goals', []),
+            use_cases=persona_data.get('use_cases', []),
+            decision_context=persona_data.get('decision_context', ''),
+            technical_level=persona_data.get('technical_level', 'Intermediate'),
+            budget_range=persona_data.get('budget_range', 'Medium'),
+            timeline=persona_data.get('timeline', 'Medium'),
+            preferred_content_formats=persona_data.get('preferred_content_formats', []),
+            search_behavior=persona_data.get('search_behavior', {}),
+            llm_prompts=persona_data.get('llm_prompts', [])
+        )
+    
+    @staticmethod
+    def _fallback_persona(item: Dict[str, Any]) -> Persona:
+        """Build the placeholder persona for a pattern or theme.
         
-        response = self.openai_client.generate_text(prompt)
+        Args:
+            item: Pattern or theme whose persona could not be generated
+            
+        Returns:
+            Placeholder persona named ``FALLBACK_PERSONA_NAME``
+        """
+        return Persona(
+            name=FALLBACK_PERSONA_NAME,
+            role="Unknown",
+            company_size=item.get('company_size', 'Unknown'),
+            industry=item.get('industry', 'Unknown'),
+            pain_points=[],
+            goals=[],
+            use_cases=[],
+            decision_context="",
+            technical_level="Intermediate",
+            budget_range="Medium",
+            timeline="Medium",
+            preferred_content_formats=[],
+            search_behavior={},
+            llm_prompts=[]
+        )
+    
+    @classmethod
+    def _generate_or_fallback(
+        cls,
+        generate: Callable[[Dict[str, Any]], Persona],
+        item: Dict[str, Any]
+    ) -> Tuple[Persona, bool]:
+        """Generate one persona, substituting the placeholder if generation fails.
         
-        # Parse response and create Persona object
-        try:
-            import json
-            persona_data = json.loads(response)
+        Args:
+            generate: Function generating a persona from one item
+            item: Pattern or theme
             
-            return Persona(
-                name=persona_data.get('name', 'Unknown'),
-                role=persona_data.get('role', 'Unknown'),
-                company_size=persona_data.get('company_size', 'Unknown'),
-                industry=persona_data.get('industry', 'Unknown'),
-                pain_points=persona_data.get('pain_points', []),
-                goals=persona_data.get('goals', []),
-                use_cases=persona_data.get('use_cases', []),
-                decision_context=persona_data.get('decision_context', ''),
-                technical_level=persona_data.get('technical_level', 'Intermediate'),
-                budget_range=persona_data.get('budget_range', 'Medium'),
-                timeline=persona_data.get('timeline', 'Medium'),
-                preferred_content_formats=persona_data.get('preferred_content_formats', []),
-                search_behavior=persona_data.get('search_behavior', {}),
-                llm_prompts=persona_data.get('llm_prompts', [])
-            )
+        Returns:
+            Tuple of the persona and whether it is the placeholder
+        """
+        try:
+            return generate(item), False
         except Exception as e:
-            print(f"Error parsing persona data: {e}")
-            # Return a default persona
-            return Persona(
-                name="Default Persona",
-                role="Unknown",
-                company_size=pattern.get('company_size', 'Unknown'),
-                industry=pattern.get('industry', 'Unknown'),
-                pain_points=[],
-                goals=[],
-                use_cases=[],
-                decision_context="",
-                technical_level="Intermediate",
-                budget_range="Medium",
-                timeline="Medium",
-                preferred_content_formats=[],
-                search_behavior={},
-                llm_prompts=[]
-            )
+            print(f"Error generating persona: {e}")
+            return cls._fallback_persona(item), True
+    
+    def _generate_personas(
+        self,
+        items: List[Dict[str, Any]],
+        generate: Callable[[Dict[str, Any]], Persona],
+        cache_key: Callable[[Dict[str, Any]], str]
+    ) -> List[Persona]:
+        """Generate one persona per pattern or theme concurrently.
+        
+        Cached personas are reused; the rest are generated on a pool of
+        up to ``max_workers`` threads, so a build takes roughly as long as
+        its slowest LLM call. An item whose generation raises (an API
+        error or an unparseable response) gets the uncached placeholder
+        persona instead of failing the whole build.
+        
+        Args:
+            items: Patterns or themes
+            generate: Function generating a persona from one item,
+                raising on failure
+            cache_key: Function building the cache key of one item
+            
+        Returns:
+            Personas in the same order as the items
+        """
+        personas: List[Optional[Persona]] = [None] * len(items)
+        keys: List[Optional[str]] = [None] * len(items)
+        pending = []
+        
+        for index, item in enumerate(items):
+            if self.persona_cache is not None:
+                keys[index] = cache_key(item)
+                cached = self.persona_cache.get(keys[index])
+                if cached is not None:
+                    personas[index] = Persona(**json.loads(cached))
+                    continue
+            pending.append(index)
+        
+        if pending:
+            with ThreadPoolExecutor(max_workers=max(1, min(self.max_workers, len(pending)))) as executor:
+                generated = executor.map(
+                    lambda item: self._generate_or_fallback(generate, item),
+                    [items[index] for index in pending]
+                )
+                for index, (persona, is_fallback) in zip(pending, generated):
+                    personas[index] = persona
+                    if keys[index] is not None and not is_fallback:
+                        self.persona_cache.set(keys[index], json.dumps(asdict(persona), default=str))
+        
+        return personas
+    
+    def _pattern_cache_key(self, pattern: Dict[str, Any]) -> str:
+        """Build the persona cache key of a pattern.
+        
+        The key covers the LLM model and the prompt template, so changing
+        either regenerates the personas. Frequency changes from run to run
+        without changing the segment, so it is left out of the key.
+        """
+        return ResponseCache.make_key(
+            kind="persona_pattern",
+            model=self.openai_client.model,
+            prompt=PATTERN_PERSONA_PROMPT,
+            pattern={key: value for key, value in pattern.items() if key != 'frequency'}
+        )
+    
+    def _theme_cache_key(self, theme_data: Dict[str, Any]) -> str:
+        """Build the persona cache key of a theme from the model, prompt and discussions sent to the LLM."""
+        return ResponseCache.make_key(
+            kind="persona_theme",
+            model=self.openai_client.model,
+            prompt=THEME_PERSONA_PROMPT,
+            theme=theme_data['theme'],
+            discussions=[discussion.get('content', '') for discussion in theme_data['discussions'][:3]]
+        )
     
     def build_from_community_discussions(
         self,
-        discussions: List[Dict[str, Any]],
-        min_engagement: int = 5
+        discussions: Iterable[Dict[str, Any]],
+        min_engagement: int = 5,
+        discover_themes: bool = False
     ) -> List[Persona]:
         """Build personas from community discussions.
         
         Args:
-            discussions: List of discussion data
+            discussions: List of discussion data; with ``discover_themes``
+                any iterable, consumed lazily
             min_engagement: Minimum engagement threshold
-            
+            discover_themes: Find themes by clustering discussion embeddings
+                instead of matching the keyword vocabulary
+                
         Returns:
             List of personas
         """
+        if discover_themes:
+            themes = self.theme_discovery.discover(discussions, min_engagement)
+            return self._generate_personas(themes, self._generate_persona_from_theme, self._theme_cache_key)
+        
         # Filter discussions by engagement
         high_engagement = [
             d for d in discussions 
@@ -221,12 +583,7 @@ class PersonaBuilder:
         # Group by common themes
         themes = self._extract_themes(high_engagement)
         
-        personas = []
-        for theme in themes:
-            persona = self._generate_persona_from_theme(theme)
-            personas.append(persona)
-        
-        return personas
+        return self._generate_personas(themes, self._generate_persona_from_theme, self._theme_cache_key)
     
     def _extract_themes(self, discussions: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
         """Extract common themes from discussions.
@@ -237,27 +594,13 @@ class PersonaBuilder:
         Returns:
             List of themes
         """
-        # Simple theme extraction based on common keywords
-        # In production, this would use more sophisticated NLP
         themes = {}
         
-        for discussion in discussions:
-            content = discussion.get('content', '').lower()
-            
-            # Define theme keywords
-            theme_keywords = {
-                'performance': ['slow', 'performance', 'speed', 'optimization'],
-                'scalability': ['scale', 'scaling', 'large', 'volume'],
-                'integration': ['integrate', 'api', 'connect', 'setup'],
-                'cost': ['cost', 'price', 'expensive', 'budget'],
-                'security': ['security', 'secure', 'compliance', 'privacy']
-            }
-            
-            for theme, keywords in theme_keywords.items():
-                if any(keyword in content for keyword in keywords):
-                    if theme not in themes:
-                        themes[theme] = []
-                    themes[theme].append(discussion)
+        for discussion, matched in self.theme_matcher.iter_matches(discussions):
+            for theme in matched:
+                if theme not in themes:
+                    themes[theme] = []
+                themes[theme].append(discussion)
         
         return [
             {'theme': theme, 'discussions': discussions}
@@ -276,15 +619,7 @@ class PersonaBuilder:
         theme = theme_data['theme']
         discussions = theme_data['discussions']
         
-        prompt = f"""
-        Based on community discussions about {theme}, create a user persona:
-        
-        Theme: {theme}
-        Sample discussions: {discussions[:3]}  # First 3 discussions
-        
-        Create a persona that represents users who discuss {theme} issues.
-        Include their pain points, goals, and how they would interact with LLMs.
-        """
+        prompt = THEME_PERSONA_PROMPT.format(theme=theme, discussions=discussions[:3])
         
         response = self.openai_client.generate_text(prompt)
         
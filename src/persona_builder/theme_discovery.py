@@ -0,0 +1,296 @@
+"""Embedding-based theme discovery for community discussions."""
+
+import json
+import os
+import tempfile
+import numpy as np
+from concurrent.futures import ThreadPoolExecutor
+from typing import List, Dict, Any, Optional, Iterable, Iterator, Tuple
+from ..config import ConfigManager
+from ..api_clients import OpenAIClient
+from ..semantic_clustering import SemanticClusterer
+from ..utils import StageTimer
+
+
+class ThemeDiscovery:
+    """Discover discussion themes by clustering embeddings.
+    
+    Discussions are embedded in batches and streamed to disk (the
+    discussions, their embeddings and each discussion's byte offset in
+    the spool) while mini-batch k-means is updated incrementally, so
+    memory does not grow with the number of discussions. A final pass
+    over the memory-mapped embeddings assigns every discussion to a
+    cluster and keeps the discussions closest to each centroid as
+    samples. Each cluster is then labeled with a single LLM call.
+    """
+    
+    def __init__(self, config_manager: ConfigManager, openai_client: Optional[OpenAIClient] = None):
+        """Initialize theme discovery.
+        
+        Args:
+            config_manager: Configuration manager instance
+            openai_client: Client for embeddings and labels; created if not given
+        """
+        self.config = config_manager
+        self.openai_client = openai_client or OpenAIClient(config_manager)
+        self.n_themes = config_manager.get("persona_building.theme_discovery.n_themes", None)
+        self.batch_size = config_manager.get("persona_building.theme_discovery.batch_size", 1000)
+        self.embedding_model = config_manager.get(
+            "persona_building.theme_discovery.embedding_model", "text-embedding-ada-002"
+        )
+        self.samples_per_theme = config_manager.get("persona_building.theme_discovery.samples_per_theme", 5)
+        self.max_workers = config_manager.get("persona_building.max_workers", 32)
+        self.timer = StageTimer(config_manager.get("semantic_clustering.track_memory", False))
+    
+    def discover(
+        self,
+        discussions: Iterable[Dict[str, Any]],
+        min_engagement: int = 5,
+        n_themes: Optional[int] = None,
+        work_dir: Optional[str] = None
+    ) -> List[Dict[str, Any]]:
+        """Discover themes in a stream of discussions.
+        
+        Args:
+            discussions: Discussions with 'content' and 'engagement_score',
+                consumed lazily
+            min_engagement: Minimum engagement threshold
+            n_themes: Number of clusters; defaults to
+                ``persona_building.theme_discovery.n_themes`` or
+                ``semantic_clustering.n_clusters``
+            work_dir: Empty directory for the discussion, embedding and
+                offset spools, kept after the run; a temporary
+                directory is used and removed if not given
+                
+        Returns:
+            Themes ordered by size, each with 'theme' (the LLM label),
+            'discussions' (samples closest to the cluster centre), 'size'
+            and 'cluster'
+        """
+        if work_dir is None:
+            with tempfile.TemporaryDirectory(prefix="theme_discovery_") as temp_dir:
+                return self._discover(discussions, min_engagement, n_themes, temp_dir)
+        
+        if os.path.isdir(work_dir) and os.listdir(work_dir):
+            raise ValueError(f"Theme discovery work directory must be empty: {work_dir}")
+        return self._discover(discussions, min_engagement, n_themes, work_dir)
+    
+    def get_stage_stats(self) -> List[Dict[str, Any]]:
+        """Get timing and memory per stage, aggregated over all runs.
+        
+        Returns:
+            List of dictionaries with stage, calls, rows, seconds and
+            peak_memory_mb
+        """
+        return self.timer.summary()
+    
+    def _discover(
+        self,
+        discussions: Iterable[Dict[str, Any]],
+        min_engagement: int,
+        n_themes: Optional[int],
+        work_dir: str
+    ) -> List[Dict[str, Any]]:
+        """Run embedding, clustering, assignment and labeling in ``work_dir``."""
+        os.makedirs(work_dir, exist_ok=True)
+        clusterer = SemanticClusterer(self.config)
+        clusterer.n_clusters = n_themes or self.n_themes or clusterer.n_clusters
+        
+        n_rows, dim = self._embed_and_cluster(discussions, min_engagement, clusterer, work_dir)
+        if not n_rows:
+            return []
+        
+        vectors = np.memmap(os.path.join(work_dir, "embeddings.f32"), dtype=np.float32, mode='r', shape=(n_rows, dim))
+        offsets = np.memmap(os.path.join(work_dir, "offsets.i64"), dtype=np.int64, mode='r', shape=(n_rows,))
+        with self.timer.stage("assign", n_rows):
+            sizes, sample_rows = self._assign(vectors, clusterer)
+        
+        spool_path = os.path.join(work_dir, "discussions.jsonl")
+        clusters = [cluster for cluster in np.argsort(-sizes, kind='stable') if sizes[cluster] > 0]
+        samples = {
+            cluster: self._read_discussions(spool_path, [int(offsets[row]) for row in sample_rows[cluster]])
+            for cluster in clusters
+        }
+        del vectors, offsets
+        
+        with self.timer.stage("label", len(clusters)):
+            with ThreadPoolExecutor(max_workers=max(1, min(self.max_workers, len(clusters)))) as executor:
+                labels = list(executor.map(
+                    lambda cluster: self._label_cluster(cluster, samples[cluster]), clusters
+                ))
+        
+        return [
+            {
+                'theme': label,
+                'discussions': samples[cluster],
+                'size': int(sizes[cluster]),
+                'cluster': int(cluster)
+            }
+            for cluster, label in zip(clusters, labels)
+        ]
+    
+    def _embed_and_cluster(
+        self,
+        discussions: Iterable[Dict[str, Any]],
+        min_engagement: int,
+        clusterer: SemanticClusterer,
+        work_dir: str
+    ) -> Tuple[int, int]:
+        """Embed discussions in batches, spool them to disk and update the clusters.
+        
+        Writes ``discussions.jsonl`` (one discussion per line),
+        ``embeddings.f32`` (a raw float32 matrix, one row per discussion)
+        and ``offsets.i64`` (each discussion's byte offset in the JSONL
+        spool) to ``work_dir``.
+        
+        Args:
+            discussions: Discussions, consumed lazily
+            min_engagement: Minimum engagement threshold
+            clusterer: Clusterer updated with ``partial_fit``
+            work_dir: Directory for the spools
+            
+        Returns:
+            Tuple of (number of discussions spooled, embedding dimension)
+        """
+        n_rows = 0
+        dim = 0
+        unfitted: List[np.ndarray] = []
+        
+        with open(os.path.join(work_dir, "discussions.jsonl"), 'wb') as spool, \
+                open(os.path.join(work_dir, "embeddings.f32"), 'wb') as embeddings, \
+                open(os.path.join(work_dir, "offsets.i64"), 'wb') as offsets:
+            for batch in self._iter_batches(discussions, min_engagement):
+                with self.timer.stage("embed", len(batch)):
+                    vectors = np.asarray(self.openai_client.generate_embeddings(
+                        [discussion['content'] for discussion in batch],
+                        model=self.embedding_model,
+                        as_numpy=True
+                    ), dtype=np.float32)
+                
+                with self.timer.stage("spool", len(batch)):
+                    lines = [json.dumps(discussion, default=str).encode('utf-8') + b"\n" for discussion in batch]
+                    starts = spool.tell() + np.cumsum([0] + [len(line) for line in lines[:-1]], dtype=np.int64)
+                    spool.write(b"".join(lines))
+                    offsets.write(starts.tobytes())
+                    embeddings.write(np.ascontiguousarray(vectors).tobytes())
+                n_rows += len(batch)
+                dim = vectors.shape[1]
+                
+                # The first partial_fit needs at least one row per cluster
+                unfitted.append(vectors)
+                if clusterer.is_fitted or sum(len(pending) for pending in unfitted) >= clusterer.n_clusters:
+                    with self.timer.stage("cluster", sum(len(pending) for pending in unfitted)):
+                        clusterer.partial_fit(np.concatenate(unfitted))
+                    unfitted.clear()
+        
+        if unfitted:
+            clusterer.n_clusters = min(clusterer.n_clusters, n_rows)
+            with self.timer.stage("cluster", n_rows):
+                clusterer.partial_fit(np.concatenate(unfitted))
+        
+        return n_rows, dim
+    
+    def _assign(self, vectors: np.ndarray, clusterer: SemanticClusterer) -> Tuple[np.ndarray, Dict[int, List[int]]]:
+        """Assign embeddings to clusters block by block.
+        
+        Args:
+            vectors: Embedding of every discussion (memory-mapped)
+            clusterer: Fitted clusterer
+            
+        Returns:
+            Tuple of (member count per cluster, rows closest to each
+            cluster centre, best first)
+        """
+        centroids = clusterer.centroids / np.linalg.norm(clusterer.centroids, axis=1, keepdims=True)
+        sizes = np.zeros(clusterer.n_clusters, dtype=np.int64)
+        best_rows = np.full((clusterer.n_clusters, self.samples_per_theme), -1, dtype=np.int64)
+        best_scores = np.full((clusterer.n_clusters, self.samples_per_theme), -np.inf, dtype=np.float32)
+        
+        for start in range(0, len(vectors), clusterer.batch_size):
+            block = np.asarray(vectors[start:start + clusterer.batch_size])
+            block = block / np.maximum(np.linalg.norm(block, axis=1, keepdims=True), 1e-12)
+            labels = clusterer.predict(block)
+            member = labels >= 0
+            sizes += np.bincount(labels[member], minlength=clusterer.n_clusters)
+            
+            scores = np.einsum('ij,ij->i', block[member], centroids[labels[member]])
+            rows = np.flatnonzero(member) + start
+            for cluster in np.unique(labels[member]):
+                in_cluster = labels[member] == cluster
+                candidate_rows = np.concatenate([best_rows[cluster], rows[in_cluster]])
+                candidate_scores = np.concatenate([best_scores[cluster], scores[in_cluster]])
+                top = np.argsort(-candidate_scores, kind='stable')[:self.samples_per_theme]
+                best_rows[cluster] = candidate_rows[top]
+                best_scores[cluster] = candidate_scores[top]
+        
+        sample_rows = {
+            cluster: [int(row) for row in best_rows[cluster] if row >= 0]
+            for cluster in range(clusterer.n_clusters)
+        }
+        return sizes, sample_rows
+    
+    def _label_cluster(self, cluster: int, samples: List[Dict[str, Any]]) -> str:
+        """Name a cluster from its most central discussions with one LLM call.
+        
+        Args:
+            cluster: Cluster number, used if the model returns no label
+            samples: Discussions closest to the cluster centre
+            
+        Returns:
+            Short theme label
+        """
+        excerpts = "\n".join(f"- {discussion['content'][:500]}" for discussion in samples)
+        prompt = f"""
+        The following community discussions were grouped together by topic:
+        
+        {excerpts}
+        
+        Reply with a short theme label (two to four words) naming what these
+        discussions have in common. Reply with the label only.
+        """
+        
+        response = self.openai_client.generate_text(prompt)
+        label = (response or "").strip().strip('"\'.').strip()
+        return label or f"theme {cluster}"
+    
+    def _iter_batches(
+        self,
+        discussions: Iterable[Dict[str, Any]],
+        min_engagement: int
+    ) -> Iterator[List[Dict[str, Any]]]:
+        """Group high-engagement discussions with text into embedding batches.
+        
+        Args:
+            discussions: Discussions, consumed lazily
+            min_engagement: Minimum engagement threshold
+            
+        Yields:
+            Lists of up to ``batch_size`` discussions
+        """
+        batch = []
+        for discussion in discussions:
+            if discussion.get('engagement_score', 0) >= min_engagement and discussion.get('content'):
+                batch.append(discussion)
+                if len(batch) >= self.batch_size:
+                    yield batch
+                    batch = []
+        if batch:
+            yield batch
+    
+    @staticmethod
+    def _read_discussions(spool_path: str, offsets: List[int]) -> List[Dict[str, Any]]:
+        """Read spooled discussions back by byte offset.
+        
+        Args:
+            spool_path: Path of the JSONL spool
+            offsets: Byte offsets of the discussions to read
+            
+        Returns:
+            Discussions in the order of ``offsets``
+        """
+        discussions = []
+        with open(spool_path, 'rb') as spool:
+            for offset in offsets:
+                spool.seek(offset)
+                discussions.append(json.loads(spool.readline()))
+        return discussions
\ No newline at end of file
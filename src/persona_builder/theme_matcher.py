@@ -0,0 +1,134 @@
+"""Compiled keyword matcher for tagging discussions with themes."""
+
+import re
+from collections import Counter
+from typing import List, Dict, Any, Iterable, Iterator, Optional, Tuple
+
+
+DEFAULT_THEME_KEYWORDS = {
+    'performance': ['slow', 'performance', 'speed', 'optimization'],
+    'scalability': ['scale', 'scaling', 'large', 'volume'],
+    'integration': ['integrate', 'api', 'connect', 'setup'],
+    'cost': ['cost', 'price', 'expensive', 'budget'],
+    'security': ['security', 'secure', 'compliance', 'privacy']
+}
+
+
+class ThemeMatcher:
+    """Tag text with themes using one compiled pattern for all keywords.
+    
+    Keywords match at the start of a word, so 'api' matches 'APIs' but not
+    'rapid'. Every keyword is found in a single scan of the text,
+    independent of the vocabulary size.
+    """
+    
+    def __init__(self, theme_keywords: Optional[Dict[str, List[str]]] = None):
+        """Initialize the matcher.
+        
+        Args:
+            theme_keywords: Keywords per theme; defaults to
+                ``DEFAULT_THEME_KEYWORDS``
+        """
+        self.theme_keywords = theme_keywords or DEFAULT_THEME_KEYWORDS
+        self.themes = list(self.theme_keywords)
+        
+        keyword_themes: Dict[str, set] = {}
+        for theme, keywords in self.theme_keywords.items():
+            for keyword in keywords:
+                if keyword:
+                    keyword_themes.setdefault(keyword.lower(), set()).add(theme)
+        
+        trie = _build_trie(keyword_themes)
+        
+        # A match at a word start implies a match of every keyword that is a
+        # prefix of it, so each keyword also carries its prefixes' themes
+        self._keyword_themes = {}
+        for keyword in keyword_themes:
+            themes = set()
+            node = trie
+            for length, char in enumerate(keyword, 1):
+                node = node[char]
+                if '' in node:
+                    themes |= keyword_themes[keyword[:length]]
+            self._keyword_themes[keyword] = [theme for theme in self.themes if theme in themes]
+        
+        # The alternation is laid out as a trie so the regex engine never
+        # backtracks across keywords; the zero-width lookahead also finds
+        # keywords that start inside a longer, multi-word match
+        self._pattern = re.compile(r'\b(?=(' + _trie_pattern(trie) + '))') if trie else None
+    
+    def match(self, text: str) -> List[str]:
+        """Find the themes mentioned in a text.
+        
+        Args:
+            text: Text to scan
+            
+        Returns:
+            Matched themes, in vocabulary order
+        """
+        if self._pattern is None:
+            return []
+        
+        matched = set()
+        for keyword in set(self._pattern.findall(text.lower())):
+            matched.update(self._keyword_themes[keyword])
+        return [theme for theme in self.themes if theme in matched]
+    
+    def iter_matches(
+        self,
+        discussions: Iterable[Dict[str, Any]],
+        text_field: str = 'content'
+    ) -> Iterator[Tuple[Dict[str, Any], List[str]]]:
+        """Tag a stream of discussions with themes.
+        
+        Args:
+            discussions: Discussions, consumed lazily
+            text_field: Field holding the discussion text
+            
+        Yields:
+            Tuples of (discussion, matched themes)
+        """
+        for discussion in discussions:
+            yield discussion, self.match(discussion.get(text_field) or '')
+    
+    def count_themes(
+        self,
+        discussions: Iterable[Dict[str, Any]],
+        text_field: str = 'content'
+    ) -> Dict[str, int]:
+        """Count discussions per theme over a stream.
+        
+        Args:
+            discussions: Discussions, consumed lazily
+            text_field: Field holding the discussion text
+            
+        Returns:
+            Number of discussions mentioning each theme
+        """
+        counts = Counter({theme: 0 for theme in self.themes})
+        for _, themes in self.iter_matches(discussions, text_field):
+            counts.update(themes)
+        return dict(counts)
+
+
+def _build_trie(keywords: Iterable[str]) -> Dict[str, Any]:
+    """Build a character trie; the key '' marks the end of a keyword."""
+    trie: Dict[str, Any] = {}
+    for keyword in keywords:
+        node = trie
+        for char in keyword:
+            node = node.setdefault(char, {})
+        node[''] = True
+    return trie
+
+
+def _trie_pattern(node: Dict[str, Any]) -> str:
+    """Render a trie node as a regex that prefers the longest keyword."""
+    branches = [re.escape(char) + _trie_pattern(child) for char, child in sorted(node.items()) if char]
+    if not branches:
+        return ''
+    
+    pattern = branches[0] if len(branches) == 1 else '(?:' + '|'.join(branches) + ')'
+    if '' in node:
+        pattern = ('(?:' + pattern + ')' if len(branches) == 1 else pattern) + '?'
+    return pattern
\ No newline at end of file
@@ -1,7 +1,13 @@
 """Query classification module for categorizing user queries."""
 
-from .query_classifier import QueryClassifier
-from .intent_detector import IntentDetector
-from .micro_intent_mapper import MicroIntentMapper
+from typing import TYPE_CHECKING
+from .._lazy import lazy_exports
 
-__all__ = ["QueryClassifier", "IntentDetector", "MicroIntentMapper"]
\ No newline at end of file
+if TYPE_CHECKING:
+    from .query_classifier import QueryClassifier
+    from .local_classifier import LocalQueryClassifier
+
+__getattr__, __dir__, __all__ = lazy_exports(__name__, {
+    "QueryClassifier": ".query_classifier",
+    "LocalQueryClassifier": ".local_classifier"
+})
\ No newline at end of file
@@ -0,0 +1,194 @@
+"""Embedding-based local query classifier trained on LLM-labeled queries."""
+
+import numpy as np
+from typing import List, Tuple, TYPE_CHECKING
+from ..utils import SimilarityCalculator
+
+if TYPE_CHECKING:
+    from .query_classifier import QueryClassification
+
+
+class LocalQueryClassifier:
+    """Nearest-centroid classifier over query embeddings.
+    
+    Intent and micro-intent are predicted from per-label centroids of
+    previously LLM-labeled queries. Entity, content format and audience
+    are copied from the most similar labeled query. Confidence is the
+    lowest of the two centroid probabilities and the nearest-neighbour
+    similarity, so queries unlike anything seen in training score low.
+    """
+    
+    def __init__(self, temperature: float = 0.05, block_size: int = 4096):
+        """Initialize the local classifier.
+        
+        Args:
+            temperature: Softmax temperature applied to centroid similarities
+            block_size: Rows per tile when searching the labeled queries, so
+                memory does not grow with the number of queries predicted
+        """
+        self.temperature = temperature
+        # Embeddings are normalized on the way in, so dot products are cosines
+        self.similarity = SimilarityCalculator(metric="dot", block_size=block_size)
+        self.intent_labels = np.array([], dtype=str)
+        self.intent_centroids = None
+        self.micro_intent_labels = np.array([], dtype=str)
+        self.micro_intent_centroids = None
+        self.example_embeddings = None
+        self.example_fields = np.empty((0, 3), dtype=str)
+    
+    @property
+    def is_fitted(self) -> bool:
+        """Whether the classifier has been trained."""
+        return self.example_embeddings is not None and len(self.example_embeddings) > 0
+    
+    def fit(
+        self,
+        embeddings: np.ndarray,
+        classifications: List["QueryClassification"]
+    ) -> "LocalQueryClassifier":
+        """Train on embedded, LLM-labeled queries.
+        
+        Args:
+            embeddings: Matrix of query embeddings, one row per classification
+            classifications: Labeled classifications for the embedded queries
+            
+        Returns:
+            The fitted classifier
+        """
+        embeddings = self._normalize(np.asarray(embeddings, dtype=np.float32))
+        
+        self.intent_labels, self.intent_centroids = self._centroids(
+            embeddings, [c.intent for c in classifications]
+        )
+        self.micro_intent_labels, self.micro_intent_centroids = self._centroids(
+            embeddings, [c.micro_intent for c in classifications]
+        )
+        self.example_embeddings = embeddings
+        self.example_fields = np.array(
+            [[c.entity, c.suggested_content_format, c.target_audience] for c in classifications],
+            dtype=str
+        ).reshape(-1, 3)
+        
+        return self
+    
+    def predict(self, queries: List[str], embeddings: np.ndarray) -> List["QueryClassification"]:
+        """Classify embedded queries locally.
+        
+        Args:
+            queries: Queries to classify
+            embeddings: Matrix of query embeddings, one row per query
+            
+        Returns:
+            List of classification results with local confidence scores
+        """
+        from .query_classifier import QueryClassification
+        
+        if not self.is_fitted:
+            raise ValueError("LocalQueryClassifier must be fitted before predicting")
+        
+        embeddings = self._normalize(np.asarray(embeddings, dtype=np.float32))
+        intents, intent_confidence = self._assign(embeddings, self.intent_labels, self.intent_centroids)
+        micro_intents, micro_confidence = self._assign(
+            embeddings, self.micro_intent_labels, self.micro_intent_centroids
+        )
+        
+        nearest, nearest_similarity = self.similarity.top_k(embeddings, self.example_embeddings, k=1)
+        nearest, nearest_similarity = nearest[:, 0], nearest_similarity[:, 0]
+        confidence = np.minimum(np.minimum(intent_confidence, micro_confidence), nearest_similarity)
+        
+        results = []
+        for row, query in enumerate(queries):
+            entity, content_format, audience = self.example_fields[nearest[row]]
+            results.append(QueryClassification(
+                query=query,
+                entity=str(entity),
+                intent=str(intents[row]),
+                micro_intent=str(micro_intents[row]),
+                confidence=float(max(confidence[row], 0.0)),
+                reasoning=f"Local nearest-centroid prediction (nearest labeled query similarity {nearest_similarity[row]:.2f})",
+                suggested_content_format=str(content_format),
+                target_audience=str(audience)
+            ))
+        
+        return results
+    
+    def save(self, path: str) -> None:
+        """Save the trained model to an ``.npz`` file.
+        
+        Args:
+            path: Output file path
+        """
+        np.savez_compressed(
+            path,
+            temperature=np.array(self.temperature),
+            intent_labels=self.intent_labels,
+            intent_centroids=self.intent_centroids,
+            micro_intent_labels=self.micro_intent_labels,
+            micro_intent_centroids=self.micro_intent_centroids,
+            example_embeddings=self.example_embeddings,
+            example_fields=self.example_fields
+        )
+    
+    @classmethod
+    def load(cls, path: str) -> "LocalQueryClassifier":
+        """Load a model saved with ``save``.
+        
+        Args:
+            path: Model file path
+            
+        Returns:
+            The loaded classifier
+        """
+        with np.load(path) as data:
+            classifier = cls(temperature=float(data['temperature']))
+            classifier.intent_labels = data['intent_labels']
+            classifier.intent_centroids = data['intent_centroids']
+            classifier.micro_intent_labels = data['micro_intent_labels']
+            classifier.micro_intent_centroids = data['micro_intent_centroids']
+            classifier.example_embeddings = data['example_embeddings']
+            classifier.example_fields = data['example_fields']
+        return classifier
+    
+    @staticmethod
+    def _normalize(embeddings: np.ndarray) -> np.ndarray:
+        """Scale rows to unit length so dot products are cosine similarities."""
+        norms = np.linalg.norm(embeddings, axis=1, keepdims=True)
+        return embeddings / np.maximum(norms, 1e-12)
+    
+    def _centroids(self, embeddings: np.ndarray, labels: List[str]) -> Tuple[np.ndarray, np.ndarray]:
+        """Compute one normalized centroid per label.
+        
+        Args:
+            embeddings: Normalized training embeddings
+            labels: Label of each row
+            
+        Returns:
+            Tuple of (label array, centroid matrix)
+        """
+        unique, inverse = np.unique(np.array(labels, dtype=str), return_inverse=True)
+        centroids = np.zeros((len(unique), embeddings.shape[1]), dtype=np.float32)
+        np.add.at(centroids, inverse, embeddings)
+        return unique, self._normalize(centroids)
+    
+    def _assign(
+        self,
+        embeddings: np.ndarray,
+        labels: np.ndarray,
+        centroids: np.ndarray
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        """Pick the closest centroid and its softmax probability.
+        
+        Args:
+            embeddings: Normalized query embeddings
+            labels: Label of each centroid
+            centroids: Normalized centroid matrix
+            
+        Returns:
+            Tuple of (predicted labels, probabilities)
+        """
+        logits = (embeddings @ centroids.T) / self.temperature
+        logits -= logits.max(axis=1, keepdims=True)
+        probabilities = np.exp(logits)
+        probabilities /= probabilities.sum(axis=1, keepdims=True)
+        best = probabilities.argmax(axis=1)
+        return labels[best], probabilities[np.arange(len(embeddings)), best]
\ No newline at end of file
@@ -1,9 +1,14 @@
 """Query classifier for categorizing queries by entity, intent, and micro-intent."""
 
-from typing import List, Dict, Any, Optional, Tuple
+import asyncio
+import time
+from concurrent.futures import ThreadPoolExecutor
+import numpy as np
+from typing import List, Dict, Any, Optional, Tuple, Callable
 from dataclasses import dataclass
 from ..config import ConfigManager
-from ..api_clients import OpenAIClient
+from ..api_clients import OpenAIClient, AsyncOpenAIClient
+from .local_classifier import LocalQueryClassifier
 
 
 @dataclass
@@ -18,16 +23,23 @@ class QueryClassification:
     reasoning: str
     suggested_content_format: str
     target_audience: str
+    latency: Optional[float] = None  # seconds spent on the LLM request
 
 
 class QueryClassifier:
     """Classifies queries by entity, intent, and micro-intent."""
     
-    def __init__(self, config_manager: ConfigManager):
+    def __init__(
+        self,
+        config_manager: ConfigManager,
+        embedding_function: Optional[Callable[[List[str]], Any]] = None
+    ):
         """Initialize the query classifier.
         
         Args:
             config_manager: Configuration manager instance
+            embedding_function: Embeds a list of queries for the local
+                classifier; defaults to ``OpenAIClient.generate_embeddings``
         """
         self.config = config_manager
         self.openai_client = OpenAIClient(config_manager)
@@ -40,6 +52,18 @@ class QueryClassifier:
         self.entity_types = config_manager.get("query_classification.entity_types", [
             "product", "technology", "concept", "use_case"
         ])
+        self.max_concurrency = config_manager.get("query_classification.max_concurrency", 8)
+        self.pack_size = config_manager.get("query_classification.pack_size", 20)
+        self.pack_tokens_per_query = config_manager.get("query_classification.pack_tokens_per_query", 150)
+        
+        # Created on first async use so sync-only callers never need it
+        self.async_openai_client = None
+        
+        # Local embedding classifier, trained with fit_local_classifier
+        self.embedding_function = embedding_function
+        self.embedding_model = config_manager.get("query_classification.embedding_model", "text-embedding-ada-002")
+        self.local_confidence_threshold = config_manager.get("query_classification.local_confidence_threshold", 0.8)
+        self.local_classifier = LocalQueryClassifier()
     
     def classify_query(self, query: str) -> QueryClassification:
         """Classify a single query.
@@ -50,7 +74,54 @@ class QueryClassifier:
         Returns:
             Classification result
         """
-        prompt = f"""
+        started = time.perf_counter()
+        
+        try:
+            response = self.openai_client.generate_text(self._build_classification_prompt(query))
+            classification = self._parse_classification(query, response)
+        except Exception as e:
+            print(f"Error classifying query: {e}")
+            classification = self._failed_classification(query, e)
+        
+        classification.latency = time.perf_counter() - started
+        return classification
+    
+    async def aclassify_query(self, query: str) -> QueryClassification:
+        """Classify a single query with the async OpenAI client.
+        
+        Args:
+            query: Query to classify
+            
+        Returns:
+            Classification result
+        """
+        if self.async_openai_client is None:
+            self.async_openai_client = AsyncOpenAIClient(self.config)
+        
+        started = time.perf_counter()
+        
+        try:
+            response = await self.async_openai_client.generate_text(
+                self._build_classification_prompt(query)
+            )
+            classification = self._parse_classification(query, response)
+        except Exception as e:
+            print(f"Error classifying query: {e}")
+            classification = self._failed_classification(query, e)
+        
+        classification.latency = time.perf_counter() - started
+        return classification
+    
+    def _build_classification_prompt(self, query: str) -> str:
+        """Build the LLM prompt for classifying one query.
+        
+        Args:
+            query: Query to classify
+            
+        Returns:
+            Prompt text
+        """
+        return f"""
         Classify the following query into the specified categories:
         
         Query: "{query}"
@@ -69,52 +140,359 @@ class QueryClassifier:
         
         Return as JSON with these fields.
         """
+    
+    def _parse_classification(self, query: str, response: str) -> QueryClassification:
+        """Parse an LLM classification response.
         
-        try:
-            response = self.openai_client.generate_text(prompt)
-            import json
-            classification_data = json.loads(response)
-            
-            return QueryClassification(
-                query=query,
-                entity=classification_data.get('entity', 'unknown'),
-                intent=classification_data.get('intent', 'informational'),
-                micro_intent=classification_data.get('micro_intent', 'documentation'),
-                confidence=classification_data.get('confidence', 0.5),
-                reasoning=classification_data.get('reasoning', ''),
-                suggested_content_format=classification_data.get('suggested_content_format', 'article'),
-                target_audience=classification_data.get('target_audience', 'general')
-            )
-        except Exception as e:
-            print(f"Error classifying query: {e}")
-            return QueryClassification(
-                query=query,
-                entity="unknown",
-                intent="informational",
-                micro_intent="documentation",
-                confidence=0.0,
-                reasoning=f"Error: {str(e)}",
-                suggested_content_format="article",
-                target_audience="general"
-            )
+        Args:
+            query: Classified query
+            response: Raw JSON response text
+            
+        Returns:
+            Classification result
+        """
+        import json
+        return self._classification_from_data(query, json.loads(response))
+    
+    @staticmethod
+    def _classification_from_data(query: str, classification_data: Dict[str, Any]) -> QueryClassification:
+        """Build a classification from parsed response fields.
+        
+        Args:
+            query: Classified query
+            classification_data: Parsed classification fields
+            
+        Returns:
+            Classification result
+        """
+        return QueryClassification(
+            query=query,
+            entity=classification_data.get('entity', 'unknown'),
+            intent=classification_data.get('intent', 'informational'),
+            micro_intent=classification_data.get('micro_intent', 'documentation'),
+            confidence=classification_data.get('confidence', 0.5),
+            reasoning=classification_data.get('reasoning', ''),
+            suggested_content_format=classification_data.get('suggested_content_format', 'article'),
+            target_audience=classification_data.get('target_audience', 'general')
+        )
+    
+    @staticmethod
+    def _failed_classification(query: str, error: Exception) -> QueryClassification:
+        """Build the fallback classification for a failed request.
+        
+        Args:
+            query: Query that could not be classified
+            error: Error raised while classifying
+            
+        Returns:
+            Zero-confidence classification
+        """
+        return QueryClassification(
+            query=query,
+            entity="unknown",
+            intent="informational",
+            micro_intent="documentation",
+            confidence=0.0,
+            reasoning=f"Error: {str(error)}",
+            suggested_content_format="article",
+            target_audience="general"
+        )
     
-    def classify_queries_batch(self, queries: List[str]) -> List[QueryClassification]:
+    def classify_queries_batch(
+        self,
+        queries: List[str],
+        max_concurrency: Optional[int] = None
+    ) -> List[QueryClassification]:
         """Classify multiple queries in batch.
         
+        Requests run concurrently on a thread pool through ``openai_client``,
+        so this also works when called from inside a running event loop.
+        Async callers can await ``aclassify_queries_batch`` instead.
+        
         Args:
             queries: List of queries to classify
+            max_concurrency: Maximum requests in flight (overrides config)
             
         Returns:
-            List of classification results
+            List of classification results, in input order
         """
-        results = []
+        if not queries:
+            return []
+        
+        max_workers = min(max_concurrency or self.max_concurrency, len(queries))
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            return list(executor.map(self.classify_query, queries))
+    
+    async def aclassify_queries_batch(
+        self,
+        queries: List[str],
+        max_concurrency: Optional[int] = None
+    ) -> List[QueryClassification]:
+        """Classify multiple queries concurrently.
         
-        for query in queries:
-            classification = self.classify_query(query)
-            results.append(classification)
+        Args:
+            queries: List of queries to classify
+            max_concurrency: Maximum requests in flight (overrides config)
+            
+        Returns:
+            List of classification results, in input order, each with its
+            request latency
+        """
+        semaphore = asyncio.Semaphore(max_concurrency or self.max_concurrency)
+        
+        async def classify(query: str) -> QueryClassification:
+            async with semaphore:
+                return await self.aclassify_query(query)
+        
+        return list(await asyncio.gather(*(classify(query) for query in queries)))
+    
+    def classify_queries_packed(
+        self,
+        queries: List[str],
+        pack_size: Optional[int] = None,
+        max_attempts: int = 2
+    ) -> List[QueryClassification]:
+        """Classify queries several at a time, one LLM call per pack.
+        
+        The category instructions are sent once per pack instead of once
+        per query. Queries whose entry is missing or malformed in the
+        response are re-packed for the next attempt; any still unresolved
+        after ``max_attempts`` are classified individually.
+        
+        Args:
+            queries: List of queries to classify
+            pack_size: Queries per LLM call (overrides config)
+            max_attempts: Packed rounds before falling back to single calls
+            
+        Returns:
+            List of classification results, in input order
+        """
+        pack_size = pack_size or self.pack_size
+        results = [None] * len(queries)
+        pending = list(range(len(queries)))
+        
+        for _ in range(max_attempts):
+            failed = []
+            
+            for start in range(0, len(pending), pack_size):
+                indices = pending[start:start + pack_size]
+                classified = self._classify_pack([queries[i] for i in indices])
+                
+                for position, index in enumerate(indices):
+                    if position in classified:
+                        results[index] = classified[position]
+                    else:
+                        failed.append(index)
+            
+            pending = failed
+            if not pending:
+                break
+        
+        for index in pending:
+            results[index] = self.classify_query(queries[index])
         
         return results
     
+    def _classify_pack(self, queries: List[str]) -> Dict[int, QueryClassification]:
+        """Classify one pack of queries with a single LLM call.
+        
+        Args:
+            queries: Queries in the pack
+            
+        Returns:
+            Dictionary mapping position in the pack to its classification;
+            positions that failed to parse are absent
+        """
+        started = time.perf_counter()
+        
+        try:
+            response = self.openai_client.generate_text(
+                self._build_pack_prompt(queries),
+                max_tokens=self.pack_tokens_per_query * len(queries)
+            )
+        except Exception as e:
+            print(f"Error classifying query pack: {e}")
+            return {}
+        
+        latency = time.perf_counter() - started
+        classified = {}
+        
+        for position, item in self._parse_pack_response(response, len(queries)).items():
+            classification = self._classification_from_data(queries[position], item)
+            classification.latency = latency
+            classified[position] = classification
+        
+        return classified
+    
+    def _build_pack_prompt(self, queries: List[str]) -> str:
+        """Build the LLM prompt for classifying a pack of queries.
+        
+        Args:
+            queries: Queries in the pack
+            
+        Returns:
+            Prompt text
+        """
+        numbered = "\n        ".join(f'{index}. "{query}"' for index, query in enumerate(queries))
+        
+        return f"""
+        Classify each of the following queries into the specified categories.
+        
+        Entity Types: {', '.join(self.entity_types)}
+        Micro Intents: {', '.join(self.micro_intents)}
+        
+        For every query provide:
+        - index: The number shown before the query
+        - entity: The main entity/concept being discussed
+        - intent: The user's primary intent (informational, commercial, transactional, navigational)
+        - micro_intent: The specific type of content they are looking for
+        - confidence: How confident you are in this classification (0-1)
+        - reasoning: One short sentence explaining the classification
+        - suggested_content_format: The format that would best serve the query
+        - target_audience: Who is likely asking the query
+        
+        Queries:
+        {numbered}
+
+        Return only a JSON array with one object per query.
+        """
+    
+    @staticmethod
+    def _parse_pack_response(response: str, pack_length: int) -> Dict[int, Dict[str, Any]]:
+        """Validate a packed response and split it by query index.
+        
+        Args:
+            response: Raw response text containing a JSON array
+            pack_length: Number of queries in the pack
+            
+        Returns:
+            Dictionary mapping valid indices to their classification fields
+        """
+        import json
+        
+        start = response.find('[') if response else -1
+        end = response.rfind(']') if response else -1
+        if start == -1 or end <= start:
+            return {}
+        
+        try:
+            items = json.loads(response[start:end + 1])
+        except ValueError:
+            return {}
+        
+        parsed = {}
+        for item in items if isinstance(items, list) else []:
+            if not isinstance(item, dict):
+                continue
+            
+            index = item.get('index')
+            if isinstance(index, str) and index.isdigit():
+                index = int(index)
+            if not isinstance(index, int) or isinstance(index, bool) or not 0 <= index < pack_length or index in parsed:
+                continue
+            
+            if all(item.get(field) for field in ('entity', 'intent', 'micro_intent')):
+                parsed[index] = item
+        
+        return parsed
+    
+    def embed_queries(self, queries: List[str]) -> np.ndarray:
+        """Embed queries for the local classifier.
+        
+        Args:
+            queries: Queries to embed
+            
+        Returns:
+            float32 matrix with one row per query
+        """
+        if not queries:
+            return np.zeros((0, 0), dtype=np.float32)
+        if self.embedding_function is not None:
+            embeddings = self.embedding_function(queries)
+        else:
+            embeddings = self.openai_client.generate_embeddings(queries, model=self.embedding_model)
+        return np.asarray(embeddings, dtype=np.float32)
+    
+    def fit_local_classifier(
+        self,
+        classifications: List[QueryClassification],
+        min_confidence: float = 0.7
+    ) -> int:
+        """Train the local classifier on previous LLM classifications.
+        
+        Args:
+            classifications: LLM-labeled classifications
+            min_confidence: Minimum LLM confidence for a training example
+            
+        Returns:
+            Number of training examples used
+        """
+        examples = [c for c in classifications if c.confidence >= min_confidence]
+        if not examples:
+            raise ValueError("No classifications meet the minimum confidence for training")
+        
+        self.local_classifier.fit(self.embed_queries([c.query for c in examples]), examples)
+        return len(examples)
+    
+    def classify_queries_hybrid(
+        self,
+        queries: List[str],
+        confidence_threshold: Optional[float] = None
+    ) -> Dict[str, Any]:
+        """Classify queries locally, escalating uncertain ones to the LLM.
+        
+        Raising the threshold sends more queries to the LLM (higher cost and
+        latency, better accuracy); lowering it keeps more of them local.
+        Until the local classifier is fitted, every query goes to the LLM.
+        
+        Args:
+            queries: List of queries to classify
+            confidence_threshold: Minimum local confidence to skip the LLM
+                (overrides config)
+                
+        Returns:
+            Dictionary with the classifications in input order, the number
+            of escalated queries and the escalation rate
+        """
+        if confidence_threshold is None:
+            confidence_threshold = self.local_confidence_threshold
+        if not queries:
+            return {
+                "classifications": [],
+                "total_queries": 0,
+                "escalated": 0,
+                "escalation_rate": 0.0,
+                "confidence_threshold": confidence_threshold,
+                "local_seconds": 0.0,
+                "llm_seconds": 0.0
+            }
+        
+        started = time.perf_counter()
+        if self.local_classifier.is_fitted:
+            classifications = self.local_classifier.predict(queries, self.embed_queries(queries))
+            escalated = [i for i, c in enumerate(classifications) if c.confidence < confidence_threshold]
+        else:
+            classifications = [None] * len(queries)
+            escalated = list(range(len(queries)))
+        local_seconds = time.perf_counter() - started
+        
+        started = time.perf_counter()
+        if escalated:
+            llm_results = self.classify_queries_batch([queries[i] for i in escalated])
+            for index, classification in zip(escalated, llm_results):
+                classifications[index] = classification
+        llm_seconds = time.perf_counter() - started
+        
+        return {
+            "classifications": classifications,
+            "total_queries": len(queries),
+            "escalated": len(escalated),
+            "escalation_rate": len(escalated) / len(queries),
+            "confidence_threshold": confidence_threshold,
+            "local_seconds": local_seconds,
+            "llm_seconds": llm_seconds
+        }
+    
     def classify_queries_by_pattern(self, queries: List[str]) -> Dict[str, List[QueryClassification]]:
         """Classify queries and group by patterns.
         
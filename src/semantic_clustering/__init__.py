@@ -0,0 +1,11 @@
+"""Semantic clustering module for grouping queries and pages by meaning."""
+
+from typing import TYPE_CHECKING
+from .._lazy import lazy_exports
+
+if TYPE_CHECKING:
+    from .semantic_clusterer import SemanticClusterer
+
+__getattr__, __dir__, __all__ = lazy_exports(__name__, {
+    "SemanticClusterer": ".semantic_clusterer"
+})
\ No newline at end of file
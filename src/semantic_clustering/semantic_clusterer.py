@@ -0,0 +1,247 @@
+"""Mini-batch k-means clustering over query and page embeddings."""
+
+import numpy as np
+from typing import List, Dict, Any
+from ..config import ConfigManager
+from ..utils import StageTimer
+
+
+class SemanticClusterer:
+    """Cluster embeddings with mini-batch k-means and incremental updates.
+    
+    Embeddings are normalized, so clusters group vectors by cosine
+    similarity. A full ``fit`` trains scikit-learn's ``MiniBatchKMeans``;
+    ``partial_fit`` then folds new batches into the existing centroids
+    with the same per-centroid learning rate, so weekly runs update the
+    model instead of re-clustering everything. Centroids and their member
+    counts are persisted with ``save``/``load``.
+    
+    Points whose cluster has fewer than ``min_cluster_size`` members, or
+    whose similarity to their centroid is below ``similarity_threshold``,
+    are labeled -1 (unclustered).
+    """
+    
+    def __init__(self, config_manager: ConfigManager):
+        """Initialize the semantic clusterer.
+        
+        Args:
+            config_manager: Configuration manager instance
+        """
+        self.config = config_manager
+        self.algorithm = config_manager.get("semantic_clustering.algorithm", "kmeans")
+        if self.algorithm != "kmeans":
+            raise ValueError(f"Unsupported clustering algorithm: {self.algorithm}")
+        
+        self.n_clusters = config_manager.get("semantic_clustering.n_clusters", 10)
+        self.min_cluster_size = config_manager.get("semantic_clustering.min_cluster_size", 5)
+        self.similarity_threshold = config_manager.get("semantic_clustering.similarity_threshold", 0.7)
+        self.batch_size = config_manager.get("semantic_clustering.batch_size", 4096)
+        self.random_state = config_manager.get("semantic_clustering.random_state", 42)
+        self.timer = StageTimer(config_manager.get("semantic_clustering.track_memory", False))
+        
+        self.centroids = None
+        self.counts = None
+    
+    @property
+    def is_fitted(self) -> bool:
+        """Whether centroids have been trained or loaded."""
+        return self.centroids is not None
+    
+    def fit(self, embeddings: np.ndarray) -> np.ndarray:
+        """Cluster a full set of embeddings from scratch.
+        
+        The whole input is normalized in memory; use ``partial_fit`` on
+        batches for inputs that do not fit.
+        
+        Args:
+            embeddings: Embedding matrix, one row per query or page
+                
+        Returns:
+            Cluster label of each row, -1 for unclustered rows
+        """
+        from sklearn.cluster import MiniBatchKMeans
+        
+        with self.timer.stage("normalize", len(embeddings)):
+            vectors = self._normalize(embeddings)
+        
+        with self.timer.stage("fit", len(vectors)):
+            kmeans = MiniBatchKMeans(
+                n_clusters=self.n_clusters,
+                batch_size=self.batch_size,
+                random_state=self.random_state,
+                n_init=3
+            )
+            kmeans.fit(vectors)
+            self.centroids = kmeans.cluster_centers_.astype(np.float32)
+        
+        with self.timer.stage("assign", len(vectors)):
+            assignments = self._nearest(vectors)
+            self.counts = np.bincount(assignments, minlength=self.n_clusters).astype(np.int64)
+            labels = self._label(vectors, assignments)
+        
+        return labels
+    
+    def partial_fit(self, embeddings: np.ndarray) -> np.ndarray:
+        """Update the centroids with a new batch of embeddings.
+        
+        The first call on an unfitted clusterer seeds the centroids with
+        k-means++ and needs at least ``n_clusters`` rows.
+        
+        Args:
+            embeddings: Embedding matrix for the new rows
+            
+        Returns:
+            Cluster label of each new row after the update, -1 for
+            unclustered rows
+        """
+        with self.timer.stage("normalize", len(embeddings)):
+            vectors = self._normalize(embeddings)
+        
+        with self.timer.stage("partial_fit", len(vectors)):
+            if not self.is_fitted:
+                from sklearn.cluster import kmeans_plusplus
+                
+                if len(vectors) < self.n_clusters:
+                    raise ValueError(
+                        f"First partial_fit batch needs at least {self.n_clusters} rows, got {len(vectors)}"
+                    )
+                centroids, _ = kmeans_plusplus(vectors, self.n_clusters, random_state=self.random_state)
+                self.centroids = centroids.astype(np.float32)
+                self.counts = np.zeros(self.n_clusters, dtype=np.int64)
+            
+            for start in range(0, len(vectors), self.batch_size):
+                self._update(vectors[start:start + self.batch_size])
+        
+        with self.timer.stage("assign", len(vectors)):
+            labels = self._label(vectors, self._nearest(vectors))
+        
+        return labels
+    
+    def predict(self, embeddings: np.ndarray) -> np.ndarray:
+        """Assign embeddings to the existing clusters without updating them.
+        
+        Args:
+            embeddings: Embedding matrix, one row per query or page
+            
+        Returns:
+            Cluster label of each row, -1 for unclustered rows
+        """
+        if not self.is_fitted:
+            raise ValueError("SemanticClusterer must be fitted before predicting")
+        
+        labels = np.empty(len(embeddings), dtype=np.int64)
+        with self.timer.stage("assign", len(embeddings)):
+            for start in range(0, len(embeddings), self.batch_size):
+                vectors = self._normalize(embeddings[start:start + self.batch_size])
+                labels[start:start + len(vectors)] = self._label(vectors, self._nearest(vectors))
+        
+        return labels
+    
+    def cluster_sizes(self) -> Dict[int, int]:
+        """Get the member count of every cluster.
+        
+        Returns:
+            Mapping of cluster label to number of assigned rows
+        """
+        if not self.is_fitted:
+            return {}
+        return {cluster: int(count) for cluster, count in enumerate(self.counts)}
+    
+    def save(self, path: str) -> None:
+        """Save centroids and member counts to an ``.npz`` file.
+        
+        Args:
+            path: Output file path
+        """
+        if not self.is_fitted:
+            raise ValueError("SemanticClusterer must be fitted before saving")
+        
+        with self.timer.stage("save", len(self.centroids)):
+            np.savez(path, centroids=self.centroids, counts=self.counts)
+    
+    def load(self, path: str) -> "SemanticClusterer":
+        """Load centroids and member counts saved with ``save``.
+        
+        Args:
+            path: Model file path
+            
+        Returns:
+            This clusterer, ready for ``predict`` or ``partial_fit``
+        """
+        with self.timer.stage("load", 0):
+            with np.load(path) as data:
+                self.centroids = data['centroids'].astype(np.float32)
+                self.counts = data['counts'].astype(np.int64)
+            self.n_clusters = len(self.centroids)
+        
+        return self
+    
+    def get_stage_stats(self) -> List[Dict[str, Any]]:
+        """Get timing and memory for every stage run so far.
+        
+        Returns:
+            List of dictionaries with stage, rows, seconds and
+            peak_memory_mb (None when memory tracking is off)
+        """
+        return list(self.timer.stats)
+    
+    @staticmethod
+    def _normalize(embeddings: np.ndarray) -> np.ndarray:
+        """Convert to float32 and scale rows to unit length."""
+        vectors = np.asarray(embeddings, dtype=np.float32)
+        norms = np.linalg.norm(vectors, axis=1, keepdims=True)
+        return vectors / np.maximum(norms, 1e-12)
+    
+    def _nearest(self, vectors: np.ndarray) -> np.ndarray:
+        """Find the closest centroid of each normalized row.
+        
+        For unit-length rows, minimizing squared Euclidean distance is
+        maximizing ``x . c - |c|^2 / 2``, which avoids a distance matrix.
+        
+        Args:
+            vectors: Normalized embedding matrix
+            
+        Returns:
+            Index of the closest centroid per row
+        """
+        half_norms = 0.5 * np.einsum('ij,ij->i', self.centroids, self.centroids)
+        return (vectors @ self.centroids.T - half_norms).argmax(axis=1)
+    
+    def _update(self, vectors: np.ndarray) -> None:
+        """Apply one mini-batch k-means step.
+        
+        Each centroid moves toward the mean of its new members with a
+        learning rate of members / total members seen, as in
+        scikit-learn's ``MiniBatchKMeans``.
+        
+        Args:
+            vectors: Normalized batch of embeddings
+        """
+        assignments = self._nearest(vectors)
+        batch_counts = np.bincount(assignments, minlength=self.n_clusters)
+        sums = np.zeros_like(self.centroids)
+        np.add.at(sums, assignments, vectors)
+        
+        updated = batch_counts > 0
+        self.counts[updated] += batch_counts[updated]
+        self.centroids[updated] += (
+            sums[updated] - batch_counts[updated, None] * self.centroids[updated]
+        ) / self.counts[updated, None]
+    
+    def _label(self, vectors: np.ndarray, assignments: np.ndarray) -> np.ndarray:
+        """Turn centroid assignments into labels, marking outliers as -1.
+        
+        Args:
+            vectors: Normalized embedding matrix
+            assignments: Closest centroid per row
+            
+        Returns:
+            Cluster labels
+        """
+        centroids = self._normalize(self.centroids)
+        similarity = np.einsum('ij,ij->i', vectors, centroids[assignments])
+        
+        labels = assignments.astype(np.int64)
+        labels[self.counts[assignments] < self.min_cluster_size] = -1
+        labels[similarity < self.similarity_threshold] = -1
+        return labels
\ No newline at end of file
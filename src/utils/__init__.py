@@ -1,13 +1,25 @@
 """Utility functions and helpers."""
 
-from .text_processing import TextProcessor
-from .data_processing import DataProcessor
-from .similarity import SimilarityCalculator
-from .validators import Validators
+from typing import TYPE_CHECKING
+from .._lazy import lazy_exports
 
-__all__ = [
-    "TextProcessor",
-    "DataProcessor", 
-    "SimilarityCalculator",
-    "Validators"
-]
\ No newline at end of file
+if TYPE_CHECKING:
+    from .text_processing import TextProcessor
+    from .document_cache import DocumentCache
+    from .embedding_store import EmbeddingStore, IVFIndex
+    from .model_registry import load_spacy_model, preload_spacy_model
+    from .phrase_counter import PhraseCounter
+    from .similarity import SimilarityCalculator
+    from .stage_timer import StageTimer
+
+__getattr__, __dir__, __all__ = lazy_exports(__name__, {
+    "TextProcessor": ".text_processing",
+    "DocumentCache": ".document_cache",
+    "EmbeddingStore": ".embedding_store",
+    "IVFIndex": ".embedding_store",
+    "load_spacy_model": ".model_registry",
+    "preload_spacy_model": ".model_registry",
+    "PhraseCounter": ".phrase_counter",
+    "SimilarityCalculator": ".similarity",
+    "StageTimer": ".stage_timer"
+})
\ No newline at end of file
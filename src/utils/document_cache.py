@@ -0,0 +1,94 @@
+"""Parse-once cache of spaCy documents shared between components."""
+
+import hashlib
+import threading
+from collections import OrderedDict
+from typing import Any, Dict
+
+
+class DocumentCache:
+    """Caches parsed spaCy Docs keyed by a hash of their content.
+    
+    One cache wraps one spaCy pipeline. Passing the same cache to the
+    ``EntityExtractor`` and ``TextProcessor`` lets entity extraction,
+    relationship extraction, readability and tokenization of a page share
+    a single parse.
+    
+    Only single-text calls go through the cache. Batched APIs such as
+    ``EntityExtractor.iter_entities_from_documents`` parse with
+    ``nlp.pipe`` and neither read nor fill it, so a corpus streamed
+    through them does not evict the documents cached for page analysis.
+    """
+    
+    def __init__(self, nlp: Any, max_size: int = 32):
+        """Initialize the document cache.
+        
+        Args:
+            nlp: spaCy pipeline used to parse texts
+            max_size: Maximum number of parsed documents kept (LRU)
+        """
+        self.nlp = nlp
+        self.max_size = max_size
+        self.hits = 0
+        self.misses = 0
+        
+        self._docs = OrderedDict()
+        self._lock = threading.Lock()
+    
+    @staticmethod
+    def content_hash(text: str) -> str:
+        """Get the cache key for a text.
+        
+        Args:
+            text: Input text
+            
+        Returns:
+            Hex digest of the text content
+        """
+        return hashlib.sha1(text.encode('utf-8')).hexdigest()
+    
+    def parse(self, text: str) -> Any:
+        """Get the parsed Doc for a text, parsing it on first use.
+        
+        Args:
+            text: Input text
+            
+        Returns:
+            Parsed spaCy Doc
+        """
+        key = self.content_hash(text)
+        
+        with self._lock:
+            doc = self._docs.get(key)
+            if doc is not None:
+                self._docs.move_to_end(key)
+                self.hits += 1
+                return doc
+            self.misses += 1
+        
+        doc = self.nlp(text)
+        
+        with self._lock:
+            self._docs[key] = doc
+            self._docs.move_to_end(key)
+            while len(self._docs) > self.max_size:
+                self._docs.popitem(last=False)
+        
+        return doc
+    
+    def clear(self) -> None:
+        """Drop all cached documents."""
+        with self._lock:
+            self._docs.clear()
+    
+    def stats(self) -> Dict[str, int]:
+        """Get cache usage statistics.
+        
+        Returns:
+            Dictionary with size, hits and misses
+        """
+        return {
+            "size": len(self._docs),
+            "hits": self.hits,
+            "misses": self.misses
+        }
\ No newline at end of file
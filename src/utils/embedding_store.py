@@ -0,0 +1,494 @@
+"""On-disk embedding store with exact and approximate similarity search."""
+
+import json
+import os
+import numpy as np
+from typing import List, Any, Optional, Tuple, Iterable
+from .similarity import SimilarityCalculator
+
+
+class IVFIndex:
+    """Inverted-file approximate nearest neighbour index.
+    
+    Rows are assigned to their closest k-means centroid. A search scores
+    only the rows in the ``n_probe`` lists closest to the query, which
+    makes million-row corpora searchable in milliseconds per query.
+    """
+    
+    def __init__(self, centroids: np.ndarray, order: np.ndarray, offsets: np.ndarray, n_rows: int):
+        """Initialize the index.
+        
+        Args:
+            centroids: Normalized centroid matrix, one row per list
+            order: Row numbers grouped by list
+            offsets: Start of each list in ``order``, plus a final end offset
+            n_rows: Number of store rows covered by the index
+        """
+        self.centroids = centroids
+        self.order = order
+        self.offsets = offsets
+        self.n_rows = n_rows
+    
+    @classmethod
+    def build(
+        cls,
+        vectors: np.ndarray,
+        n_lists: int,
+        sample_size: int = 100000,
+        block_size: int = 65536,
+        seed: int = 0
+    ) -> "IVFIndex":
+        """Train centroids on a sample and assign every row to a list.
+        
+        Args:
+            vectors: Normalized row matrix (may be memory-mapped)
+            n_lists: Number of inverted lists
+            sample_size: Rows sampled for training the centroids
+            block_size: Rows assigned per block
+            seed: Random seed for sampling and k-means
+            
+        Returns:
+            The built index
+        """
+        from sklearn.cluster import MiniBatchKMeans
+        
+        n_rows = len(vectors)
+        rng = np.random.default_rng(seed)
+        sample = np.sort(rng.choice(n_rows, size=min(sample_size, n_rows), replace=False))
+        
+        kmeans = MiniBatchKMeans(n_clusters=n_lists, random_state=seed, n_init=3)
+        kmeans.fit(np.asarray(vectors[sample]))
+        centroids = _normalize(kmeans.cluster_centers_.astype(np.float32))
+        
+        assignments = np.empty(n_rows, dtype=np.int32)
+        for start in range(0, n_rows, block_size):
+            block = np.asarray(vectors[start:start + block_size])
+            assignments[start:start + len(block)] = (block @ centroids.T).argmax(axis=1)
+        
+        order = np.argsort(assignments, kind='stable').astype(np.int64)
+        offsets = np.searchsorted(assignments[order], np.arange(n_lists + 1))
+        return cls(centroids, order, offsets, n_rows)
+    
+    def candidates(self, query: np.ndarray, n_probe: int) -> np.ndarray:
+        """Get the rows in the lists closest to a query.
+        
+        Args:
+            query: Normalized query vector
+            n_probe: Number of lists to scan
+            
+        Returns:
+            Array of candidate row numbers
+        """
+        n_probe = min(n_probe, len(self.centroids))
+        lists = np.argpartition(-(self.centroids @ query), n_probe - 1)[:n_probe]
+        return np.concatenate([self.order[self.offsets[i]:self.offsets[i + 1]] for i in lists])
+    
+    def save(self, path: str) -> None:
+        """Save the index to an ``.npz`` file.
+        
+        Args:
+            path: Output file path
+        """
+        np.savez(path, centroids=self.centroids, order=self.order, offsets=self.offsets, n_rows=self.n_rows)
+    
+    @classmethod
+    def load(cls, path: str) -> "IVFIndex":
+        """Load an index saved with ``save``.
+        
+        Args:
+            path: Index file path
+            
+        Returns:
+            The loaded index
+        """
+        with np.load(path) as data:
+            return cls(data['centroids'], data['order'], data['offsets'], int(data['n_rows']))
+
+
+class EmbeddingStore:
+    """Append-only, memory-mapped float32 embedding matrix with an id index.
+    
+    Vectors are L2-normalized on insert so dot products are cosine
+    similarities. Deletes set a tombstone; ``compact`` rewrites the matrix
+    without deleted rows. Files in the store directory:
+    
+    - ``vectors.<generation>.f32``: raw row-major float32 matrix
+    - ``ids.<generation>.jsonl``: the id of every row, one JSON value per line
+    - ``deleted.<generation>.i64``: row numbers of deleted rows
+    - ``meta.json``: dimension, generation and the committed length of
+      each data file
+    - ``ivf.npz``: optional approximate index
+    
+    Adds and deletes append to the data files and then commit by replacing
+    ``meta.json``, so each write costs time proportional to its own size,
+    not the store's. Bytes past the committed lengths, left by a write
+    that was interrupted before its commit, are truncated when the store
+    is opened. ``compact`` writes a new generation of data files and
+    switches to it with the same commit.
+    """
+    
+    def __init__(self, path: str, dim: Optional[int] = None, block_size: int = 65536):
+        """Open or create an embedding store.
+        
+        Args:
+            path: Store directory
+            dim: Vector dimension; required when creating a new store
+            block_size: Rows scored per block during exact search
+        """
+        self.path = path
+        self.block_size = block_size
+        # Stored rows are already normalized, so cosine is a plain dot product
+        self.similarity = SimilarityCalculator(metric="dot", block_size=block_size)
+        os.makedirs(path, exist_ok=True)
+        
+        if os.path.exists(self._meta_path):
+            with open(self._meta_path, 'r') as file:
+                meta = json.load(file)
+            self.dim = meta['dim']
+            self.generation = meta['generation']
+            self._ids_bytes = meta['ids_bytes']
+            self._remove_stale_files()
+            self._truncate(meta['rows'], meta['tombstones'])
+            self.ids = self._read_ids()
+            tombstones = np.fromfile(self._deleted_path, dtype=np.int64)
+        else:
+            if dim is None:
+                raise ValueError(f"No embedding store at {path}; dim is required to create one")
+            self.dim = dim
+            self.generation = 0
+            self._ids_bytes = 0
+            for data_path in (self._vectors_path, self._ids_path, self._deleted_path):
+                open(data_path, 'wb').close()
+            self.ids = []
+            tombstones = np.zeros(0, dtype=np.int64)
+        
+        self._n_tombstones = len(tombstones)
+        self._deleted = np.zeros(max(len(self.ids), 1024), dtype=bool)
+        self._deleted[tombstones] = True
+        self.rows = {row_id: row for row, row_id in enumerate(self.ids) if not self._deleted[row]}
+        
+        self.index = IVFIndex.load(self._index_path) if os.path.exists(self._index_path) else None
+        if self.index is not None and self.index.n_rows > len(self.ids):
+            self.drop_index()
+        self._vectors = None
+        if not os.path.exists(self._meta_path):
+            self._commit()
+    
+    @property
+    def _meta_path(self) -> str:
+        return os.path.join(self.path, "meta.json")
+    
+    @property
+    def _vectors_path(self) -> str:
+        return self._data_path("vectors", "f32")
+    
+    @property
+    def _ids_path(self) -> str:
+        return self._data_path("ids", "jsonl")
+    
+    @property
+    def _deleted_path(self) -> str:
+        return self._data_path("deleted", "i64")
+    
+    @property
+    def _index_path(self) -> str:
+        return os.path.join(self.path, "ivf.npz")
+    
+    def _data_path(self, name: str, extension: str, generation: Optional[int] = None) -> str:
+        """Path of a data file of the current (or given) generation."""
+        generation = self.generation if generation is None else generation
+        return os.path.join(self.path, f"{name}.{generation}.{extension}")
+    
+    @property
+    def deleted(self) -> np.ndarray:
+        """Tombstone flag per row."""
+        return self._deleted[:len(self.ids)]
+    
+    def __len__(self) -> int:
+        """Number of live (non-deleted) vectors."""
+        return len(self.rows)
+    
+    @property
+    def vectors(self) -> np.ndarray:
+        """Memory-mapped matrix of all rows, including deleted ones."""
+        if self._vectors is None or len(self._vectors) != len(self.ids):
+            if not self.ids:
+                return np.zeros((0, self.dim), dtype=np.float32)
+            self._vectors = np.memmap(self._vectors_path, dtype=np.float32, mode='r', shape=(len(self.ids), self.dim))
+        return self._vectors
+    
+    def add(self, ids: List[str], vectors: Any) -> None:
+        """Append vectors; an id that already exists is replaced.
+        
+        If an id occurs more than once in ``ids``, its last vector is kept.
+        
+        Args:
+            ids: Vector ids
+            vectors: Matrix with one row per id
+        """
+        vectors = np.asarray(vectors, dtype=np.float32).reshape(len(ids), self.dim)
+        
+        last = {row_id: position for position, row_id in enumerate(ids)}
+        if len(last) < len(ids):
+            keep = sorted(last.values())
+            ids = [ids[position] for position in keep]
+            vectors = vectors[keep]
+        if not ids:
+            return
+        vectors = _normalize(vectors)
+        
+        replaced = [self.rows[row_id] for row_id in ids if row_id in self.rows]
+        first_row = len(self.ids)
+        
+        with open(self._vectors_path, 'ab') as file:
+            file.write(np.ascontiguousarray(vectors).tobytes())
+        encoded = "".join(json.dumps(row_id) + "\n" for row_id in ids).encode('utf-8')
+        with open(self._ids_path, 'ab') as file:
+            file.write(encoded)
+        self._append_tombstones(replaced)
+        
+        self.ids.extend(ids)
+        self._ids_bytes += len(encoded)
+        self._reserve(len(self.ids))
+        self.deleted[replaced] = True
+        self.rows.update((row_id, first_row + offset) for offset, row_id in enumerate(ids))
+        self._vectors = None
+        self._commit()
+    
+    def delete(self, ids: Iterable[str]) -> int:
+        """Tombstone vectors by id.
+        
+        Args:
+            ids: Vector ids to delete
+            
+        Returns:
+            Number of vectors deleted
+        """
+        rows = [self.rows.pop(row_id) for row_id in dict.fromkeys(ids) if row_id in self.rows]
+        if rows:
+            self._append_tombstones(rows)
+            self.deleted[rows] = True
+            self._commit()
+        return len(rows)
+    
+    def get(self, row_id: str) -> Optional[np.ndarray]:
+        """Get the normalized vector for an id.
+        
+        Args:
+            row_id: Vector id
+            
+        Returns:
+            Vector, or None if the id is not in the store
+        """
+        row = self.rows.get(row_id)
+        return None if row is None else np.array(self.vectors[row])
+    
+    def compact(self) -> int:
+        """Rewrite the store without deleted rows.
+        
+        Any approximate index is dropped, since row numbers change.
+        
+        Returns:
+            Number of rows removed
+        """
+        live = np.flatnonzero(~self.deleted)
+        removed = len(self.ids) - len(live)
+        if not removed:
+            return 0
+        
+        # The index refers to the old row numbers
+        self.drop_index()
+        
+        vectors = self.vectors
+        generation = self.generation + 1
+        with open(self._data_path("vectors", "f32", generation), 'wb') as file:
+            for start in range(0, len(live), self.block_size):
+                file.write(np.ascontiguousarray(vectors[live[start:start + self.block_size]]).tobytes())
+        
+        ids = [self.ids[row] for row in live]
+        encoded = "".join(json.dumps(row_id) + "\n" for row_id in ids).encode('utf-8')
+        with open(self._data_path("ids", "jsonl", generation), 'wb') as file:
+            file.write(encoded)
+        open(self._data_path("deleted", "i64", generation), 'wb').close()
+        
+        self._vectors = None
+        del vectors
+        self.generation = generation
+        self.ids = ids
+        self._ids_bytes = len(encoded)
+        self._n_tombstones = 0
+        self._deleted = np.zeros(max(len(ids), 1024), dtype=bool)
+        self.rows = {row_id: row for row, row_id in enumerate(ids)}
+        self._commit()
+        self._remove_stale_files()
+        return removed
+    
+    def build_index(self, n_lists: Optional[int] = None, sample_size: int = 100000) -> IVFIndex:
+        """Build and save an approximate (IVF) index over the current rows.
+        
+        Rows added later are still found: they are scanned exactly until
+        the index is rebuilt.
+        
+        Args:
+            n_lists: Number of inverted lists; defaults to about sqrt(rows)
+            sample_size: Rows sampled for training the centroids
+            
+        Returns:
+            The built index
+            
+        Raises:
+            ValueError: If the store is empty
+        """
+        if not self.ids:
+            raise ValueError("Cannot build an index over an empty embedding store")
+        if n_lists is None:
+            n_lists = max(1, int(np.sqrt(len(self.ids))))
+        n_lists = min(n_lists, len(self.ids), sample_size)
+        
+        self.index = IVFIndex.build(self.vectors, n_lists, sample_size=sample_size, block_size=self.block_size)
+        self.index.save(self._index_path)
+        return self.index
+    
+    def drop_index(self) -> None:
+        """Remove the approximate index."""
+        self.index = None
+        if os.path.exists(self._index_path):
+            os.remove(self._index_path)
+    
+    def search(
+        self,
+        queries: Any,
+        k: int = 10,
+        threshold: Optional[float] = None,
+        approximate: bool = False,
+        n_probe: int = 8
+    ) -> List[List[Tuple[str, float]]]:
+        """Find the most similar stored vectors for each query.
+        
+        Args:
+            queries: Query vector or matrix with one query per row
+            k: Results per query
+            threshold: Minimum cosine similarity to report
+            approximate: Use the IVF index if one has been built
+            n_probe: Inverted lists scanned per query in approximate mode
+            
+        Returns:
+            For each query, (id, cosine similarity) pairs, best first
+        """
+        queries = _normalize(np.asarray(queries, dtype=np.float32).reshape(-1, self.dim))
+        
+        if approximate and self.index is not None:
+            rows, scores = self._search_index(queries, k, n_probe)
+        else:
+            rows, scores = self._search_exact(queries, k)
+        
+        results = []
+        for query_rows, query_scores in zip(rows, scores):
+            matches = []
+            for row, score in zip(query_rows, query_scores):
+                if row < 0 or (threshold is not None and score < threshold):
+                    continue
+                matches.append((self.ids[row], float(score)))
+            results.append(matches)
+        
+        return results
+    
+    def _search_exact(self, queries: np.ndarray, k: int) -> Tuple[np.ndarray, np.ndarray]:
+        """Score every live row block by block, keeping the running top k.
+        
+        Args:
+            queries: Normalized query matrix
+            k: Results per query
+            
+        Returns:
+            Tuple of (row numbers, scores), each of shape (queries, k);
+            unused slots hold row -1
+        """
+        return self.similarity.top_k(queries, self.vectors, k, exclude=self.deleted)
+    
+    def _search_index(self, queries: np.ndarray, k: int, n_probe: int) -> Tuple[np.ndarray, np.ndarray]:
+        """Score only rows from the closest inverted lists, plus new rows.
+        
+        Args:
+            queries: Normalized query matrix
+            k: Results per query
+            n_probe: Inverted lists scanned per query
+            
+        Returns:
+            Tuple of (row numbers, scores), each of shape (queries, k);
+            unused slots hold row -1
+        """
+        vectors = self.vectors
+        tail = np.arange(self.index.n_rows, len(vectors))
+        best_rows = np.full((len(queries), k), -1, dtype=np.int64)
+        best_scores = np.full((len(queries), k), -np.inf, dtype=np.float32)
+        
+        for i, query in enumerate(queries):
+            candidates = np.concatenate([self.index.candidates(query, n_probe), tail])
+            candidates = np.sort(candidates[~self.deleted[candidates]])
+            if not len(candidates):
+                continue
+            
+            scores = np.asarray(vectors[candidates]) @ query
+            rows, top = SimilarityCalculator.select_top_k(candidates[None, :], scores[None, :], k)
+            best_rows[i, :rows.shape[1]] = rows[0]
+            best_scores[i, :top.shape[1]] = top[0]
+        
+        best_rows[~np.isfinite(best_scores)] = -1
+        return best_rows, best_scores
+    
+    def _append_tombstones(self, rows: List[int]) -> None:
+        """Append deleted row numbers to the tombstone file."""
+        if rows:
+            with open(self._deleted_path, 'ab') as file:
+                file.write(np.asarray(rows, dtype=np.int64).tobytes())
+            self._n_tombstones += len(rows)
+    
+    def _reserve(self, n_rows: int) -> None:
+        """Grow the tombstone flags geometrically to hold ``n_rows`` rows."""
+        if n_rows > len(self._deleted):
+            deleted = np.zeros(max(n_rows, 2 * len(self._deleted)), dtype=bool)
+            deleted[:len(self._deleted)] = self._deleted
+            self._deleted = deleted
+    
+    def _commit(self) -> None:
+        """Record the current data file lengths, replacing meta.json atomically."""
+        with open(self._meta_path + ".tmp", 'w') as file:
+            json.dump({
+                "dim": self.dim,
+                "generation": self.generation,
+                "rows": len(self.ids),
+                "ids_bytes": self._ids_bytes,
+                "tombstones": self._n_tombstones
+            }, file)
+        os.replace(self._meta_path + ".tmp", self._meta_path)
+    
+    def _truncate(self, rows: int, tombstones: int) -> None:
+        """Cut data files back to their committed lengths."""
+        for data_path, size in (
+            (self._vectors_path, rows * self.dim * 4),
+            (self._ids_path, self._ids_bytes),
+            (self._deleted_path, tombstones * 8)
+        ):
+            if os.path.getsize(data_path) > size:
+                os.truncate(data_path, size)
+    
+    def _read_ids(self) -> List[Any]:
+        """Read the row ids of the current generation."""
+        with open(self._ids_path, 'rb') as file:
+            return [json.loads(line) for line in file]
+    
+    def _remove_stale_files(self) -> None:
+        """Delete data files of other generations and leftover temporary files."""
+        current = {self._vectors_path, self._ids_path, self._deleted_path}
+        for name in os.listdir(self.path):
+            file_path = os.path.join(self.path, name)
+            stale_data = name.split(".")[0] in ("vectors", "ids", "deleted") and file_path not in current
+            if stale_data or name.endswith(".tmp"):
+                os.remove(file_path)
+
+
+def _normalize(vectors: np.ndarray) -> np.ndarray:
+    """Scale rows to unit length."""
+    norms = np.linalg.norm(vectors, axis=-1, keepdims=True)
+    return vectors / np.maximum(norms, 1e-12)
\ No newline at end of file
@@ -0,0 +1,77 @@
+"""Process-wide registry of loaded spaCy pipelines."""
+
+import threading
+from typing import Any, Dict, Iterable, Tuple
+
+
+# One pipeline per (model name, disabled components, excluded components)
+_models: Dict[Tuple[str, Tuple[str, ...], Tuple[str, ...]], Any] = {}
+_lock = threading.Lock()
+
+
+def load_spacy_model(name: str, disable: Iterable[str] = (), exclude: Iterable[str] = ()) -> Any:
+    """Load a spaCy pipeline once per process and share it.
+    
+    Components that ask for the same model with the same disabled and
+    excluded components get the same ``Language`` object, so a process
+    holds one copy of its weights however many components use it.
+    Failed loads are not cached.
+    
+    The returned pipeline is shared and mutable. Callers must not change
+    its components (``add_pipe``, ``remove_pipe``, ``select_pipes`` or
+    ``nlp.disable_pipes``); pass ``disable``/``exclude`` to get a
+    separately registered pipeline instead, or per-call
+    ``nlp.pipe(..., disable=...)`` to skip components.
+    
+    Args:
+        name: spaCy model name or path
+        disable: Components loaded but disabled by default
+        exclude: Components not loaded at all
+        
+    Returns:
+        Loaded spaCy pipeline
+        
+    Raises:
+        OSError: If the model is not installed
+    """
+    key = (name, tuple(sorted(disable)), tuple(sorted(exclude)))
+    
+    with _lock:
+        nlp = _models.get(key)
+        if nlp is None:
+            import spacy
+            
+            nlp = spacy.load(name, disable=list(key[1]), exclude=list(key[2]))
+            _models[key] = nlp
+    
+    return nlp
+
+
+def preload_spacy_model(name: str, disable: Iterable[str] = (), exclude: Iterable[str] = ()) -> Any:
+    """Load a spaCy pipeline in a parent process before forking workers.
+    
+    Forked workers inherit the registry, so their ``load_spacy_model``
+    calls return the preloaded pipeline without loading it again. To
+    keep the model's memory pages shared copy-on-write, the caller should
+    ``gc.freeze()`` right before forking and ``gc.unfreeze()`` in the
+    parent once the workers are done, so collections in the workers do
+    not touch the model's objects.
+    
+    Args:
+        name: spaCy model name or path
+        disable: Components loaded but disabled by default
+        exclude: Components not loaded at all
+        
+    Returns:
+        Loaded spaCy pipeline
+        
+    Raises:
+        OSError: If the model is not installed
+    """
+    return load_spacy_model(name, disable, exclude)
+
+
+def clear_spacy_models() -> None:
+    """Drop all registered pipelines, e.g. between tests."""
+    with _lock:
+        _models.clear()
\ No newline at end of file
@@ -0,0 +1,157 @@
+"""Streaming n-gram generation and bounded-memory phrase counting."""
+
+import heapq
+from collections import Counter, deque
+from itertools import islice
+from typing import Dict, Iterable, Iterator, List, Optional, Set, Tuple
+import numpy as np
+
+
+def iter_ngrams(
+    tokens: Iterable[str],
+    min_length: int = 2,
+    max_length: int = 5,
+    stop_words: Optional[Set[str]] = None,
+    breaks: Optional[Set[str]] = None
+) -> Iterator[Tuple[str, ...]]:
+    """Yield n-grams lazily from a sliding window over tokens.
+    
+    N-grams are yielded as they complete, ordered by their last token and
+    then by length.
+    
+    Args:
+        tokens: Tokens, consumed lazily
+        min_length: Minimum n-gram length
+        max_length: Maximum n-gram length
+        stop_words: If given, n-grams starting or ending with one of these
+            are skipped; stop words inside an n-gram are kept
+        breaks: Tokens no n-gram may span, such as punctuation; they are
+            never part of an n-gram
+            
+    Yields:
+        N-grams as tuples of tokens
+    """
+    window = deque(maxlen=max_length)
+    for token in tokens:
+        if breaks and token in breaks:
+            window.clear()
+            continue
+        
+        window.append(token)
+        if stop_words and token in stop_words:
+            continue
+        
+        size = len(window)
+        for n in range(min_length, size + 1):
+            start = size - n
+            if stop_words and window[start] in stop_words:
+                continue
+            yield tuple(islice(window, start, size))
+
+
+class PhraseCounter:
+    """Approximate phrase frequencies across many documents in bounded memory.
+    
+    Counts go into a Count-Min Sketch of ``depth`` rows by ``width``
+    columns, so memory does not depend on the number of distinct phrases.
+    Estimates never undercount. They overcount only when phrases collide
+    in every row. Alongside the sketch, at most ``2 * top_k`` candidate
+    phrases with their current estimates are kept for ``most_common``.
+    
+    Phrases are hashed with Python's ``hash``, so a sketch is only
+    meaningful within one process.
+    """
+    
+    def __init__(self, top_k: int = 1000, width: int = 2 ** 20, depth: int = 4, seed: int = 0):
+        """Initialize the counter.
+        
+        Args:
+            top_k: Number of most frequent phrases to track
+            width: Columns per sketch row, rounded up to a power of two
+            depth: Number of sketch rows (independent hash functions)
+            seed: Seed for the hash functions
+        """
+        self.top_k = top_k
+        self.depth = depth
+        self._bits = max(1, int(width - 1).bit_length())
+        self.width = 1 << self._bits
+        self.total = 0
+        
+        rng = np.random.default_rng(seed)
+        # Multiply-shift hashing: odd multipliers, top bits select the column
+        self._multipliers = rng.integers(1, 2 ** 63, size=(depth, 1), dtype=np.uint64) * np.uint64(2) + np.uint64(1)
+        self._offsets = rng.integers(0, 2 ** 63, size=(depth, 1), dtype=np.uint64)
+        self._table = np.zeros((depth, self.width), dtype=np.uint32)
+        self._rows = np.arange(depth)[:, None]
+        
+        self._candidates: Dict[Tuple[str, ...], int] = {}
+        self._floor = 0
+    
+    def update(self, ngrams: Iterable[Tuple[str, ...]], batch_size: int = 65536) -> None:
+        """Count a stream of n-grams.
+        
+        Args:
+            ngrams: N-grams as tuples of tokens, consumed lazily
+            batch_size: N-grams counted per vectorized sketch update
+        """
+        ngrams = iter(ngrams)
+        while True:
+            batch = Counter(islice(ngrams, batch_size))
+            if not batch:
+                break
+            
+            keys = list(batch)
+            counts = np.fromiter(batch.values(), dtype=np.int64, count=len(keys))
+            columns = self._columns(keys)
+            for row in range(self.depth):
+                np.add.at(self._table[row], columns[row], counts.astype(np.uint32))
+            self.total += int(counts.sum())
+            
+            # A phrase outside this batch's top_k estimates cannot be in the
+            # overall top_k, so at most top_k candidates are admitted per batch
+            estimates = self._table[self._rows, columns].min(axis=0)
+            admitted = np.flatnonzero(estimates > self._floor)
+            if len(admitted) > self.top_k:
+                admitted = admitted[np.argpartition(-estimates[admitted], self.top_k - 1)[:self.top_k]]
+            for index in admitted.tolist():
+                self._candidates[keys[index]] = int(estimates[index])
+            
+            if len(self._candidates) > 2 * self.top_k:
+                self._prune()
+    
+    def estimate(self, ngram: Tuple[str, ...]) -> int:
+        """Estimate how often an n-gram was counted.
+        
+        Args:
+            ngram: N-gram as a tuple of tokens
+            
+        Returns:
+            Estimated count, never below the true count
+        """
+        columns = self._columns([ngram])
+        return int(self._table[self._rows, columns].min())
+    
+    def most_common(self, n: Optional[int] = None) -> List[Tuple[str, int]]:
+        """Get the most frequent phrases.
+        
+        Args:
+            n: Number of phrases to return; defaults to ``top_k``
+            
+        Returns:
+            List of (phrase, estimated count), most frequent first and ties
+            in phrase order
+        """
+        n = self.top_k if n is None else min(n, self.top_k)
+        ranked = heapq.nsmallest(n, self._candidates.items(), key=lambda item: (-item[1], item[0]))
+        return [(" ".join(ngram), count) for ngram, count in ranked]
+    
+    def _columns(self, keys: List[Tuple[str, ...]]) -> np.ndarray:
+        """Get the sketch column of each key in every row."""
+        hashes = np.fromiter((hash(key) for key in keys), dtype=np.int64, count=len(keys)).view(np.uint64)
+        return ((hashes * self._multipliers + self._offsets) >> np.uint64(64 - self._bits)).astype(np.intp)
+    
+    def _prune(self) -> None:
+        """Keep only the ``top_k`` best candidates and raise the admission floor."""
+        kept = heapq.nlargest(self.top_k, self._candidates.items(), key=lambda item: item[1])
+        self._candidates = dict(kept)
+        self._floor = kept[-1][1] if kept else 0
\ No newline at end of file
@@ -0,0 +1,179 @@
+"""Vectorized similarity kernels for embedding matrices."""
+
+import numpy as np
+from typing import Any, Iterator, Optional, Tuple
+
+
+class SimilarityCalculator:
+    """Blocked NumPy similarity engine for query-to-page matching.
+    
+    Inputs are processed in ``block_size`` x ``block_size`` tiles, so peak
+    memory depends on the block size rather than on the number of rows:
+    a 100k x 100k comparison never materializes the full score matrix.
+    Corpus matrices may be memory-mapped, and either side may be a SciPy
+    sparse matrix (such as TF-IDF vectors), densified one block at a time.
+    """
+    
+    METRICS = ("cosine", "dot")
+    
+    def __init__(self, metric: str = "cosine", block_size: int = 4096):
+        """Initialize the similarity calculator.
+        
+        Args:
+            metric: 'cosine', or 'dot' for raw (or pre-normalized) dot products
+            block_size: Rows per tile on each side of the product
+        """
+        if metric not in self.METRICS:
+            raise ValueError(f"Unknown metric: {metric}. Use one of {', '.join(self.METRICS)}")
+        self.metric = metric
+        self.block_size = block_size
+    
+    def _prepare(self, vectors: Any) -> np.ndarray:
+        """Convert a block to float32 and normalize it for cosine.
+        
+        Args:
+            vectors: Vector, dense matrix or sparse matrix
+            
+        Returns:
+            2-D float32 matrix
+        """
+        if hasattr(vectors, 'toarray'):
+            vectors = vectors.toarray()
+        vectors = np.atleast_2d(np.asarray(vectors, dtype=np.float32))
+        if self.metric == "cosine":
+            norms = np.linalg.norm(vectors, axis=1, keepdims=True)
+            vectors = vectors / np.maximum(norms, 1e-12)
+        return vectors
+    
+    def similarity(self, a: Any, b: Any) -> np.ndarray:
+        """Compute the full similarity matrix; for small inputs only.
+        
+        Args:
+            a: Matrix with one vector per row
+            b: Matrix with one vector per row
+            
+        Returns:
+            Matrix of shape (len(a), len(b))
+        """
+        return self._prepare(a) @ self._prepare(b).T
+    
+    def iter_blocks(self, queries: Any, corpus: Any) -> Iterator[Tuple[int, int, np.ndarray]]:
+        """Yield the similarity matrix tile by tile.
+        
+        Args:
+            queries: Matrix with one query vector per row
+            corpus: Matrix with one corpus vector per row
+            
+        Yields:
+            Tuples of (first query row, first corpus row, score tile)
+        """
+        for q_start in range(0, self._num_rows(queries), self.block_size):
+            query_block = self._prepare(queries[q_start:q_start + self.block_size])
+            for c_start in range(0, self._num_rows(corpus), self.block_size):
+                corpus_block = self._prepare(corpus[c_start:c_start + self.block_size])
+                yield q_start, c_start, query_block @ corpus_block.T
+    
+    def top_k(
+        self,
+        queries: Any,
+        corpus: Any,
+        k: int = 10,
+        exclude: Optional[np.ndarray] = None
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        """Find the k most similar corpus rows for every query.
+        
+        Args:
+            queries: Matrix with one query vector per row
+            corpus: Matrix with one corpus vector per row
+            k: Results per query
+            exclude: Boolean mask of corpus rows to skip
+            
+        Returns:
+            Tuple of (corpus indices, scores), each of shape (queries, k),
+            best first; unused slots hold index -1 and score -inf
+        """
+        if not hasattr(queries, 'toarray'):
+            queries = np.atleast_2d(queries)
+        indices = np.full((self._num_rows(queries), k), -1, dtype=np.int64)
+        scores = np.full((self._num_rows(queries), k), -np.inf, dtype=np.float32)
+        
+        for q_start, c_start, tile in self.iter_blocks(queries, corpus):
+            q_end = q_start + tile.shape[0]
+            c_end = c_start + tile.shape[1]
+            if exclude is not None:
+                tile[:, exclude[c_start:c_end]] = -np.inf
+            
+            # Reduce the tile to its own top k before merging with the running best
+            candidates = np.broadcast_to(np.arange(c_start, c_end), tile.shape)
+            tile_indices, tile_scores = self.select_top_k(candidates, tile, k)
+            indices[q_start:q_end], scores[q_start:q_end] = self.select_top_k(
+                np.concatenate([indices[q_start:q_end], tile_indices], axis=1),
+                np.concatenate([scores[q_start:q_end], tile_scores], axis=1),
+                k
+            )
+        
+        indices[~np.isfinite(scores)] = -1
+        return indices, scores
+    
+    def threshold_pairs(
+        self,
+        queries: Any,
+        corpus: Any,
+        threshold: float,
+        as_sparse: bool = False
+    ) -> Any:
+        """Find every (query, corpus) pair at or above a similarity threshold.
+        
+        Args:
+            queries: Matrix with one query vector per row
+            corpus: Matrix with one corpus vector per row
+            threshold: Minimum similarity
+            as_sparse: Return a ``scipy.sparse.csr_matrix`` instead of arrays
+            
+        Returns:
+            Tuple of (query indices, corpus indices, scores) arrays, or a
+            sparse matrix of shape (len(queries), len(corpus))
+        """
+        rows, cols, values = [], [], []
+        
+        for q_start, c_start, tile in self.iter_blocks(queries, corpus):
+            tile_rows, tile_cols = np.nonzero(tile >= threshold)
+            rows.append(tile_rows + q_start)
+            cols.append(tile_cols + c_start)
+            values.append(tile[tile_rows, tile_cols])
+        
+        rows = np.concatenate(rows) if rows else np.empty(0, dtype=np.int64)
+        cols = np.concatenate(cols) if cols else np.empty(0, dtype=np.int64)
+        values = np.concatenate(values) if values else np.empty(0, dtype=np.float32)
+        
+        if as_sparse:
+            from scipy.sparse import csr_matrix
+            return csr_matrix((values, (rows, cols)), shape=(self._num_rows(queries), self._num_rows(corpus)))
+        
+        return rows, cols, values
+    
+    @staticmethod
+    def _num_rows(vectors: Any) -> int:
+        """Count rows; ``len`` is ambiguous for SciPy sparse matrices."""
+        return vectors.shape[0] if hasattr(vectors, 'shape') else len(vectors)
+    
+    @staticmethod
+    def select_top_k(indices: np.ndarray, scores: np.ndarray, k: int) -> Tuple[np.ndarray, np.ndarray]:
+        """Keep the k best-scoring candidates per row, sorted best first.
+        
+        Uses ``argpartition`` so only the k survivors are sorted.
+        
+        Args:
+            indices: Candidate indices, shape (rows, candidates)
+            scores: Candidate scores, same shape
+            k: Results to keep
+            
+        Returns:
+            Tuple of (indices, scores), each of shape (rows, min(k, candidates))
+        """
+        k = min(k, scores.shape[1])
+        top = np.argpartition(-scores, k - 1, axis=1)[:, :k]
+        top_scores = np.take_along_axis(scores, top, axis=1)
+        order = np.argsort(-top_scores, axis=1, kind='stable')
+        top = np.take_along_axis(top, order, axis=1)
+        return np.take_along_axis(indices, top, axis=1), np.take_along_axis(scores, top, axis=1)
\ No newline at end of file
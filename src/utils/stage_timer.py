@@ -0,0 +1,106 @@
+"""Wall-time and memory accounting for pipeline stages."""
+
+import time
+import tracemalloc
+from contextlib import contextmanager
+from typing import List, Dict, Any, Iterator
+
+
+# Peak traced memory seen so far by each open stage, innermost last. It is
+# shared by all timers because tracemalloc's peak is process-wide and is
+# reset whenever a (possibly nested) stage starts.
+_open_peaks: List[int] = []
+
+
+def _reset_peak() -> None:
+    """Reset tracemalloc's peak to the current traced memory.
+    
+    Python 3.8 has no ``tracemalloc.reset_peak``; there tracing is
+    restarted instead, which also drops existing traces, so later peaks
+    count only memory allocated after the reset.
+    """
+    if hasattr(tracemalloc, 'reset_peak'):
+        tracemalloc.reset_peak()
+    else:
+        tracemalloc.stop()
+        tracemalloc.start()
+
+
+class StageTimer:
+    """Record wall time and peak traced memory of named pipeline stages."""
+    
+    def __init__(self, track_memory: bool = False):
+        """Initialize the stage timer.
+        
+        Args:
+            track_memory: Record peak memory with ``tracemalloc`` (adds
+                some allocation overhead)
+        """
+        self.track_memory = track_memory
+        self.stats: List[Dict[str, Any]] = []
+    
+    @contextmanager
+    def stage(self, name: str, rows: int = 0) -> Iterator[None]:
+        """Time a stage and append its statistics to ``stats``.
+        
+        Stages may nest, also across timers; an outer stage's peak memory
+        includes the peaks of the stages nested in it.
+        
+        Args:
+            name: Stage name
+            rows: Number of rows processed by the stage
+        """
+        started_tracing = False
+        if self.track_memory:
+            if tracemalloc.is_tracing():
+                if _open_peaks:
+                    _open_peaks[-1] = max(_open_peaks[-1], tracemalloc.get_traced_memory()[1])
+                _reset_peak()
+            else:
+                tracemalloc.start()
+                started_tracing = True
+            _open_peaks.append(0)
+        
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            seconds = time.perf_counter() - start
+            peak_memory_mb = None
+            if self.track_memory:
+                peak = max(_open_peaks.pop(), tracemalloc.get_traced_memory()[1])
+                if _open_peaks:
+                    _open_peaks[-1] = max(_open_peaks[-1], peak)
+                peak_memory_mb = peak / (1024 * 1024)
+                if started_tracing:
+                    tracemalloc.stop()
+            
+            self.stats.append({
+                "stage": name,
+                "rows": rows,
+                "seconds": seconds,
+                "peak_memory_mb": peak_memory_mb
+            })
+    
+    def summary(self) -> List[Dict[str, Any]]:
+        """Aggregate repeated stages.
+        
+        Returns:
+            One entry per stage name, in first-seen order, with total rows,
+            total seconds, call count and the highest peak memory
+        """
+        totals: Dict[str, Dict[str, Any]] = {}
+        for entry in self.stats:
+            total = totals.setdefault(entry["stage"], {
+                "stage": entry["stage"],
+                "calls": 0,
+                "rows": 0,
+                "seconds": 0.0,
+                "peak_memory_mb": None
+            })
+            total["calls"] += 1
+            total["rows"] += entry["rows"]
+            total["seconds"] += entry["seconds"]
+            if entry["peak_memory_mb"] is not None:
+                total["peak_memory_mb"] = max(total["peak_memory_mb"] or 0.0, entry["peak_memory_mb"])
+        return list(totals.values())
\ No newline at end of file
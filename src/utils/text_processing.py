@@ -2,36 +2,113 @@
 
 import re
 import string
-from typing import List, Dict, Any, Optional
-from textstat import flesch_reading_ease, flesch_kincaid_grade
-import spacy
-from nltk.corpus import stopwords
-from nltk.tokenize import word_tokenize, sent_tokenize
+import threading
+from collections import OrderedDict
+from functools import lru_cache
+from typing import List, Dict, Any, Optional, Iterable, Iterator, Set
+from .document_cache import DocumentCache
+from .model_registry import load_spacy_model
+from .phrase_counter import PhraseCounter, iter_ngrams
+
+
+# Characters removed by clean_text: anything but word characters, whitespace
+# and basic punctuation. ASCII text takes a bytes.translate fast path.
+SPECIAL_CHARS_PATTERN = re.compile(r'[^\w\s.,!?;:-]+')
+ASCII_SPECIAL_CHARS = bytes(
+    code for code in range(128)
+    if not (chr(code).isalnum() or chr(code).isspace() or chr(code) in '_.,!?;:-')
+)
+
+# Phrases never span punctuation
+PHRASE_BREAKS = set(string.punctuation)
+
+# Components readability does not need; sentence boundaries come from the
+# parser (or senter) and word counts from the tokenizer
+READABILITY_UNUSED_PIPES = ["tagger", "attribute_ruler", "lemmatizer", "ner", "textcat"]
+
+# Components lemmatization does not need
+LEMMA_UNUSED_PIPES = ["parser", "senter", "ner", "textcat"]
+
+
+@lru_cache(maxsize=65536)
+def _syllables(word: str) -> int:
+    """Count the syllables of a word, memoized across documents."""
+    from textstat import syllable_count
+    
+    return syllable_count(word)
 
 
 class TextProcessor:
     """Text processing utilities for semantic SEO."""
     
-    def __init__(self, spacy_model: str = "en_core_web_sm"):
+    def __init__(
+        self,
+        spacy_model: str = "en_core_web_sm",
+        document_cache: Optional[DocumentCache] = None,
+        sentencizer_only: bool = False,
+        fast_tokenization: bool = False,
+        lemma_cache_size: int = 65536,
+        document_cache_size: int = 32
+    ):
         """Initialize the text processor.
         
         Args:
             spacy_model: spaCy model to use
+            document_cache: Shared parse cache; its spaCy pipeline is used
+                instead of loading ``spacy_model``
+            sentencizer_only: Compute readability with a rule-based
+                sentencizer instead of the full pipeline
+            fast_tokenization: Tokenize with the tokenizer alone and look up
+                lemmas per surface form instead of parsing the text
+            lemma_cache_size: Maximum number of surface forms whose lemmas
+                are kept (LRU) in fast tokenization mode
+            document_cache_size: Maximum number of parsed documents kept
+                when no ``document_cache`` is given; use the same value as
+                ``entity_extraction.document_cache_size``
         """
-        try:
-            self.nlp = spacy.load(spacy_model)
-        except OSError:
-            print(f"Warning: {spacy_model} not found. Using basic processing.")
-            self.nlp = None
-        
-        try:
-            self.stop_words = set(stopwords.words('english'))
-        except LookupError:
-            import nltk
-            nltk.download('stopwords')
-            self.stop_words = set(stopwords.words('english'))
-    
-    def clean_text(self, text: str) -> str:
+        if document_cache is not None:
+            self.nlp = document_cache.nlp
+        else:
+            try:
+                self.nlp = load_spacy_model(spacy_model)
+            except OSError:
+                print(f"Warning: {spacy_model} not found. Using basic processing.")
+                self.nlp = None
+            
+            if self.nlp is not None:
+                document_cache = DocumentCache(self.nlp, max_size=document_cache_size)
+        
+        self.document_cache = document_cache
+        self.sentencizer_only = sentencizer_only
+        self._sentencizer = None
+        
+        self.fast_tokenization = fast_tokenization
+        self.lemma_cache_size = lemma_cache_size
+        self._lemmas = OrderedDict()
+        self._lemma_lock = threading.Lock()
+        
+        self._stop_words = None
+    
+    @property
+    def stop_words(self) -> Set[str]:
+        """English stop words, loaded from NLTK on first use."""
+        if self._stop_words is None:
+            from nltk.corpus import stopwords
+            
+            try:
+                self._stop_words = set(stopwords.words('english'))
+            except LookupError:
+                import nltk
+                nltk.download('stopwords')
+                self._stop_words = set(stopwords.words('english'))
+        return self._stop_words
+    
+    @stop_words.setter
+    def stop_words(self, stop_words: Set[str]) -> None:
+        self._stop_words = stop_words
+    
+    @staticmethod
+    def clean_text(text: str) -> str:
         """Clean and normalize text.
         
         Args:
@@ -40,18 +117,30 @@ class TextProcessor:
         Returns:
             Cleaned text
         """
-        # Remove extra whitespace
-        text = re.sub(r'\s+', ' ', text)
-        
-        # Remove special characters but keep basic punctuation
-        text = re.sub(r'[^\w\s.,!?;:-]', '', text)
+        # Remove extra whitespace (str.split and \s agree on what whitespace is)
+        text = ' '.join(text.split())
         
-        # Normalize quotes
-        text = text.replace('"', '"').replace('"', '"')
-        text = text.replace(''', "'").replace(''', "'")
+        # Remove special characters but keep basic punctuation. Quotes of every
+        # kind are removed here, so they need no separate normalization.
+        if text.isascii():
+            text = text.encode('ascii').translate(None, ASCII_SPECIAL_CHARS).decode('ascii')
+        else:
+            text = SPECIAL_CHARS_PATTERN.sub('', text)
         
         return text.strip()
     
+    @staticmethod
+    def clean_texts(texts: Iterable[str]) -> Iterator[str]:
+        """Clean a stream of texts lazily.
+        
+        Args:
+            texts: Input texts
+            
+        Returns:
+            Iterator over the cleaned texts, in input order
+        """
+        return map(TextProcessor.clean_text, texts)
+    
     def extract_sentences(self, text: str) -> List[str]:
         """Extract sentences from text.
         
@@ -62,9 +151,11 @@ class TextProcessor:
             List of sentences
         """
         if self.nlp:
-            doc = self.nlp(text)
+            doc = self.document_cache.parse(text)
             return [sent.text.strip() for sent in doc.sents if sent.text.strip()]
         else:
+            from nltk.tokenize import sent_tokenize
+            
             return sent_tokenize(text)
     
     def extract_tokens(self, text: str, remove_stopwords: bool = True) -> List[str]:
@@ -77,10 +168,14 @@ class TextProcessor:
         Returns:
             List of tokens
         """
-        if self.nlp:
-            doc = self.nlp(text)
+        if self.fast_tokenization:
+            tokens = self._lemmatize([token.text for token in self._get_tokenizer()(text) if not token.is_space])
+        elif self.nlp:
+            doc = self.document_cache.parse(text)
             tokens = [token.lemma_.lower() for token in doc if not token.is_space]
         else:
+            from nltk.tokenize import word_tokenize
+            
             tokens = word_tokenize(text.lower())
         
         if remove_stopwords:
@@ -88,23 +183,201 @@ class TextProcessor:
         
         return tokens
     
+    def iter_tokens(
+        self,
+        texts: Iterable[str],
+        remove_stopwords: bool = True,
+        batch_size: int = 256
+    ) -> Iterator[List[str]]:
+        """Extract tokens from many texts in batches.
+        
+        Args:
+            texts: Input texts, consumed lazily
+            remove_stopwords: Whether to remove stop words
+            batch_size: Texts per tokenizer or spaCy batch
+            
+        Yields:
+            List of tokens per text, in input order
+        """
+        if self.fast_tokenization:
+            for doc in self._get_tokenizer().pipe(texts, batch_size=batch_size):
+                tokens = self._lemmatize([token.text for token in doc if not token.is_space])
+                if remove_stopwords:
+                    tokens = [token for token in tokens if token not in self.stop_words]
+                yield tokens
+        elif self.nlp:
+            disabled = [name for name in LEMMA_UNUSED_PIPES if name in self.nlp.pipe_names]
+            for doc in self.nlp.pipe(texts, batch_size=batch_size, disable=disabled):
+                tokens = [token.lemma_.lower() for token in doc if not token.is_space]
+                if remove_stopwords:
+                    tokens = [token for token in tokens if token not in self.stop_words]
+                yield tokens
+        else:
+            for text in texts:
+                yield self.extract_tokens(text, remove_stopwords)
+    
+    def _get_tokenizer(self) -> Any:
+        """Get the tokenizer used in fast tokenization mode."""
+        return self.nlp.tokenizer if self.nlp else self._get_sentencizer().tokenizer
+    
+    def _lemmatize(self, forms: List[str]) -> List[str]:
+        """Get lowercase lemmas for surface forms through the LRU lemma cache.
+        
+        Forms not in the cache are lemmatized together in one batch, each
+        on its own, so a form always maps to the same lemma regardless of
+        its context. This can differ from the full pipeline, which tags
+        words in their sentence: "meeting" stays "meeting" here even where
+        it is a verb the full pipeline lemmatizes to "meet". The shared
+        pipeline runs with ``LEMMA_UNUSED_PIPES`` disabled per call, so no
+        second copy of the model is loaded. Without a spaCy model the
+        lemma is the lowercase form.
+        
+        Args:
+            forms: Token surface forms
+            
+        Returns:
+            Lemmas in the order of ``forms``
+        """
+        if not self.nlp:
+            return [form.lower() for form in forms]
+        
+        lemmas = {}
+        with self._lemma_lock:
+            for form in dict.fromkeys(forms):
+                lemma = self._lemmas.get(form)
+                if lemma is not None:
+                    self._lemmas.move_to_end(form)
+                    lemmas[form] = lemma
+        
+        missing = [form for form in dict.fromkeys(forms) if form not in lemmas]
+        if missing:
+            disabled = [name for name in LEMMA_UNUSED_PIPES if name in self.nlp.pipe_names]
+            looked_up = {
+                form: (doc[0].lemma_ if len(doc) == 1 else doc.text).lower()
+                for form, doc in zip(missing, self.nlp.pipe(missing, disable=disabled))
+            }
+            lemmas.update(looked_up)
+            
+            with self._lemma_lock:
+                self._lemmas.update(looked_up)
+                while len(self._lemmas) > self.lemma_cache_size:
+                    self._lemmas.popitem(last=False)
+        
+        return [lemmas[form] for form in forms]
+    
     def calculate_readability(self, text: str) -> Dict[str, float]:
         """Calculate readability metrics.
         
+        All metrics come from a single tokenization of the text. With the
+        full pipeline the parse is shared through the document cache.
+        
         Args:
             text: Input text
             
         Returns:
             Dictionary of readability metrics
         """
+        if self.sentencizer_only or not self.nlp:
+            doc = self._get_sentencizer()(text)
+        else:
+            doc = self.document_cache.parse(text)
+        
+        return self.readability_from_doc(doc)
+    
+    def iter_readability(
+        self,
+        texts: Iterable[str],
+        batch_size: int = 64,
+        n_process: int = 1
+    ) -> Iterator[Dict[str, float]]:
+        """Calculate readability metrics for many texts using ``nlp.pipe``.
+        
+        Args:
+            texts: Input texts, consumed lazily
+            batch_size: Texts per spaCy batch
+            n_process: spaCy worker processes
+            
+        Yields:
+            Dictionary of readability metrics per text, in input order
+        """
+        if self.sentencizer_only or not self.nlp:
+            docs = self._get_sentencizer().pipe(texts, batch_size=batch_size, n_process=n_process)
+        else:
+            disabled = [name for name in READABILITY_UNUSED_PIPES if name in self.nlp.pipe_names]
+            docs = self.nlp.pipe(texts, batch_size=batch_size, n_process=n_process, disable=disabled)
+        
+        for doc in docs:
+            yield self.readability_from_doc(doc)
+    
+    @staticmethod
+    def readability_from_doc(doc: Any) -> Dict[str, float]:
+        """Calculate readability metrics from a parsed document.
+        
+        Flesch Reading Ease and Flesch-Kincaid Grade use the standard
+        formulas over the document's words, sentences and syllables. Texts
+        without words score 0.0. ``word_count`` is the number of
+        whitespace-separated tokens, as before; the scores count words
+        without punctuation tokens and take sentences from spaCy rather
+        than textstat's regex splitter, so they can differ slightly from
+        ``textstat.flesch_reading_ease``.
+        
+        Args:
+            doc: spaCy Doc; if it has no sentence boundaries (no parser or
+                senter), they are set with a rule-based sentencizer
+                
+        Returns:
+            Dictionary of readability metrics
+        """
+        if not doc.has_annotation("SENT_START"):
+            from spacy.pipeline import Sentencizer
+            
+            doc = Sentencizer()(doc.copy())
+        
+        # Tokens not separated by whitespace, like "was" + "n't", form one word
+        words: List[str] = []
+        attached = False
+        for token in doc:
+            if token.is_punct or token.is_space:
+                attached = False
+                continue
+            if attached:
+                words[-1] += token.text
+            else:
+                words.append(token.text)
+            attached = not token.whitespace_
+        
+        word_count = len(doc.text.split())
+        sentence_count = sum(1 for sent in doc.sents if sent.text.strip())
+        
+        if not words or sentence_count == 0:
+            return {
+                "flesch_reading_ease": 0.0,
+                "flesch_kincaid_grade": 0.0,
+                "word_count": word_count,
+                "sentence_count": sentence_count,
+                "avg_words_per_sentence": word_count / sentence_count if sentence_count else 0.0
+            }
+        
+        words_per_sentence = len(words) / sentence_count
+        syllables_per_word = sum(_syllables(word.lower()) for word in words) / len(words)
+        
         return {
-            "flesch_reading_ease": flesch_reading_ease(text),
-            "flesch_kincaid_grade": flesch_kincaid_grade(text),
-            "word_count": len(text.split()),
-            "sentence_count": len(self.extract_sentences(text)),
-            "avg_words_per_sentence": len(text.split()) / len(self.extract_sentences(text))
+            "flesch_reading_ease": round(206.835 - 1.015 * words_per_sentence - 84.6 * syllables_per_word, 2),
+            "flesch_kincaid_grade": round(0.39 * words_per_sentence + 11.8 * syllables_per_word - 15.59, 2),
+            "word_count": word_count,
+            "sentence_count": sentence_count,
+            "avg_words_per_sentence": word_count / sentence_count
         }
     
+    def _get_sentencizer(self) -> Any:
+        """Get the rule-based sentence splitting pipeline, creating it on first use."""
+        if self._sentencizer is None:
+            import spacy
+            
+            self._sentencizer = spacy.blank(self.nlp.lang if self.nlp else "en")
+            self._sentencizer.add_pipe("sentencizer")
+        return self._sentencizer
+    
     def extract_phrases(self, text: str, min_length: int = 2, max_length: int = 5) -> List[str]:
         """Extract n-gram phrases from text.
         
@@ -126,6 +399,63 @@ class TextProcessor:
         
         return phrases
     
+    def iter_phrases(
+        self,
+        text: str,
+        min_length: int = 2,
+        max_length: int = 5,
+        prune_stopwords: bool = False
+    ) -> Iterator[str]:
+        """Yield n-gram phrases from text lazily.
+        
+        Unlike ``extract_phrases``, phrases do not span punctuation.
+        
+        Args:
+            text: Input text
+            min_length: Minimum phrase length
+            max_length: Maximum phrase length
+            prune_stopwords: Skip phrases starting or ending with a stop word
+            
+        Yields:
+            Phrases, ordered by their last token and then by length
+        """
+        tokens = self.extract_tokens(text, remove_stopwords=False)
+        stop_words = self.stop_words if prune_stopwords else None
+        for ngram in iter_ngrams(tokens, min_length, max_length, stop_words, PHRASE_BREAKS):
+            yield " ".join(ngram)
+    
+    def count_phrases(
+        self,
+        texts: Iterable[str],
+        min_length: int = 2,
+        max_length: int = 5,
+        prune_stopwords: bool = True,
+        counter: Optional[PhraseCounter] = None,
+        batch_size: int = 256
+    ) -> PhraseCounter:
+        """Count phrase frequencies across many texts in bounded memory.
+        
+        Phrases do not span punctuation. Texts are tokenized in batches
+        with ``iter_tokens``, so they are not parsed one by one and do not
+        pass through the document cache.
+        
+        Args:
+            texts: Input texts, consumed lazily
+            min_length: Minimum phrase length
+            max_length: Maximum phrase length
+            prune_stopwords: Skip phrases starting or ending with a stop word
+            counter: Counter to add to; a new one is created if not given
+            batch_size: Texts per tokenizer or spaCy batch
+            
+        Returns:
+            Phrase counter; use ``most_common`` for the top phrases
+        """
+        counter = counter or PhraseCounter()
+        stop_words = self.stop_words if prune_stopwords else None
+        for tokens in self.iter_tokens(texts, remove_stopwords=False, batch_size=batch_size):
+            counter.update(iter_ngrams(tokens, min_length, max_length, stop_words, PHRASE_BREAKS))
+        return counter
+    
     def extract_entities(self, text: str) -> List[Dict[str, Any]]:
         """Extract named entities from text.
         
@@ -138,7 +468,7 @@ class TextProcessor:
         if not self.nlp:
             return []
         
-        doc = self.nlp(text)
+        doc = self.document_cache.parse(text)
         entities = []
         
         for ent in doc.ents:
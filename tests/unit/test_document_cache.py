@@ -0,0 +1,72 @@
+"""Unit tests for DocumentCache module."""
+
+import pytest
+import spacy
+from unittest.mock import Mock, patch
+from src.config import ConfigManager
+from src.entity_extraction import EntityExtractor
+from src.utils import DocumentCache, TextProcessor
+
+
+@pytest.fixture
+def nlp():
+    """Create a blank English pipeline that tags one product."""
+    nlp = spacy.blank("en")
+    nlp.add_pipe("sentencizer")
+    nlp.add_pipe("entity_ruler").add_patterns([{"label": "PRODUCT", "pattern": "Kibana"}])
+    return nlp
+
+
+class TestDocumentCache:
+    """Test cases for DocumentCache class."""
+    
+    def test_lru_eviction_and_stats(self, nlp):
+        """Test that repeated texts are parsed once and the oldest are evicted."""
+        cache = DocumentCache(nlp, max_size=2)
+        
+        first = cache.parse("one")
+        assert cache.parse("one") is first
+        cache.parse("two")
+        cache.parse("one")
+        cache.parse("three")
+        
+        assert cache.stats() == {"size": 2, "hits": 2, "misses": 3}
+        assert cache.parse("one") is first
+        cache.parse("two")
+        assert cache.stats()["misses"] == 4
+    
+    def test_components_share_one_parse(self, nlp):
+        """Test that entity extraction and text processing reuse the cached Doc."""
+        cache = DocumentCache(nlp)
+        config = Mock(spec=ConfigManager)
+        config.get.side_effect = lambda key, default=None: default
+        with patch('src.entity_extraction.entity_extractor.OpenAIClient'):
+            extractor = EntityExtractor(config, document_cache=cache)
+        processor = TextProcessor(document_cache=cache)
+        text = "Kibana is fast. Kibana is pretty."
+        
+        entities = extractor.extract_entities(text)
+        extractor.extract_entity_relationships(text, entities)
+        processor.extract_sentences(text)
+        
+        assert processor.nlp is extractor.nlp is nlp
+        assert cache.stats() == {"size": 1, "hits": 2, "misses": 1}
+    
+    def test_batched_extraction_bypasses_cache(self, nlp):
+        """Test that streaming a corpus neither reads nor fills the cache."""
+        cache = DocumentCache(nlp)
+        config = Mock(spec=ConfigManager)
+        config.get.side_effect = lambda key, default=None: default
+        with patch('src.entity_extraction.entity_extractor.OpenAIClient'):
+            extractor = EntityExtractor(config, document_cache=cache)
+        
+        list(extractor.iter_entities_from_documents([{'id': str(i), 'content': f"Kibana {i}"} for i in range(5)]))
+        
+        assert cache.stats() == {"size": 0, "hits": 0, "misses": 0}
+    
+    def test_text_processor_cache_size(self, nlp, tmp_path):
+        """Test that a TextProcessor's own cache uses the configured size."""
+        nlp.to_disk(tmp_path / "model")
+        
+        assert TextProcessor(str(tmp_path / "model")).document_cache.max_size == 32
+        assert TextProcessor(str(tmp_path / "model"), document_cache_size=4).document_cache.max_size == 4
\ No newline at end of file
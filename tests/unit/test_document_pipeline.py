@@ -0,0 +1,145 @@
+"""Unit tests for DocumentPipeline module."""
+
+import json
+import os
+import pytest
+import pandas as pd
+from unittest.mock import Mock
+from src.config import ConfigManager
+from src.entity_extraction.entity_extractor import Entity
+from src.entity_extraction.document_pipeline import DocumentPipeline, iter_jsonl_documents, iter_parquet_documents
+
+
+class StubExtractor:
+    """Extractor that reads ahead in batches like ``nlp.pipe`` and can fail mid-run."""
+    
+    def __init__(self, fail_after=None, batch_size=3):
+        self.fail_after = fail_after
+        self.batch_size = batch_size
+        self.extracted = 0
+    
+    def iter_entities_from_documents(self, documents, text_field="content"):
+        batch = []
+        for document in documents:
+            batch.append(document)
+            if len(batch) == self.batch_size:
+                yield from self._extract(batch, text_field)
+                batch = []
+        yield from self._extract(batch, text_field)
+    
+    def _extract(self, batch, text_field):
+        for document in batch:
+            if self.fail_after is not None and self.extracted >= self.fail_after:
+                raise RuntimeError("worker crashed")
+            self.extracted += 1
+            text = document[text_field]
+            yield document['id'], [Entity(text.split()[0], 'ORG', 0, len(text.split()[0]), 0.9)]
+
+
+class TestDocumentPipeline:
+    """Test cases for DocumentPipeline class."""
+    
+    @pytest.fixture
+    def config_manager(self):
+        """Create a mock config manager writing parts of four documents."""
+        config = Mock(spec=ConfigManager)
+        settings = {'entity_extraction.pipeline.rows_per_part': 4}
+        config.get.side_effect = lambda key, default=None: settings.get(key, default)
+        return config
+    
+    @pytest.fixture
+    def documents(self):
+        """Create documents with integer IDs, every fifth without text."""
+        return [{'id': i, 'content': f"Doc{i} text" if i % 5 else ''} for i in range(23)]
+    
+    @pytest.fixture
+    def input_files(self, documents, tmp_path):
+        """Write the documents as JSONL and as Parquet with small row groups."""
+        jsonl_path = tmp_path / "documents.jsonl"
+        jsonl_path.write_text(''.join(json.dumps(document) + "\n" for document in documents) + "\n")
+        parquet_path = tmp_path / "documents.parquet"
+        pd.DataFrame(documents).to_parquet(parquet_path, row_group_size=5)
+        return {'jsonl': str(jsonl_path), 'parquet': str(parquet_path)}
+    
+    @staticmethod
+    def read_results(output_dir, output_format):
+        """Read (id, first entity text) rows from all part files in order."""
+        rows = []
+        for name in sorted(os.listdir(output_dir)):
+            path = os.path.join(output_dir, name)
+            if not name.startswith("part-"):
+                continue
+            if output_format == "jsonl":
+                with open(path) as file:
+                    records = [json.loads(line) for line in file]
+            else:
+                records = pd.read_parquet(path).to_dict('records')
+            rows.extend((record['id'], record['entities'][0]['text']) for record in records)
+        return rows
+    
+    def test_iter_jsonl_documents_resumes_at_offset(self, input_files):
+        """Test that yielded byte offsets resume reading after a document."""
+        documents = list(iter_jsonl_documents(input_files['jsonl']))
+        resumed = list(iter_jsonl_documents(input_files['jsonl'], start=documents[9][1]))
+        
+        assert len(documents) == 23
+        assert [document['id'] for document, _ in resumed] == list(range(10, 23))
+    
+    def test_iter_parquet_documents_resumes_at_row(self, input_files):
+        """Test resuming mid row group and reading only requested columns."""
+        resumed = list(iter_parquet_documents(input_files['parquet'], start=12, columns=['id', 'missing'], batch_size=4))
+        
+        assert [document for document, _ in resumed][:2] == [{'id': 12}, {'id': 13}]
+        assert [row for _, row in resumed] == list(range(13, 24))
+        assert list(iter_parquet_documents(input_files['parquet'], start=23)) == []
+    
+    @pytest.mark.parametrize("input_format", ["jsonl", "parquet"])
+    @pytest.mark.parametrize("output_format", ["jsonl", "parquet"])
+    def test_run_resumes_after_interrupt(self, config_manager, documents, input_files, tmp_path, input_format, output_format):
+        """Test that a crashed run resumes after its last complete part."""
+        input_path = input_files[input_format]
+        output_dir = str(tmp_path / f"out_{input_format}_{output_format}")
+        expected = [(str(d['id']), d['content'].split()[0]) for d in documents if d['content']]
+        
+        with pytest.raises(RuntimeError):
+            DocumentPipeline(StubExtractor(fail_after=10), config_manager).run(
+                input_path, output_dir, output_format=output_format
+            )
+        with open(os.path.join(output_dir, "_checkpoint.json")) as file:
+            checkpoint = json.load(file)
+        assert checkpoint['parts'] == 2
+        assert checkpoint['documents'] == 8
+        assert not checkpoint['complete']
+        
+        # Leftovers of the crashed part are discarded on resume
+        with open(os.path.join(output_dir, f"part-00002.{output_format}"), 'w') as file:
+            file.write("partial")
+        
+        extractor = StubExtractor()
+        result = DocumentPipeline(extractor, config_manager).run(input_path, output_dir, output_format=output_format)
+        
+        assert extractor.extracted == len(expected) - 8
+        assert result['complete']
+        assert result['documents'] == len(expected)
+        assert result['parts'] == 5
+        assert self.read_results(output_dir, output_format) == expected
+        
+        # A complete run is not repeated
+        extractor = StubExtractor()
+        DocumentPipeline(extractor, config_manager).run(input_path, output_dir, output_format=output_format)
+        assert extractor.extracted == 0
+    
+    def test_run_rejects_other_input_and_formats(self, config_manager, input_files, tmp_path):
+        """Test validation of formats, checkpoints and non-empty output directories."""
+        output_dir = str(tmp_path / "out")
+        pipeline = DocumentPipeline(StubExtractor(), config_manager)
+        pipeline.run(input_files['jsonl'], output_dir)
+        
+        with pytest.raises(ValueError):
+            pipeline.run(input_files['parquet'], output_dir)
+        with pytest.raises(ValueError):
+            pipeline.run(input_files['jsonl'], output_dir, resume=False)
+        with pytest.raises(ValueError):
+            pipeline.run(input_files['jsonl'], str(tmp_path / "other"), output_format="csv")
+        with pytest.raises(ValueError):
+            pipeline.run(str(tmp_path / "documents.csv"), str(tmp_path / "other"))
\ No newline at end of file
@@ -0,0 +1,120 @@
+"""Unit tests for EmbeddingCache module."""
+
+import pytest
+import numpy as np
+from types import SimpleNamespace
+from unittest.mock import Mock
+from src.api_clients import OpenAIClient, EmbeddingCache
+from src.config import ConfigManager
+
+
+def fake_embeddings_create(model, input):
+    """Embed each text as [length, first code point], returned out of order."""
+    data = [
+        SimpleNamespace(index=index, embedding=[float(len(text)), float(ord(text[0]))])
+        for index, text in enumerate(input)
+    ]
+    return SimpleNamespace(data=data[::-1], usage=None)
+
+
+class TestEmbeddingCache:
+    """Test cases for EmbeddingCache class."""
+    
+    def test_vectors_persist_per_model(self, tmp_path):
+        """Test that vectors round-trip as float32 and are keyed by model."""
+        path = str(tmp_path / "cache" / "embeddings.sqlite")
+        key = EmbeddingCache.text_hash("hello")
+        EmbeddingCache(path).set_many("small", {key: [0.5, 1.5]})
+        
+        cache = EmbeddingCache(path)
+        found = cache.get_many("small", [key, EmbeddingCache.text_hash("other")])
+        
+        assert list(found) == [key]
+        assert found[key].dtype == np.float32
+        np.testing.assert_array_equal(found[key], [0.5, 1.5])
+        assert cache.get_many("large", [key]) == {}
+        assert cache.stats() == {"entries": 1, "hits": 1, "misses": 2}
+    
+    def test_lookup_beyond_parameter_limit(self, tmp_path):
+        """Test that lookups are split below SQLite's host parameter limit."""
+        cache = EmbeddingCache(str(tmp_path / "embeddings.sqlite"))
+        hashes = [EmbeddingCache.text_hash(str(i)) for i in range(2000)]
+        cache.set_many("small", {text_hash: [float(i)] for i, text_hash in enumerate(hashes)})
+        
+        found = cache.get_many("small", hashes)
+        
+        assert len(found) == 2000
+        assert found[hashes[1999]][0] == 1999.0
+
+
+class TestOpenAIClientEmbeddings:
+    """Test cases for OpenAIClient.generate_embeddings."""
+    
+    @pytest.fixture
+    def make_client(self, tmp_path):
+        """Create OpenAIClients with a mocked embeddings API."""
+        def make_client(**overrides):
+            settings = {
+                'apis.openai.embedding_cache.enabled': True,
+                'apis.openai.embedding_cache.path': str(tmp_path / "embeddings.sqlite"),
+                **overrides
+            }
+            config = Mock(spec=ConfigManager)
+            config.get.side_effect = lambda key, default=None: settings.get(key, default)
+            config.get_api_key.return_value = "test_api_key"
+            client = OpenAIClient(config)
+            client.client = Mock()
+            client.client.embeddings.create.side_effect = fake_embeddings_create
+            return client
+        return make_client
+    
+    def requests(self, client):
+        """Inputs of every embeddings request, in call order."""
+        return [call.kwargs['input'] for call in client.client.embeddings.create.call_args_list]
+    
+    def test_duplicates_are_embedded_once_in_input_order(self, make_client):
+        """Test that repeated texts share one request slot but keep their positions."""
+        client = make_client()
+        
+        matrix = client.generate_embeddings(["bb", "a", "bb", "ccc"], as_numpy=True)
+        
+        assert self.requests(client) == [["bb", "a", "ccc"]]
+        assert matrix.dtype == np.float32
+        np.testing.assert_array_equal(matrix[:, 0], [2, 1, 2, 3])
+        assert client.generate_embeddings(["a", "bb"]) == [[1.0, 97.0], [2.0, 98.0]]
+    
+    def test_chunks_by_count_and_tokens(self, make_client):
+        """Test that requests respect the input count and token limits."""
+        client = make_client(**{
+            'apis.openai.embedding_cache.enabled': False,
+            'apis.openai.embedding_batch_size': 3,
+            'apis.openai.embedding_max_tokens_per_request': 10
+        })
+        # Estimated as 1, 1, 1, 1, 9 and 1 tokens
+        texts = ["a", "b", "c", "d", "e" * 32, "f"]
+        
+        matrix = client.generate_embeddings(texts, as_numpy=True)
+        
+        assert sorted(self.requests(client)) == [["a", "b", "c"], ["d", "e" * 32], ["f"]]
+        np.testing.assert_array_equal(matrix[:, 1], [ord(text[0]) for text in texts])
+    
+    def test_cached_vectors_skip_the_api(self, make_client):
+        """Test that only texts missing from the cache are requested, across clients."""
+        make_client().generate_embeddings(["a", "bb"])
+        client = make_client()
+        
+        vectors = client.generate_embeddings(["bb", "ccc", "a"])
+        client.generate_embeddings(["a"], use_cache=False)
+        client.generate_embeddings(["a"], model="other-model")
+        
+        assert self.requests(client) == [["ccc"], ["a"], ["a"]]
+        assert vectors == [[2.0, 98.0], [3.0, 99.0], [1.0, 97.0]]
+        assert client.embedding_cache.stats()["entries"] == 4
+    
+    def test_empty_input(self, make_client):
+        """Test that no texts means no request and an empty result."""
+        client = make_client()
+        
+        assert client.generate_embeddings([]) == []
+        assert client.generate_embeddings([], as_numpy=True).shape == (0, 0)
+        client.client.embeddings.create.assert_not_called()
\ No newline at end of file
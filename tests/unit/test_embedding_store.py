@@ -0,0 +1,124 @@
+"""Unit tests for EmbeddingStore module."""
+
+import json
+import os
+import pytest
+import numpy as np
+from src.utils import EmbeddingStore
+
+
+@pytest.fixture
+def vectors():
+    """Create random 8-dimensional vectors."""
+    return np.random.default_rng(0).normal(size=(200, 8)).astype(np.float32)
+
+
+@pytest.fixture
+def store(tmp_path, vectors):
+    """Create a store holding the vectors under ids v0 to v199."""
+    store = EmbeddingStore(str(tmp_path / "store"), dim=8)
+    store.add([f"v{i}" for i in range(len(vectors))], vectors)
+    return store
+
+
+def exact_neighbours(vectors, query, k):
+    """Indices of the k rows with the highest cosine similarity."""
+    normalized = vectors / np.linalg.norm(vectors, axis=1, keepdims=True)
+    return list(np.argsort(-(normalized @ (query / np.linalg.norm(query))))[:k])
+
+
+class TestEmbeddingStore:
+    """Test cases for EmbeddingStore class."""
+    
+    def test_search_matches_brute_force(self, store, vectors):
+        """Test exact search against a brute-force cosine ranking."""
+        results = store.search(vectors[:3], k=5)
+        
+        for query, matches in zip(vectors[:3], results):
+            assert [row_id for row_id, _ in matches] == [f"v{i}" for i in exact_neighbours(vectors, query, 5)]
+        assert results[0][0][1] == pytest.approx(1.0)
+    
+    def test_replace_delete_and_reopen(self, store, vectors, tmp_path):
+        """Test that replacements and tombstones survive reopening."""
+        store.add(["v0"], vectors[1])
+        assert store.delete(["v2", "v2", "missing"]) == 1
+        
+        reopened = EmbeddingStore(str(tmp_path / "store"))
+        
+        assert len(reopened) == 199
+        assert reopened.get("v2") is None
+        np.testing.assert_allclose(reopened.get("v0"), reopened.get("v1"), rtol=1e-6)
+        assert "v2" not in [row_id for row_id, _ in reopened.search(vectors[2], k=200)[0]]
+    
+    def test_duplicate_ids_in_one_batch_keep_last(self, tmp_path, vectors):
+        """Test that a repeated id in one add leaves a single live row."""
+        store = EmbeddingStore(str(tmp_path / "store"), dim=8)
+        store.add(["a", "b", "a"], vectors[:3])
+        
+        assert len(store) == 2
+        assert len(store.ids) == 2
+        np.testing.assert_allclose(store.get("a"), vectors[2] / np.linalg.norm(vectors[2]), rtol=1e-6)
+        assert [row_id for row_id, _ in store.search(vectors[0], k=5)[0]].count("a") == 1
+    
+    def test_add_appends_without_rewriting(self, store, vectors, tmp_path):
+        """Test that an add appends to the data files instead of rewriting them."""
+        path = str(tmp_path / "store")
+        ids_path = os.path.join(path, "ids.0.jsonl")
+        with open(ids_path, 'rb') as file:
+            before = file.read()
+        
+        store.add(["new"], vectors[0])
+        
+        with open(ids_path, 'rb') as file:
+            after = file.read()
+        assert after == before + b'"new"\n'
+    
+    def test_uncommitted_append_is_discarded(self, store, vectors, tmp_path):
+        """Test that bytes written after the last commit are truncated on open."""
+        path = str(tmp_path / "store")
+        with open(os.path.join(path, "meta.json")) as file:
+            meta = json.load(file)
+        
+        # Simulate a crash after appending a batch but before committing it
+        with open(os.path.join(path, "vectors.0.f32"), 'ab') as file:
+            file.write(vectors[:2].tobytes())
+        with open(os.path.join(path, "ids.0.jsonl"), 'ab') as file:
+            file.write(b'"x"\n"y')
+        
+        reopened = EmbeddingStore(path)
+        
+        assert len(reopened.ids) == meta['rows'] == 200
+        assert os.path.getsize(os.path.join(path, "vectors.0.f32")) == 200 * 8 * 4
+        reopened.add(["z"], vectors[0])
+        assert EmbeddingStore(path).ids[-1] == "z"
+    
+    def test_compact(self, store, vectors, tmp_path):
+        """Test that compaction drops deleted rows and switches file generation."""
+        store.delete([f"v{i}" for i in range(0, 200, 2)])
+        
+        assert store.compact() == 100
+        assert store.compact() == 0
+        
+        reopened = EmbeddingStore(str(tmp_path / "store"))
+        assert reopened.ids == [f"v{i}" for i in range(1, 200, 2)]
+        assert not os.path.exists(str(tmp_path / "store" / "vectors.0.f32"))
+        np.testing.assert_allclose(reopened.get("v1"), vectors[1] / np.linalg.norm(vectors[1]), rtol=1e-6)
+    
+    def test_approximate_search(self, store, vectors):
+        """Test IVF search recall and that rows added after the build are found."""
+        store.build_index(n_lists=4)
+        store.add(["late"], vectors[5] * 3)
+        
+        results = store.search(vectors[:20], k=5, approximate=True, n_probe=4)
+        for query, matches in zip(vectors[:20], results):
+            expected = [f"v{i}" for i in exact_neighbours(vectors, query, 5)]
+            assert [row_id for row_id, _ in matches if row_id != "late"][:4] == expected[:4]
+        assert "late" in [row_id for row_id, _ in store.search(vectors[5], k=2, approximate=True, n_probe=1)[0]]
+    
+    def test_build_index_on_empty_store(self, tmp_path):
+        """Test that indexing an empty store fails with a clear error."""
+        store = EmbeddingStore(str(tmp_path / "store"), dim=8)
+        
+        with pytest.raises(ValueError):
+            store.build_index()
+        assert store.search(np.ones(8), k=3) == [[]]
\ No newline at end of file
@@ -0,0 +1,85 @@
+"""Unit tests for EntityExtractor module."""
+
+import pytest
+import spacy
+from unittest.mock import Mock, patch
+from src.config import ConfigManager
+from src.entity_extraction import EntityExtractor
+from src.utils import DocumentCache
+
+
+@pytest.fixture
+def nlp():
+    """Create a blank English pipeline that tags products and organizations."""
+    nlp = spacy.blank("en")
+    nlp.add_pipe("sentencizer")
+    ruler = nlp.add_pipe("entity_ruler")
+    ruler.add_patterns([
+        {"label": "PRODUCT", "pattern": "Elasticsearch"},
+        {"label": "PRODUCT", "pattern": "Kibana"},
+        {"label": "ORG", "pattern": "Elastic"}
+    ])
+    return nlp
+
+
+@pytest.fixture
+def config_manager():
+    """Create a mock config manager."""
+    config = Mock(spec=ConfigManager)
+    config.get.side_effect = lambda key, default=None: default
+    return config
+
+
+@pytest.fixture
+def extractor(config_manager, nlp):
+    """Create an EntityExtractor over the blank pipeline with mocked API clients."""
+    with patch('src.entity_extraction.entity_extractor.OpenAIClient'):
+        return EntityExtractor(config_manager, document_cache=DocumentCache(nlp))
+
+
+class TestEntityExtractor:
+    """Test cases for EntityExtractor class."""
+    
+    def test_batched_extraction_matches_single_documents(self, extractor):
+        """Test that batched parsing gives the same entities, in input order."""
+        documents = [
+            {'id': f"doc{i}", 'content': text}
+            for i, text in enumerate([
+                "Elastic builds Elasticsearch.",
+                "Kibana reads from Elasticsearch.",
+                "",
+                "Nothing to see here.",
+                "Elastic ships Kibana."
+            ])
+        ]
+        
+        batched = list(extractor.iter_entities_from_documents(documents, batch_size=2))
+        
+        assert [doc_id for doc_id, _ in batched] == ["doc0", "doc1", "doc3", "doc4"]
+        for doc_id, entities in batched:
+            text = next(d['content'] for d in documents if d['id'] == doc_id)
+            assert entities == extractor.extract_entities(text)
+        assert [e.text for e in batched[0][1]] == ["Elastic", "Elasticsearch"]
+    
+    def test_batched_extraction_is_lazy(self, extractor):
+        """Test that results stream before the whole input is read."""
+        pulled = []
+        
+        def documents():
+            for i in range(1000):
+                pulled.append(i)
+                yield {'id': str(i), 'content': "Kibana"}
+        
+        results = extractor.iter_entities_from_documents(documents(), batch_size=4)
+        assert next(results)[0] == "0"
+        assert len(pulled) < 1000
+    
+    def test_extract_entities_from_documents_returns_mapping(self, extractor):
+        """Test the dictionary API and the fallback ID of documents without one."""
+        results = extractor.extract_entities_from_documents([
+            {'id': "a", 'content': "Elastic"},
+            {'content': "Kibana"}
+        ])
+        
+        assert list(results)[0] == "a"
+        assert [e.label for e in results[str(hash("Kibana"))]] == ["PRODUCT"]
\ No newline at end of file
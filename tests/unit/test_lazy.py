@@ -0,0 +1,37 @@
+"""Unit tests for lazy package exports."""
+
+import importlib
+import pytest
+
+
+PACKAGES = [
+    "src.api_clients",
+    "src.config",
+    "src.entity_extraction",
+    "src.persona_builder",
+    "src.query_classifier",
+    "src.semantic_clustering",
+    "src.utils"
+]
+
+
+class TestLazyExports:
+    """Test cases for lazy_exports."""
+    
+    @pytest.mark.parametrize("package", PACKAGES)
+    def test_every_export_resolves(self, package):
+        """Test that star imports work and every name in __all__ can be loaded."""
+        module = importlib.import_module(package)
+        namespace = {}
+        
+        exec(f"from {package} import *", namespace)
+        
+        assert set(module.__all__) <= set(namespace)
+        assert set(module.__all__) <= set(dir(module))
+    
+    def test_unknown_name(self):
+        """Test that names outside the export map raise AttributeError."""
+        module = importlib.import_module("src.utils")
+        
+        with pytest.raises(AttributeError):
+            module.DataProcessor
\ No newline at end of file
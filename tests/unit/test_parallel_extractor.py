@@ -0,0 +1,163 @@
+"""Unit tests for ParallelEntityExtractor module."""
+
+import gc
+import multiprocessing
+import pytest
+import spacy
+from concurrent.futures import Future
+from unittest.mock import Mock, patch
+from src.config import ConfigManager
+from src.entity_extraction import parallel_extractor
+from src.entity_extraction.parallel_extractor import ParallelEntityExtractor
+from src.utils import model_registry
+
+
+@pytest.fixture
+def model_path(tmp_path):
+    """Save a blank English pipeline that tags product names as entities."""
+    nlp = spacy.blank("en")
+    ruler = nlp.add_pipe("entity_ruler")
+    ruler.add_patterns([
+        {"label": "PRODUCT", "pattern": "Elasticsearch"},
+        {"label": "PRODUCT", "pattern": "Kibana"}
+    ])
+    path = tmp_path / "model"
+    nlp.to_disk(path)
+    yield str(path)
+    model_registry.clear_spacy_models()
+
+
+@pytest.fixture
+def config_manager(model_path):
+    """Create a mock config manager using the saved pipeline."""
+    config = Mock(spec=ConfigManager)
+    settings = {'entity_extraction.spacy_model': model_path}
+    config.get.side_effect = lambda key, default=None: settings.get(key, default)
+    return config
+
+
+def test_preload_freezes_collector_only_while_pool_runs(config_manager, model_path):
+    """Test that the parent unfreezes the collector once extraction ends."""
+    documents = [{'id': str(i), 'content': f"Kibana {i}"} for i in range(6)]
+    extractor = ParallelEntityExtractor(config_manager, n_workers=2, chunk_size=2)
+    gc.unfreeze()
+    
+    results = extractor.iter_entities_from_documents(documents)
+    first = next(results)
+    if multiprocessing.get_start_method() == "fork":
+        assert gc.get_freeze_count() > 0
+        assert model_path in {key[0] for key in model_registry._models}
+    rest = list(results)
+    
+    assert gc.get_freeze_count() == 0
+    assert [doc_id for doc_id, _ in [first] + rest] == [str(i) for i in range(6)]
+    assert first[1][0].text == "Kibana"
+
+
+def test_preload_spacy_model_does_not_freeze(model_path):
+    """Test that preloading shares the registered pipeline without freezing."""
+    gc.unfreeze()
+    
+    nlp = model_registry.preload_spacy_model(model_path)
+    
+    assert model_registry.load_spacy_model(model_path) is nlp
+    assert gc.get_freeze_count() == 0
+
+
+class InlinePool:
+    """In-process stand-in for ProcessPoolExecutor that tracks unmerged shards."""
+    
+    def __init__(self, max_workers, initializer, initargs):
+        initializer(*initargs)
+        self.submitted = []
+        self.in_flight = 0
+        self.max_in_flight = 0
+        self.max_in_flight_chars = 0
+        self.in_flight_chars = 0
+    
+    def __enter__(self):
+        return self
+    
+    def __exit__(self, *exc_info):
+        return False
+    
+    def submit(self, function, chunk):
+        pool = self
+        chars = sum(len(text) for _, text in chunk)
+        
+        class TrackedFuture(Future):
+            def result(self, timeout=None):
+                pool.in_flight -= 1
+                pool.in_flight_chars -= chars
+                return super().result(timeout)
+        
+        future = TrackedFuture()
+        future.set_result(function(chunk))
+        self.submitted.append([doc_id for doc_id, _ in chunk])
+        self.in_flight += 1
+        self.in_flight_chars += chars
+        self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        self.max_in_flight_chars = max(self.max_in_flight_chars, self.in_flight_chars)
+        return future
+
+
+def run_inline(extractor, documents):
+    """Run extraction through an InlinePool and return (results, pool)."""
+    pools = []
+    
+    def make_pool(**kwargs):
+        pools.append(InlinePool(**kwargs))
+        return pools[-1]
+    
+    with patch.object(parallel_extractor, 'ProcessPoolExecutor', side_effect=make_pool):
+        results = list(extractor.iter_entities_from_documents(documents))
+    return results, pools[0]
+
+
+def test_shards_skip_empty_documents_and_keep_order(config_manager):
+    """Test sharding by chunk_size and merging results in input order."""
+    documents = [{'id': str(i), 'content': "Elasticsearch" if i % 3 else ""} for i in range(20)]
+    extractor = ParallelEntityExtractor(config_manager, n_workers=2, chunk_size=4)
+    extractor.preload_model = False
+    
+    results, pool = run_inline(extractor, documents)
+    
+    expected = [str(i) for i in range(20) if i % 3]
+    assert [doc_id for doc_id, _ in results] == expected
+    assert [len(shard) for shard in pool.submitted] == [4, 4, 4, 1]
+    assert all(entities[0].label == "PRODUCT" for _, entities in results)
+
+
+def test_in_flight_limits(config_manager):
+    """Test that submission waits for merges at the shard and character limits."""
+    documents = [{'id': str(i), 'content': "Kibana " * (1 + i % 4)} for i in range(40)]
+    extractor = ParallelEntityExtractor(
+        config_manager,
+        n_workers=2,
+        chunk_size=2,
+        max_in_flight_chunks=3,
+        max_in_flight_chars=60
+    )
+    extractor.preload_model = False
+    
+    results, pool = run_inline(extractor, documents)
+    
+    assert [doc_id for doc_id, _ in results] == [str(i) for i in range(40)]
+    assert pool.max_in_flight <= 3
+    assert pool.max_in_flight_chars <= 60
+    assert pool.in_flight == 0
+
+
+def test_process_pool_merges_in_submission_order(config_manager):
+    """Test ordering when shards of very different sizes finish out of order."""
+    documents = [
+        {'id': str(i), 'content': ("Elasticsearch and Kibana. " * 2000) if i % 5 == 0 else "Kibana"}
+        for i in range(30)
+    ]
+    extractor = ParallelEntityExtractor(config_manager, n_workers=3, chunk_size=1)
+    
+    results = extractor.extract_entities_from_documents(documents)
+    
+    assert list(results) == [str(i) for i in range(30)]
+    assert len(results['0']) == 4000
+    assert [e.text for e in results['1']] == ["Kibana"]
\ No newline at end of file
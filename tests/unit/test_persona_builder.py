@@ -1,10 +1,14 @@
 """Unit tests for PersonaBuilder module."""
 
+import json
+import time
 import pytest
+import numpy as np
 import pandas as pd
 from unittest.mock import Mock, patch
+from src.api_clients import ResponseCache
 from src.config import ConfigManager
-from src.persona_builder import PersonaBuilder, Persona
+from src.persona_builder import PersonaBuilder, Persona, ThemeMatcher, ThemeDiscovery
 
 
 class TestPersonaBuilder:
@@ -14,14 +18,14 @@ class TestPersonaBuilder:
     def config_manager(self):
         """Create a mock config manager."""
         config = Mock(spec=ConfigManager)
-        config.get.return_value = "test_value"
+        config.get.side_effect = lambda key, default=None: default
         config.get_api_key.return_value = "test_api_key"
         return config
     
     @pytest.fixture
     def persona_builder(self, config_manager):
         """Create a PersonaBuilder instance."""
-        with patch('src.persona_builder.OpenAIClient'):
+        with patch('src.persona_builder.persona_builder.OpenAIClient'):
             return PersonaBuilder(config_manager)
     
     def test_persona_creation(self):
@@ -50,6 +54,8 @@ class TestPersonaBuilder:
     
     def test_analyze_persona_patterns(self, persona_builder):
         """Test analyzing persona patterns from data."""
+        persona_builder.min_pattern_frequency = 1
+        
         # Create test data
         customer_data = pd.DataFrame({
             'company_size': ['Startup', 'Enterprise', 'Startup'],
@@ -69,6 +75,99 @@ class TestPersonaBuilder:
         assert any(p['source'] == 'customer_data' for p in patterns)
         assert any(p['source'] == 'sales_feedback' for p in patterns)
     
+    def test_mine_persona_patterns(self, persona_builder):
+        """Test ranking frequent segments over configured dimensions."""
+        persona_builder.grouping_dimensions = ['company_size', 'industry', 'region']
+        persona_builder.min_pattern_frequency = 2
+        customer_data = pd.DataFrame({
+            'company_size': ['Startup'] * 3 + ['Enterprise'] * 4 + ['SMB'],
+            'industry': ['Technology'] * 3 + ['Finance'] * 4 + ['Retail'],
+            'region': ['EMEA'] * 3 + ['Americas'] * 4 + ['EMEA']
+        })
+        
+        patterns = persona_builder.mine_persona_patterns(customer_data)
+        
+        assert patterns['company_size'].tolist() == ['Enterprise', 'Startup']
+        assert patterns['region'].tolist() == ['Americas', 'EMEA']
+        assert patterns['frequency'].tolist() == [4, 3]
+        assert (patterns['source'] == 'customer_data').all()
+    
+    def test_build_from_data_streaming_matches_in_memory(self, persona_builder, tmp_path):
+        """Test that chunked ingestion finds the same patterns as a full load."""
+        customer_path = tmp_path / "customers.csv"
+        sales_path = tmp_path / "sales.csv"
+        pd.DataFrame({
+            'company_size': ['Startup'] * 6 + ['Enterprise'] * 5 + ['SMB'] * 2,
+            'industry': ['Technology'] * 6 + ['Finance'] * 5 + ['Retail'] * 2,
+            'role': ['Developer'] * 13
+        }).to_csv(customer_path, index=False)
+        pd.DataFrame({
+            'pain_points': ['Performance'] * 3 + ['Cost'] * 2 + ['Scaling']
+        }).to_csv(sales_path, index=False)
+        
+        with patch.object(persona_builder, '_generate_persona_from_pattern', side_effect=lambda p: p):
+            in_memory = persona_builder.build_from_data(str(customer_path), str(sales_path))
+            streamed = persona_builder.build_from_data(str(customer_path), str(sales_path), chunksize=4)
+        
+        assert streamed == in_memory
+        assert [p['company_size'] for p in streamed if p['source'] == 'customer_data'] == ['Startup', 'Enterprise']
+        assert [p['pain_point'] for p in streamed if p['source'] == 'sales_feedback'][0] == 'Performance'
+    
+    def test_build_from_data_streaming_numeric_dimension(self, persona_builder, tmp_path):
+        """Test that numeric grouping columns keep their type when streamed."""
+        persona_builder.grouping_dimensions = ['company_size', 'seats']
+        customer_path = tmp_path / "customers.csv"
+        pd.DataFrame({
+            'company_size': ['Startup'] * 6 + ['Enterprise'] * 5,
+            'seats': [10] * 6 + [500] * 5
+        }).to_csv(customer_path, index=False)
+        
+        with patch.object(persona_builder, '_generate_persona_from_pattern', side_effect=lambda p: p):
+            in_memory = persona_builder.build_from_data(str(customer_path))
+            streamed = persona_builder.build_from_data(str(customer_path), chunksize=4)
+        
+        assert streamed == in_memory
+        assert [p['seats'] for p in streamed] == [10, 500]
+    
+    def test_numeric_dimension_with_sales_feedback(self, persona_builder, tmp_path):
+        """Test that sales rows do not upcast integer dimensions to floats."""
+        persona_builder.grouping_dimensions = ['company_size', 'seats']
+        customer_path = tmp_path / "customers.csv"
+        sales_path = tmp_path / "sales.csv"
+        pd.DataFrame({
+            'company_size': ['Startup'] * 6 + ['Enterprise'] * 5,
+            'seats': [10] * 6 + [500] * 5
+        }).to_csv(customer_path, index=False)
+        pd.DataFrame({'pain_points': ['Performance'] * 3}).to_csv(sales_path, index=False)
+        
+        with patch.object(persona_builder, '_generate_persona_from_pattern', side_effect=lambda p: p):
+            without_sales = persona_builder.build_from_data(str(customer_path))
+            in_memory = persona_builder.build_from_data(str(customer_path), str(sales_path))
+            streamed = persona_builder.build_from_data(str(customer_path), str(sales_path), chunksize=4)
+        
+        assert streamed == in_memory
+        assert in_memory[:2] == without_sales
+        assert [repr(p['seats']) for p in in_memory[:2]] == ['10', '500']
+        assert in_memory[2] == {'pain_point': 'Performance', 'frequency': 3, 'source': 'sales_feedback'}
+    
+    def test_build_from_data_parquet(self, persona_builder, tmp_path):
+        """Test streaming ingestion of Parquet files."""
+        customer_path = tmp_path / "customers.parquet"
+        pd.DataFrame({
+            'company_size': ['Startup'] * 7,
+            'industry': ['Technology'] * 7
+        }).to_parquet(customer_path)
+        
+        with patch.object(persona_builder, '_generate_persona_from_pattern', side_effect=lambda p: p):
+            patterns = persona_builder.build_from_data(str(customer_path), chunksize=3)
+        
+        assert patterns == [{
+            'company_size': 'Startup',
+            'industry': 'Technology',
+            'frequency': 7,
+            'source': 'customer_data'
+        }]
+    
     def test_extract_themes(self, persona_builder):
         """Test extracting themes from discussions."""
         discussions = [
@@ -87,8 +186,68 @@ class TestPersonaBuilder:
         assert len(themes) > 0
         assert any('performance' in theme['theme'] for theme in themes)
     
-    @patch('src.persona_builder.OpenAIClient')
-    def test_generate_persona_from_pattern(self, mock_openai, persona_builder):
+    def test_theme_matcher(self):
+        """Test word-start keyword matching and streaming theme counts."""
+        matcher = ThemeMatcher({
+            'integration': ['api', 'rate limit'],
+            'limits': ['limits'],
+            'performance': ['slow']
+        })
+        
+        assert matcher.match("Rapid indexing is SLOW") == ['performance']
+        assert matcher.match("Our APIs hit the rate limits") == ['integration', 'limits']
+        
+        discussions = iter([
+            {'content': 'api keys'},
+            {'content': 'slow api'},
+            {'content': None}
+        ])
+        assert matcher.count_themes(discussions) == {'integration': 2, 'limits': 0, 'performance': 1}
+    
+    def test_theme_discovery(self, config_manager):
+        """Test clustering discussion embeddings with one label call per theme."""
+        topics = {'cost': np.eye(8)[0], 'security': np.eye(8)[1]}
+        openai_client = Mock()
+        openai_client.generate_embeddings.side_effect = lambda texts, model, as_numpy: np.array(
+            [topics[text.split()[0]] + 0.01 * (i % 3) for i, text in enumerate(texts)], dtype=np.float32
+        )
+        openai_client.generate_text.side_effect = lambda prompt: "Cost" if "- cost" in prompt else "Security"
+        discussions = (
+            {'content': f"{topic} question {i}", 'engagement_score': 10}
+            for i, topic in enumerate(['cost'] * 12 + ['security'] * 8)
+        )
+        
+        discovery = ThemeDiscovery(config_manager, openai_client)
+        themes = discovery.discover(discussions, n_themes=2)
+        
+        assert [theme['theme'] for theme in themes] == ['Cost', 'Security']
+        assert [theme['size'] for theme in themes] == [12, 8]
+        assert all(d['content'].startswith('security') for d in themes[1]['discussions'])
+        assert openai_client.generate_text.call_count == 2
+        assert {stat['stage'] for stat in discovery.get_stage_stats()} >= {'embed', 'cluster', 'assign', 'label'}
+    
+    def test_theme_discovery_spools_to_work_dir(self, config_manager, tmp_path):
+        """Test that embeddings and spool offsets are kept on disk, one row per discussion."""
+        openai_client = Mock()
+        openai_client.generate_embeddings.side_effect = lambda texts, model, as_numpy: np.array(
+            [np.eye(4)[len(text) % 2] + 0.01 * i for i, text in enumerate(texts)], dtype=np.float32
+        )
+        openai_client.generate_text.return_value = "Label"
+        discussions = [{'content': "é" * (i % 5 + 1), 'engagement_score': 10} for i in range(9)]
+        
+        discovery = ThemeDiscovery(config_manager, openai_client)
+        discovery.batch_size = 4
+        themes = discovery.discover(iter(discussions), n_themes=2, work_dir=str(tmp_path / "work"))
+        
+        offsets = np.fromfile(tmp_path / "work" / "offsets.i64", dtype=np.int64)
+        spool = (tmp_path / "work" / "discussions.jsonl").read_bytes()
+        assert (tmp_path / "work" / "embeddings.f32").stat().st_size == 9 * 4 * 4
+        assert [spool[offset:].split(b"\n", 1)[0].decode() for offset in offsets] == [
+            json.dumps(discussion) for discussion in discussions
+        ]
+        assert themes and all(theme['discussions'] for theme in themes)
+    
+    def test_generate_persona_from_pattern(self, persona_builder):
         """Test generating persona from pattern."""
         # Mock OpenAI response
         mock_response = {
@@ -108,7 +267,7 @@ class TestPersonaBuilder:
             'llm_prompts': ['How to optimize?']
         }
         
-        mock_openai.return_value.generate_text.return_value = str(mock_response)
+        persona_builder.openai_client.generate_text.return_value = json.dumps(mock_response)
         
         pattern = {
             'company_size': 'Mid-market',
@@ -119,8 +278,107 @@ class TestPersonaBuilder:
         persona = persona_builder._generate_persona_from_pattern(pattern)
         
         assert isinstance(persona, Persona)
+        assert persona.name == 'Test Persona'
         assert persona.company_size == 'Mid-market'
         assert persona.industry == 'Technology'
+        
+        persona_builder.openai_client.generate_text.return_value = str(mock_response)
+        with pytest.raises(ValueError):
+            persona_builder._generate_persona_from_pattern(pattern)
+    
+    def test_generate_personas_preserves_order_and_caches(self, persona_builder, tmp_path):
+        """Test concurrent generation order and persona reuse across runs."""
+        persona_builder.persona_cache = ResponseCache(str(tmp_path / "personas.sqlite"))
+        patterns = [
+            {'company_size': size, 'industry': 'Technology', 'frequency': 5 + i, 'source': 'customer_data'}
+            for i, size in enumerate(['Startup', 'SMB', 'Mid-market', 'Enterprise'])
+        ]
+        
+        def generate(pattern):
+            time.sleep(0.05 * (4 - len(pattern['company_size']) % 4))
+            return Persona(
+                name=f"{pattern['company_size']} Engineer",
+                role="Engineer",
+                company_size=pattern['company_size'],
+                industry=pattern['industry'],
+                pain_points=[],
+                goals=[],
+                use_cases=[],
+                decision_context="",
+                technical_level="Intermediate",
+                budget_range="Medium",
+                timeline="Medium",
+                preferred_content_formats=[],
+                search_behavior={},
+                llm_prompts=[]
+            )
+        
+        generator = Mock(side_effect=generate)
+        personas = persona_builder._generate_personas(patterns, generator, persona_builder._pattern_cache_key)
+        
+        assert [p.company_size for p in personas] == ['Startup', 'SMB', 'Mid-market', 'Enterprise']
+        assert generator.call_count == 4
+        
+        # A new run with changed frequencies reuses the cached personas
+        for pattern in patterns:
+            pattern['frequency'] += 10
+        cached = persona_builder._generate_personas(patterns, generator, persona_builder._pattern_cache_key)
+        
+        assert cached == personas
+        assert generator.call_count == 4
+    
+    def test_cache_keys_cover_model_and_prompt(self, persona_builder):
+        """Test that changing the model or prompt template changes the cache keys."""
+        pattern = {'company_size': 'Startup', 'industry': 'Technology', 'frequency': 5}
+        theme = {'theme': 'performance', 'discussions': [{'content': 'Slow queries'}]}
+        persona_builder.openai_client.model = "gpt-4"
+        keys = (persona_builder._pattern_cache_key(pattern), persona_builder._theme_cache_key(theme))
+        
+        assert keys == (persona_builder._pattern_cache_key(dict(pattern, frequency=9)), persona_builder._theme_cache_key(theme))
+        
+        persona_builder.openai_client.model = "gpt-4o"
+        assert persona_builder._pattern_cache_key(pattern) != keys[0]
+        assert persona_builder._theme_cache_key(theme) != keys[1]
+        
+        persona_builder.openai_client.model = "gpt-4"
+        with patch('src.persona_builder.persona_builder.PATTERN_PERSONA_PROMPT', "Persona for {pattern}"):
+            assert persona_builder._pattern_cache_key(pattern) != keys[0]
+        with patch('src.persona_builder.persona_builder.THEME_PERSONA_PROMPT', "Persona for {theme}"):
+            assert persona_builder._theme_cache_key(theme) != keys[1]
+    
+    def test_generate_personas_isolates_failures(self, persona_builder, tmp_path):
+        """Test that one failed generation falls back without aborting or being cached."""
+        persona_builder.persona_cache = ResponseCache(str(tmp_path / "personas.sqlite"))
+        patterns = [
+            {'company_size': size, 'industry': 'Technology', 'frequency': 5}
+            for size in ['Startup', 'SMB', 'Enterprise']
+        ]
+        responses = {
+            'Startup': json.dumps({'name': 'Sam', 'company_size': 'Startup'}),
+            'SMB': "not json"
+        }
+        
+        def generate_text(prompt):
+            size = prompt.split("'company_size': '")[1].split("'")[0]
+            if size == 'Enterprise':
+                raise ConnectionError("API unavailable")
+            return responses[size]
+        
+        persona_builder.openai_client.generate_text.side_effect = generate_text
+        personas = persona_builder._generate_personas(
+            patterns, persona_builder._generate_persona_from_pattern, persona_builder._pattern_cache_key
+        )
+        
+        assert [p.name for p in personas] == ['Sam', 'Default Persona', 'Default Persona']
+        assert [p.company_size for p in personas] == ['Startup', 'SMB', 'Enterprise']
+        assert persona_builder.persona_cache.stats()['entries'] == 1
+        
+        # A real persona that happens to share the placeholder's name is still cached
+        responses['SMB'] = json.dumps({'name': 'Default Persona', 'company_size': 'SMB'})
+        persona_builder._generate_personas(
+            patterns, persona_builder._generate_persona_from_pattern, persona_builder._pattern_cache_key
+        )
+        assert persona_builder.persona_cache.stats()['entries'] == 2
     
     def test_build_from_community_discussions(self, persona_builder):
         """Test building personas from community discussions."""
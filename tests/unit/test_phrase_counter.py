@@ -0,0 +1,90 @@
+"""Unit tests for PhraseCounter module."""
+
+import random
+from collections import Counter
+from itertools import count, islice
+from src.utils import PhraseCounter
+from src.utils.phrase_counter import iter_ngrams
+
+
+class TestIterNgrams:
+    """Test cases for iter_ngrams."""
+    
+    def test_order_and_lengths(self):
+        """Test that n-grams come out by last token, then by length."""
+        ngrams = list(iter_ngrams(["a", "b", "c"], min_length=1, max_length=2))
+        
+        assert ngrams == [("a",), ("b",), ("a", "b"), ("c",), ("b", "c")]
+    
+    def test_stop_words_only_trimmed_at_edges(self):
+        """Test that stop words may appear inside but not at either end."""
+        ngrams = list(iter_ngrams(["search", "of", "the", "index"], 2, 4, stop_words={"of", "the"}))
+        
+        assert ngrams == [("search", "of", "the", "index")]
+    
+    def test_breaks_are_never_spanned(self):
+        """Test that break tokens reset the window and are never emitted."""
+        ngrams = list(iter_ngrams(["a", "b", ",", "c", "d"], 2, 3, breaks={","}))
+        
+        assert ngrams == [("a", "b"), ("c", "d")]
+    
+    def test_consumes_tokens_lazily(self):
+        """Test that an unbounded token stream can be read incrementally."""
+        tokens = (f"t{i}" for i in count())
+        
+        assert list(islice(iter_ngrams(tokens, 2, 2), 3)) == [("t0", "t1"), ("t1", "t2"), ("t2", "t3")]
+
+
+class TestPhraseCounter:
+    """Test cases for PhraseCounter class."""
+    
+    def test_exact_counts_without_collisions(self):
+        """Test counts, totals and tie order on a small stream in a wide sketch."""
+        counter = PhraseCounter(top_k=3)
+        counter.update([("b", "c"), ("a", "b"), ("b", "c"), ("x", "y"), ("a", "b"), ("z", "z")], batch_size=2)
+        
+        assert counter.total == 6
+        assert counter.estimate(("b", "c")) == 2
+        assert counter.estimate(("never", "seen")) == 0
+        assert counter.most_common() == [("a b", 2), ("b c", 2), ("x y", 1)]
+        assert counter.most_common(1) == [("a b", 2)]
+    
+    def test_never_undercounts(self):
+        """Test that estimates in a tiny sketch are upper bounds of the true counts."""
+        rng = random.Random(0)
+        ngrams = [(f"w{rng.randrange(500)}",) for _ in range(5000)]
+        counter = PhraseCounter(top_k=10, width=16, depth=2)
+        counter.update(ngrams, batch_size=512)
+        
+        truth = Counter(ngrams)
+        assert all(counter.estimate(ngram) >= true_count for ngram, true_count in truth.items())
+        assert counter.total == 5000
+    
+    def test_candidates_are_bounded_and_keep_heavy_hitters(self):
+        """Test pruning keeps memory at 2 * top_k while the frequent phrases survive."""
+        rng = random.Random(0)
+        heavy = [(f"heavy{i}", "phrase") for i in range(5)]
+        ngrams = []
+        for _ in range(200):
+            ngrams.extend(heavy)
+            ngrams.extend((f"rare{rng.randrange(10 ** 6)}", "phrase") for _ in range(50))
+        rng.shuffle(ngrams)
+        
+        counter = PhraseCounter(top_k=5, width=2 ** 16)
+        sizes = []
+        for start in range(0, len(ngrams), 100):
+            counter.update(ngrams[start:start + 100], batch_size=20)
+            sizes.append(len(counter._candidates))
+        
+        assert max(sizes) <= 10
+        assert counter._floor > 0
+        assert sorted(phrase for phrase, _ in counter.most_common()) == sorted(" ".join(ngram) for ngram in heavy)
+        assert all(estimate >= 200 for _, estimate in counter.most_common())
+    
+    def test_admission_refreshes_existing_candidates(self):
+        """Test that a tracked phrase's estimate is updated as it keeps occurring."""
+        counter = PhraseCounter(top_k=2)
+        for _ in range(3):
+            counter.update([("a", "b"), ("c", "d")])
+        
+        assert counter.most_common() == [("a b", 3), ("c d", 3)]
\ No newline at end of file
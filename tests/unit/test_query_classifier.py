@@ -0,0 +1,256 @@
+"""Unit tests for QueryClassifier module."""
+
+import asyncio
+import json
+import threading
+import time
+import pytest
+import numpy as np
+from unittest.mock import Mock, patch
+from src.api_clients import AsyncOpenAIClient
+from src.config import ConfigManager
+from src.query_classifier import QueryClassifier, LocalQueryClassifier
+from src.query_classifier.query_classifier import QueryClassification
+
+
+TOPICS = {'install': np.eye(4)[0], 'compare': np.eye(4)[1], 'weather': np.eye(4)[3]}
+
+
+def embed(queries):
+    """Embed queries by their first word."""
+    return np.array([TOPICS[query.split()[0]] for query in queries])
+
+
+def labeled(query, intent, micro_intent, confidence=0.9):
+    """Create an LLM classification of a query."""
+    return QueryClassification(
+        query=query,
+        entity="elasticsearch",
+        intent=intent,
+        micro_intent=micro_intent,
+        confidence=confidence,
+        reasoning="",
+        suggested_content_format="guide",
+        target_audience="developers"
+    )
+
+
+class TestQueryClassifier:
+    """Test cases for QueryClassifier class."""
+    
+    @pytest.fixture
+    def config_manager(self):
+        """Create a mock config manager."""
+        config = Mock(spec=ConfigManager)
+        config.get.side_effect = lambda key, default=None: default
+        return config
+    
+    @pytest.fixture
+    def classifier(self, config_manager):
+        """Create a QueryClassifier with a mocked OpenAI client."""
+        with patch('src.query_classifier.query_classifier.OpenAIClient'):
+            return QueryClassifier(config_manager, embedding_function=embed)
+    
+    def test_classify_queries_hybrid_escalates_uncertain_queries(self, classifier):
+        """Test that only low-confidence local predictions go to the LLM."""
+        classifier.fit_local_classifier([
+            labeled("install elasticsearch", "informational", "tutorial"),
+            labeled("compare elasticsearch solr", "commercial", "comparison")
+        ])
+        
+        with patch.object(classifier, 'classify_queries_batch', side_effect=lambda qs: [labeled(q, "other", "reference") for q in qs]) as batch:
+            result = classifier.classify_queries_hybrid(["install on linux", "weather today", "compare opensearch"])
+        
+        batch.assert_called_once_with(["weather today"])
+        assert [c.micro_intent for c in result["classifications"]] == ["tutorial", "reference", "comparison"]
+        assert result["escalated"] == 1
+        assert result["escalation_rate"] == pytest.approx(1 / 3)
+    
+    def test_classify_queries_hybrid_empty(self, classifier):
+        """Test that an empty query list returns without embedding or escalating."""
+        classifier.fit_local_classifier([labeled("install elasticsearch", "informational", "tutorial")])
+        
+        with patch.object(classifier, 'classify_queries_batch') as batch:
+            result = classifier.classify_queries_hybrid([])
+        
+        batch.assert_not_called()
+        assert result["classifications"] == []
+        assert result["escalation_rate"] == 0.0
+        assert classifier.embed_queries([]).shape == (0, 0)
+    
+    def test_classify_queries_hybrid_without_local_model(self, classifier):
+        """Test that every query goes to the LLM before the local classifier is fitted."""
+        with patch.object(classifier, 'classify_queries_batch', side_effect=lambda qs: [labeled(q, "other", "reference") for q in qs]) as batch:
+            result = classifier.classify_queries_hybrid(["install on linux", "weather today"])
+        
+        batch.assert_called_once_with(["install on linux", "weather today"])
+        assert [c.query for c in result["classifications"]] == ["install on linux", "weather today"]
+        assert result["escalation_rate"] == 1.0
+    
+    def test_local_predict_searches_examples_in_blocks(self):
+        """Test that blocked nearest-example search matches a full similarity matrix."""
+        rng = np.random.default_rng(0)
+        examples = rng.normal(size=(50, 8))
+        queries = rng.normal(size=(23, 8))
+        local = LocalQueryClassifier(block_size=7).fit(
+            examples, [labeled(f"q{i}", "informational", "tutorial") for i in range(50)]
+        )
+        local.example_fields[:, 0] = [f"entity {i}" for i in range(50)]
+        
+        results = local.predict([f"query {i}" for i in range(23)], queries)
+        
+        similarities = (queries @ examples.T) / np.linalg.norm(examples, axis=1)
+        expected = similarities.argmax(axis=1)
+        assert [c.entity for c in results] == [f"entity {i}" for i in expected]
+    
+    def test_classify_queries_batch_uses_injected_client(self, classifier):
+        """Test concurrent sync classification through openai_client, in input order."""
+        active = []
+        peak = []
+        lock = threading.Lock()
+        
+        def generate_text(prompt):
+            with lock:
+                active.append(prompt)
+                peak.append(len(active))
+            time.sleep(0.02)
+            with lock:
+                active.remove(prompt)
+            query = prompt.split('Query: "')[1].split('"')[0]
+            return json.dumps({'entity': query, 'intent': 'informational', 'confidence': 0.9})
+        
+        classifier.openai_client.generate_text.side_effect = generate_text
+        queries = [f"query {i}" for i in range(12)]
+        
+        results = classifier.classify_queries_batch(queries, max_concurrency=3)
+        
+        assert [c.entity for c in results] == queries
+        assert classifier.openai_client.generate_text.call_count == 12
+        assert 1 < max(peak) <= 3
+        assert classifier.async_openai_client is None
+        assert classifier.classify_queries_batch([]) == []
+    
+    def test_classify_queries_batch_inside_running_loop(self, classifier):
+        """Test that the sync batch API works when called from a coroutine."""
+        classifier.openai_client.generate_text.return_value = json.dumps({'entity': 'es', 'confidence': 0.8})
+        
+        async def main():
+            return classifier.classify_queries_batch(["a", "b"])
+        
+        results = asyncio.run(main())
+        
+        assert [c.query for c in results] == ["a", "b"]
+        assert all(c.confidence == 0.8 and c.latency is not None for c in results)
+    
+    def test_aclassify_queries_batch_limits_concurrency(self, classifier):
+        """Test the async batch API's semaphore and its error fallback."""
+        active = []
+        peak = []
+        
+        async def generate_text(prompt):
+            active.append(prompt)
+            peak.append(len(active))
+            await asyncio.sleep(0.01)
+            active.remove(prompt)
+            if '"bad"' in prompt:
+                raise ValueError("no response")
+            return json.dumps({'entity': 'es', 'confidence': 0.9})
+        
+        classifier.async_openai_client = Mock()
+        classifier.async_openai_client.generate_text.side_effect = generate_text
+        
+        results = asyncio.run(classifier.aclassify_queries_batch(["a", "bad", "c", "d", "e"], max_concurrency=2))
+        
+        assert [c.query for c in results] == ["a", "bad", "c", "d", "e"]
+        assert [c.confidence for c in results] == [0.9, 0.0, 0.9, 0.9, 0.9]
+        assert max(peak) == 2
+    
+    
+    def test_parse_pack_response_validates_entries(self, classifier):
+        """Test that only well-formed, in-range, first-seen entries are kept."""
+        item = {'entity': 'es', 'intent': 'informational', 'micro_intent': 'tutorial'}
+        response = "Here you go:\n" + json.dumps([
+            dict(item, index=0),
+            dict(item, index="2"),
+            dict(item, index=0, entity='duplicate'),
+            dict(item, index=3),
+            dict(item, index=True),
+            {'index': 1, 'entity': 'es', 'intent': 'informational'},
+            "not an object"
+        ]) + "\nDone."
+        
+        parsed = classifier._parse_pack_response(response, 3)
+        
+        assert sorted(parsed) == [0, 2]
+        assert parsed[0]['entity'] == 'es'
+        assert classifier._parse_pack_response("[{broken", 3) == {}
+        assert classifier._parse_pack_response('{"index": 0}', 3) == {}
+        assert classifier._parse_pack_response(None, 3) == {}
+    
+    def test_classify_queries_packed_repacks_then_falls_back(self, classifier):
+        """Test that missing entries are re-packed once, then classified singly."""
+        def generate_text(prompt, max_tokens=None):
+            if 'Query: "' in prompt:
+                query = prompt.split('Query: "')[1].split('"')[0]
+                return json.dumps({'entity': f"single {query}", 'intent': 'informational', 'micro_intent': 'reference'})
+            queries = [line.split('"')[1] for line in prompt.splitlines() if line.strip()[:1].isdigit()]
+            # The model never answers for "q3" and drops the last query of the first pack
+            answered = [i for i, q in enumerate(queries) if q != "q3"]
+            if len(queries) == 3:
+                answered = answered[:-1]
+            return json.dumps([
+                {'index': i, 'entity': f"packed {queries[i]}", 'intent': 'commercial', 'micro_intent': 'comparison'}
+                for i in answered
+            ])
+        
+        classifier.openai_client.generate_text.side_effect = generate_text
+        
+        results = classifier.classify_queries_packed(["q0", "q1", "q2", "q3", "q4"], pack_size=3)
+        
+        assert [c.query for c in results] == ["q0", "q1", "q2", "q3", "q4"]
+        assert [c.entity for c in results] == ["packed q0", "packed q1", "packed q2", "single q3", "packed q4"]
+        pack_calls = [call for call in classifier.openai_client.generate_text.call_args_list if 'max_tokens' in call.kwargs]
+        assert [call.kwargs['max_tokens'] for call in pack_calls] == [450, 300, 300]
+
+class TestAsyncOpenAIClient:
+    """Test cases for AsyncOpenAIClient class."""
+    
+    def test_cache_calls_run_off_the_event_loop(self, tmp_path):
+        """Test that response cache reads and writes run in worker threads."""
+        settings = {
+            'apis.openai.cache.enabled': True,
+            'apis.openai.cache.path': str(tmp_path / "responses.sqlite")
+        }
+        config = Mock(spec=ConfigManager)
+        config.get.side_effect = lambda key, default=None: settings.get(key, default)
+        config.get_api_key.return_value = "test_api_key"
+        
+        async def create(**kwargs):
+            return Mock(choices=[Mock(message=Mock(content="answer"))], usage=None)
+        
+        async def main():
+            client = AsyncOpenAIClient(config)
+            client.client = Mock()
+            client.client.chat.completions.create.side_effect = create
+            
+            loop_thread = threading.get_ident()
+            cache_threads = []
+            for name in ('get', 'set'):
+                method = getattr(client.response_cache, name)
+                
+                def record(*args, method=method):
+                    cache_threads.append(threading.get_ident())
+                    return method(*args)
+                
+                setattr(client.response_cache, name, record)
+            
+            first = await client.generate_text("question")
+            second = await client.generate_text("question")
+            return client, first, second, loop_thread, cache_threads
+        
+        client, first, second, loop_thread, cache_threads = asyncio.run(main())
+        
+        assert first == second == "answer"
+        assert client.client.chat.completions.create.call_count == 1
+        assert len(cache_threads) == 3
+        assert loop_thread not in cache_threads
\ No newline at end of file
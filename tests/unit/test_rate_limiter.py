@@ -0,0 +1,123 @@
+"""Unit tests for the rate limiter and retry policy."""
+
+import asyncio
+import pytest
+from email.utils import format_datetime
+from datetime import datetime, timedelta, timezone
+from unittest.mock import Mock, patch
+from src.api_clients import RateLimiter, RetryPolicy
+
+
+class APIError(Exception):
+    """Error shaped like an openai.APIStatusError."""
+    
+    def __init__(self, status_code, headers=None):
+        super().__init__(f"status {status_code}")
+        self.status_code = status_code
+        self.response = Mock(headers=headers or {})
+
+
+class TestRateLimiter:
+    """Test cases for RateLimiter class."""
+    
+    def test_requests_are_spaced_at_the_refill_rate(self):
+        """Test that reservations beyond the burst wait one refill interval each."""
+        limiter = RateLimiter(requests_per_minute=60)
+        with patch('src.api_clients.rate_limiter.time.monotonic', return_value=100.0):
+            limiter.requests.updated = 100.0
+            waits = [limiter.reserve() for _ in range(62)]
+        
+        assert waits[:60] == [0.0] * 60
+        assert waits[60:] == pytest.approx([1.0, 2.0])
+    
+    def test_token_quota_and_usage_correction(self):
+        """Test that token reservations wait and reported usage refunds the estimate."""
+        limiter = RateLimiter(tokens_per_minute=600)
+        with patch('src.api_clients.rate_limiter.time.monotonic', return_value=0.0):
+            limiter.tokens.updated = 0.0
+            assert limiter.reserve(tokens=500) == 0.0
+            assert limiter.reserve(tokens=200) == pytest.approx(10.0)
+            limiter.record_usage(estimated=500, actual=100)
+            assert limiter.reserve(tokens=300) == 0.0
+    
+    def test_pause_holds_back_every_caller(self):
+        """Test that a pause applies to reservations made during it."""
+        limiter = RateLimiter(requests_per_minute=1000)
+        with patch('src.api_clients.rate_limiter.time.monotonic', return_value=50.0):
+            limiter.requests.updated = 50.0
+            limiter.pause(5)
+            limiter.pause(2)
+            assert limiter.reserve() == pytest.approx(5.0)
+    
+    def test_from_config_shares_one_limiter(self):
+        """Test that clients configured from one section share a limiter."""
+        config = Mock()
+        config.get.side_effect = lambda key, default=None: {'api.rate_limit.requests_per_minute': 123}.get(key, default)
+        
+        assert RateLimiter.from_config(config, "api.rate_limit") is RateLimiter.from_config(config, "api.rate_limit")
+        assert RateLimiter.from_config(config, "other.rate_limit") is None
+
+
+class TestRetryPolicy:
+    """Test cases for RetryPolicy class."""
+    
+    def test_retry_after_headers(self):
+        """Test that server wait hints are honored and capped."""
+        policy = RetryPolicy(max_delay=30)
+        in_ten_seconds = format_datetime(datetime.now(timezone.utc) + timedelta(seconds=10), usegmt=True)
+        
+        assert policy.delay(0, APIError(429, {'retry-after-ms': '1500'})) == 1.5
+        assert policy.delay(0, APIError(429, {'retry-after': '7'})) == 7.0
+        assert policy.delay(0, APIError(429, {'retry-after': '120'})) == 30
+        assert 8 <= policy.delay(0, APIError(429, {'retry-after': in_ten_seconds})) <= 10
+    
+    def test_exponential_backoff_with_jitter(self):
+        """Test backoff bounds without a server hint."""
+        policy = RetryPolicy(base_delay=1.0, max_delay=5.0)
+        
+        assert 0.5 <= policy.delay(0, APIError(500)) <= 1.0
+        assert 2.0 <= policy.delay(2, APIError(500)) <= 4.0
+        assert policy.delay(10, APIError(500)) <= 5.0
+    
+    def test_call_retries_retryable_errors_and_pauses_limiter(self):
+        """Test retrying a 429 after its Retry-After, pausing the shared limiter."""
+        policy = RetryPolicy(max_retries=3)
+        limiter = Mock(spec=RateLimiter)
+        request = Mock(side_effect=[APIError(429, {'retry-after': '2'}), APIError(503), "ok"])
+        
+        with patch('src.api_clients.rate_limiter.time.sleep') as sleep:
+            assert policy.call(request, "prompt", limiter=limiter, tokens=10, model="m") == "ok"
+        
+        request.assert_called_with("prompt", model="m")
+        assert limiter.acquire.call_count == 3
+        limiter.pause.assert_called_once_with(2.0)
+        assert sleep.call_args_list[0].args == (2.0,)
+    
+    def test_call_raises_non_retryable_and_exhausted_errors(self):
+        """Test that client errors are raised at once and retries are bounded."""
+        policy = RetryPolicy(max_retries=2, retryable_exceptions=(ConnectionError,))
+        
+        with patch('src.api_clients.rate_limiter.time.sleep'):
+            request = Mock(side_effect=APIError(400))
+            with pytest.raises(APIError):
+                policy.call(request)
+            assert request.call_count == 1
+            
+            request = Mock(side_effect=ConnectionError())
+            with pytest.raises(ConnectionError):
+                policy.call(request)
+            assert request.call_count == 3
+    
+    def test_acall_retries(self):
+        """Test the async variant waits with asyncio.sleep between attempts."""
+        policy = RetryPolicy(max_retries=1)
+        attempts = []
+        
+        async def request():
+            attempts.append(1)
+            if len(attempts) == 1:
+                raise APIError(429, {'retry-after-ms': '10'})
+            return "ok"
+        
+        assert asyncio.run(policy.acall(request)) == "ok"
+        assert len(attempts) == 2
\ No newline at end of file
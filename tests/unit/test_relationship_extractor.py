@@ -0,0 +1,91 @@
+"""Unit tests for RelationshipExtractor module."""
+
+import spacy
+from spacy.tokens import Doc
+from src.entity_extraction.entity_extractor import Entity
+from src.entity_extraction.relationship_extractor import RelationshipExtractor
+
+
+def entity(doc, text, occurrence=0):
+    """Create an entity for the n-th occurrence of text in a doc."""
+    start = -1
+    for _ in range(occurrence + 1):
+        start = doc.text.index(text, start + 1)
+    return Entity(text, "PRODUCT", start, start + len(text), 1.0)
+
+
+class TestRelationshipExtractor:
+    """Test cases for RelationshipExtractor class."""
+    
+    def setup_method(self):
+        """Create a blank pipeline with sentence splitting."""
+        self.nlp = spacy.blank("en")
+        self.nlp.add_pipe("sentencizer")
+        self.extractor = RelationshipExtractor(self.nlp)
+    
+    def test_co_occurrence_only_within_sentences(self):
+        """Test that pairs are formed per sentence, ordered by entity pair."""
+        doc = self.nlp("Kibana reads Elasticsearch. Logstash feeds Elasticsearch and Kibana. Beats.")
+        entities = [
+            entity(doc, "Kibana"),
+            entity(doc, "Elasticsearch"),
+            entity(doc, "Logstash"),
+            entity(doc, "Elasticsearch", 1),
+            entity(doc, "Kibana", 1),
+            entity(doc, "Beats")
+        ]
+        
+        relationships = self.extractor.extract(doc.text, entities, doc=doc)
+        
+        assert [(r['entity1'], r['entity2']) for r in relationships] == [
+            ("Kibana", "Elasticsearch"),
+            ("Logstash", "Elasticsearch"),
+            ("Logstash", "Kibana"),
+            ("Elasticsearch", "Kibana")
+        ]
+        assert relationships[0]['sentence'] == "Kibana reads Elasticsearch."
+        assert all(r['type'] == 'co_occurrence' for r in relationships)
+    
+    def test_bucket_by_sentence_skips_entities_across_boundaries(self):
+        """Test that an entity spanning two sentences belongs to neither."""
+        doc = self.nlp("Use Elastic. Cloud is hosted.")
+        sentences = list(doc.sents)
+        entities = [
+            Entity("Elastic. Cloud", "PRODUCT", 4, 18, 1.0),
+            Entity("Cloud", "PRODUCT", 13, 18, 1.0),
+            Entity("Use", "PRODUCT", 0, 3, 1.0)
+        ]
+        
+        assert RelationshipExtractor._bucket_by_sentence(sentences, entities) == {1: [1], 0: [2]}
+    
+    def test_dependency_relations(self):
+        """Test verbal dependency paths on a hand-annotated parse."""
+        words = ["Elastic", "builds", "Kibana", "."]
+        doc = Doc(
+            self.nlp.vocab,
+            words=words,
+            spaces=[True, True, False, False],
+            heads=[1, 1, 1, 1],
+            deps=["nsubj", "ROOT", "dobj", "punct"],
+            pos=["PROPN", "VERB", "PROPN", "PUNCT"],
+            lemmas=["Elastic", "build", "Kibana", "."]
+        )
+        entities = [entity(doc, "Elastic"), entity(doc, "Kibana")]
+        
+        relationships = self.extractor.extract(doc.text, entities, doc=doc, include_dependencies=True)
+        
+        assert [r['type'] for r in relationships] == ['co_occurrence', 'dependency']
+        assert relationships[1]['relation'] == "build"
+        assert relationships[1]['path'] == ["Elastic", "builds", "Kibana"]
+        
+        self.extractor.max_dependency_hops = 1
+        assert len(self.extractor.extract(doc.text, entities, doc=doc, include_dependencies=True)) == 1
+    
+    def test_unparsed_doc_is_reparsed(self):
+        """Test that a doc without sentence boundaries is parsed with the pipeline."""
+        text = "Kibana and Elasticsearch. Beats."
+        doc = spacy.blank("en")(text)
+        entities = [entity(doc, "Kibana"), entity(doc, "Elasticsearch"), entity(doc, "Beats")]
+        
+        assert len(self.extractor.extract(text, entities, doc=doc)) == 1
+        assert RelationshipExtractor().extract(text, entities, doc=doc) == []
\ No newline at end of file
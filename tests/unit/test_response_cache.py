@@ -0,0 +1,102 @@
+"""Unit tests for ResponseCache module."""
+
+import asyncio
+import pytest
+from unittest.mock import Mock, patch
+from src.api_clients import AsyncOpenAIClient, OpenAIClient, ResponseCache
+from src.config import ConfigManager
+
+
+class TestResponseCache:
+    """Test cases for ResponseCache class."""
+    
+    def test_make_key_ignores_parameter_order(self):
+        """Test that keys depend on parameter values, not their order."""
+        assert ResponseCache.make_key(model="gpt-4", prompt="hi") == ResponseCache.make_key(prompt="hi", model="gpt-4")
+        assert ResponseCache.make_key(model="gpt-4", prompt="hi") != ResponseCache.make_key(model="gpt-4", prompt="ho")
+    
+    def test_entries_persist_across_instances(self, tmp_path):
+        """Test that a second cache on the same file sees earlier responses."""
+        path = str(tmp_path / "cache" / "responses.sqlite")
+        ResponseCache(path).set("key", "value")
+        
+        cache = ResponseCache(path)
+        
+        assert cache.get("key") == "value"
+        assert cache.get("other") is None
+        assert cache.stats() == {"entries": 1, "size_bytes": 5, "hits": 1, "misses": 1, "hit_rate": 0.5}
+    
+    def test_ttl_expiry(self, tmp_path):
+        """Test that entries older than the TTL are deleted on lookup."""
+        cache = ResponseCache(str(tmp_path / "responses.sqlite"), ttl_seconds=60)
+        with patch('src.api_clients.response_cache.time.time', return_value=1000.0):
+            cache.set("key", "value")
+        with patch('src.api_clients.response_cache.time.time', return_value=1059.0):
+            assert cache.get("key") == "value"
+        with patch('src.api_clients.response_cache.time.time', return_value=1061.0):
+            assert cache.get("key") is None
+        
+        assert cache.stats()["entries"] == 0
+        assert cache.stats()["size_bytes"] == 0
+    
+    def test_lru_eviction_by_size(self, tmp_path):
+        """Test that the least recently used entries are evicted over the size limit."""
+        cache = ResponseCache(str(tmp_path / "responses.sqlite"), max_size_bytes=10)
+        clock = iter(range(100))
+        with patch('src.api_clients.response_cache.time.time', side_effect=lambda: float(next(clock))):
+            cache.set("a", "aaaa")
+            cache.set("b", "bbbb")
+            cache.get("a")
+            cache.set("c", "cccc")
+            
+            assert cache.get("b") is None
+            assert cache.get("a") == "aaaa"
+            assert cache.get("c") == "cccc"
+            
+            cache.set("a", "aaaaaaa")
+            assert cache.get("c") is None
+        
+        assert cache.stats()["size_bytes"] == 7
+
+
+class TestOpenAIClientCache:
+    """Test cases for response caching in OpenAIClient."""
+    
+    @pytest.fixture
+    def client(self, tmp_path):
+        """Create an OpenAIClient with caching enabled and a mocked API."""
+        settings = {
+            'apis.openai.cache.enabled': True,
+            'apis.openai.cache.path': str(tmp_path / "responses.sqlite")
+        }
+        config = Mock(spec=ConfigManager)
+        config.get.side_effect = lambda key, default=None: settings.get(key, default)
+        config.get_api_key.return_value = "test_api_key"
+        client = OpenAIClient(config)
+        client.client = Mock()
+        client.client.chat.completions.create.return_value = Mock(
+            choices=[Mock(message=Mock(content="answer"))],
+            usage=None
+        )
+        return client
+    
+    def test_repeated_prompt_is_served_from_cache(self, client):
+        """Test that only the first of two identical requests reaches the API."""
+        assert client.generate_text("question") == "answer"
+        assert client.generate_text("question") == "answer"
+        client.generate_text("question", temperature=0.1)
+        client.generate_text("question", use_cache=False)
+        
+        assert client.client.chat.completions.create.call_count == 3
+        assert client.cache_stats()["hits"] == 1    
+    def test_clients_with_the_same_path_share_entries(self, client):
+        """Test that sync and async clients on one cache path reuse each other's responses."""
+        client.generate_text("question")
+        other = AsyncOpenAIClient(client.config)
+        other.client = Mock()
+        
+        assert asyncio.run(other.generate_text("question")) == "answer"
+        
+        other.client.chat.completions.create.assert_not_called()
+        assert other.response_cache is not client.response_cache
+        assert other.cache_stats()["hits"] == 1
\ No newline at end of file
@@ -0,0 +1,62 @@
+"""Unit tests for SemanticClusterer module."""
+
+import pytest
+import numpy as np
+from unittest.mock import Mock
+from src.config import ConfigManager
+from src.semantic_clustering import SemanticClusterer
+
+
+def blobs(n_per_cluster, seed=0):
+    """Create points around three orthogonal directions."""
+    rng = np.random.default_rng(seed)
+    centers = np.eye(3, 6)
+    points = np.concatenate([center + 0.05 * rng.normal(size=(n_per_cluster, 6)) for center in centers])
+    return points.astype(np.float32), np.repeat(np.arange(3), n_per_cluster)
+
+
+class TestSemanticClusterer:
+    """Test cases for SemanticClusterer class."""
+    
+    @pytest.fixture
+    def config_manager(self):
+        """Create a mock config manager for three clusters."""
+        config = Mock(spec=ConfigManager)
+        settings = {'semantic_clustering.n_clusters': 3, 'semantic_clustering.batch_size': 16}
+        config.get.side_effect = lambda key, default=None: settings.get(key, default)
+        return config
+    
+    @staticmethod
+    def same_partition(labels, truth):
+        """Whether labels group rows exactly like the true clusters."""
+        return len(set(zip(labels, truth))) == len(set(truth)) == len(set(labels))
+    
+    def test_fit_and_predict(self, config_manager):
+        """Test clustering separated blobs and reusing the centroids."""
+        points, truth = blobs(20)
+        clusterer = SemanticClusterer(config_manager)
+        
+        labels = clusterer.fit(points)
+        
+        assert self.same_partition(labels, truth)
+        assert sorted(clusterer.cluster_sizes().values()) == [20, 20, 20]
+        np.testing.assert_array_equal(clusterer.predict(points), labels)
+        assert all(stat["peak_memory_mb"] is None for stat in clusterer.get_stage_stats())
+    
+    def test_partial_fit_and_save_load(self, config_manager, tmp_path):
+        """Test incremental updates continuing from saved centroids."""
+        points, truth = blobs(20)
+        clusterer = SemanticClusterer(config_manager)
+        clusterer.partial_fit(points[::2])
+        clusterer.save(str(tmp_path / "model.npz"))
+        
+        restored = SemanticClusterer(config_manager).load(str(tmp_path / "model.npz"))
+        labels = restored.partial_fit(points[1::2])
+        
+        assert self.same_partition(labels, truth[1::2])
+        assert restored.counts.sum() == len(points)
+    
+    def test_first_partial_fit_needs_n_clusters_rows(self, config_manager):
+        """Test that seeding centroids from too few rows fails clearly."""
+        with pytest.raises(ValueError):
+            SemanticClusterer(config_manager).partial_fit(np.eye(2, 6))
\ No newline at end of file
@@ -0,0 +1,108 @@
+"""Unit tests for SimilarityCalculator module."""
+
+import pytest
+import numpy as np
+from scipy.sparse import csr_matrix
+from src.utils import SimilarityCalculator
+
+
+@pytest.fixture
+def queries():
+    """Create random query vectors."""
+    return np.random.default_rng(0).normal(size=(11, 6)).astype(np.float32)
+
+
+@pytest.fixture
+def corpus():
+    """Create random corpus vectors with varied norms."""
+    rng = np.random.default_rng(1)
+    return (rng.normal(size=(37, 6)) * rng.uniform(0.5, 3.0, size=(37, 1))).astype(np.float32)
+
+
+def brute_force(queries, corpus, metric):
+    """Full score matrix computed directly with NumPy."""
+    if metric == "cosine":
+        queries = queries / np.maximum(np.linalg.norm(queries, axis=1, keepdims=True), 1e-12)
+        corpus = corpus / np.maximum(np.linalg.norm(corpus, axis=1, keepdims=True), 1e-12)
+    return queries @ corpus.T
+
+
+class TestSimilarityCalculator:
+    """Test cases for SimilarityCalculator class."""
+    
+    @pytest.mark.parametrize("metric", ["cosine", "dot"])
+    def test_top_k_across_blocks(self, queries, corpus, metric):
+        """Test that top_k over many small tiles matches a full ranking."""
+        calculator = SimilarityCalculator(metric=metric, block_size=4)
+        expected = brute_force(queries, corpus, metric)
+        
+        indices, scores = calculator.top_k(queries, corpus, k=5)
+        
+        np.testing.assert_array_equal(indices, np.argsort(-expected, axis=1)[:, :5])
+        np.testing.assert_allclose(scores, -np.sort(-expected, axis=1)[:, :5], rtol=1e-5)
+    
+    def test_cosine_and_dot_rank_differently(self, queries, corpus):
+        """Test that dot products favour long vectors while cosine ignores length."""
+        cosine = SimilarityCalculator("cosine").similarity(queries, corpus)
+        dot = SimilarityCalculator("dot").similarity(queries, corpus)
+        
+        np.testing.assert_allclose(cosine, brute_force(queries, corpus, "cosine"), rtol=1e-5)
+        np.testing.assert_allclose(dot, brute_force(queries, corpus, "dot"), rtol=1e-5)
+        assert np.abs(cosine).max() <= 1.0 + 1e-6
+        assert not np.array_equal(cosine.argmax(axis=1), dot.argmax(axis=1))
+    
+    def test_top_k_exclude_removes_self_matches(self, corpus):
+        """Test that excluded rows never appear, leaving -1 slots when too few remain."""
+        calculator = SimilarityCalculator(block_size=5)
+        exclude = np.zeros(len(corpus), dtype=bool)
+        exclude[::2] = True
+        
+        indices, scores = calculator.top_k(corpus, corpus, k=3, exclude=exclude)
+        
+        assert not np.isin(indices, np.flatnonzero(exclude)).any()
+        expected = brute_force(corpus, corpus, "cosine")
+        expected[:, exclude] = -np.inf
+        np.testing.assert_array_equal(indices, np.argsort(-expected, axis=1, kind='stable')[:, :3])
+        
+        small, small_scores = calculator.top_k(corpus[:2], corpus[:3], k=3, exclude=np.array([True, False, True]))
+        assert small.tolist() == [[1, -1, -1], [1, -1, -1]]
+        assert np.isneginf(small_scores[:, 1:]).all()
+    
+    def test_threshold_pairs_dense(self, queries, corpus):
+        """Test that every pair at or above the threshold is found exactly once."""
+        calculator = SimilarityCalculator(block_size=4)
+        expected = brute_force(queries, corpus, "cosine")
+        
+        rows, cols, values = calculator.threshold_pairs(queries, corpus, threshold=0.5)
+        
+        assert sorted(zip(rows.tolist(), cols.tolist())) == sorted(zip(*np.nonzero(expected >= 0.5)))
+        np.testing.assert_allclose(values, expected[rows, cols], rtol=1e-5)
+    
+    def test_threshold_pairs_sparse_input_and_output(self, queries, corpus):
+        """Test CSR inputs and the CSR result against the dense computation."""
+        calculator = SimilarityCalculator(block_size=4)
+        sparse_queries = csr_matrix(np.where(np.abs(queries) > 0.5, queries, 0))
+        sparse_corpus = csr_matrix(np.where(np.abs(corpus) > 0.5, corpus, 0))
+        expected = brute_force(sparse_queries.toarray(), sparse_corpus.toarray(), "cosine")
+        
+        result = calculator.threshold_pairs(sparse_queries, sparse_corpus, threshold=0.3, as_sparse=True)
+        
+        assert result.shape == (len(queries), len(corpus))
+        np.testing.assert_allclose(result.toarray(), np.where(expected >= 0.3, expected, 0), rtol=1e-5, atol=1e-6)
+        indices, _ = calculator.top_k(sparse_queries, sparse_corpus, k=2)
+        np.testing.assert_array_equal(indices, np.argsort(-expected, axis=1)[:, :2])
+    
+    def test_select_top_k_with_fewer_candidates(self):
+        """Test that k larger than the candidate count keeps every candidate, sorted."""
+        indices = np.array([[7, 8, 9], [1, 2, 3]])
+        scores = np.array([[0.1, 0.9, 0.5], [0.3, 0.2, 0.1]])
+        
+        top_indices, top_scores = SimilarityCalculator.select_top_k(indices, scores, k=10)
+        
+        assert top_indices.tolist() == [[8, 9, 7], [1, 2, 3]]
+        np.testing.assert_allclose(top_scores, [[0.9, 0.5, 0.1], [0.3, 0.2, 0.1]])
+    
+    def test_unknown_metric(self):
+        """Test that unsupported metrics are rejected."""
+        with pytest.raises(ValueError):
+            SimilarityCalculator(metric="euclidean")
\ No newline at end of file
@@ -0,0 +1,72 @@
+"""Unit tests for StageTimer module."""
+
+import tracemalloc
+from src.utils import StageTimer
+
+
+class TestStageTimer:
+    """Test cases for StageTimer class."""
+    
+    def test_memory_tracking_off_by_default(self):
+        """Test that stages record time but no memory unless asked to."""
+        timer = StageTimer()
+        
+        with timer.stage("load", rows=3):
+            pass
+        
+        assert timer.stats[0]["rows"] == 3
+        assert timer.stats[0]["peak_memory_mb"] is None
+        assert not tracemalloc.is_tracing()
+    
+    def test_nested_stages_keep_outer_peak(self):
+        """Test that an inner stage does not reset the peak of its outer stage."""
+        outer_timer = StageTimer(track_memory=True)
+        inner_timer = StageTimer(track_memory=True)
+        
+        with outer_timer.stage("outer"):
+            block = bytearray(8 * 1024 * 1024)
+            del block
+            with inner_timer.stage("inner"):
+                small = bytearray(1024 * 1024)
+                del small
+            with inner_timer.stage("inner"):
+                pass
+        
+        outer = outer_timer.stats[0]["peak_memory_mb"]
+        inner = [entry["peak_memory_mb"] for entry in inner_timer.stats]
+        assert outer >= 8
+        assert 1 <= inner[0] < 8
+        assert inner[1] < 1
+        assert not tracemalloc.is_tracing()
+    
+    def test_nested_stages_without_reset_peak(self, monkeypatch):
+        """Test nested peaks on Python 3.8, where tracemalloc has no reset_peak."""
+        monkeypatch.delattr(tracemalloc, 'reset_peak')
+        timer = StageTimer(track_memory=True)
+        
+        with timer.stage("outer"):
+            block = bytearray(8 * 1024 * 1024)
+            del block
+            with timer.stage("inner"):
+                small = bytearray(1024 * 1024)
+                del small
+        
+        inner, outer = [entry["peak_memory_mb"] for entry in timer.stats]
+        assert outer >= 8
+        assert 1 <= inner < 8
+        assert not tracemalloc.is_tracing()
+    
+    def test_summary_aggregates_repeated_stages(self):
+        """Test that repeated stages are summed in first-seen order."""
+        timer = StageTimer()
+        
+        for rows in (2, 3):
+            with timer.stage("embed", rows):
+                pass
+        with timer.stage("cluster", 5):
+            pass
+        
+        summary = timer.summary()
+        assert [entry["stage"] for entry in summary] == ["embed", "cluster"]
+        assert summary[0]["calls"] == 2
+        assert summary[0]["rows"] == 5
\ No newline at end of file
@@ -0,0 +1,210 @@
+"""Unit tests for TextProcessor module."""
+
+import random
+import re
+import pytest
+import spacy
+from spacy.language import Language
+from collections import Counter
+from unittest.mock import Mock, patch
+from src.utils import DocumentCache, model_registry
+from src.utils.text_processing import TextProcessor
+
+
+def legacy_clean_text(text):
+    """The original multi-pass clean_text, kept as the reference output."""
+    text = re.sub(r'\s+', ' ', text)
+    text = re.sub(r'[^\w\s.,!?;:-]', '', text)
+    text = text.replace('"', '"').replace('"', '"')
+    return text.strip()
+
+
+def vowel_groups(word):
+    """Deterministic syllable count standing in for textstat's dictionary."""
+    return max(1, len(re.findall(r'[aeiouy]+', word)))
+
+
+lemmatized_forms = []
+
+
+@Language.component("test_suffix_lemma")
+def suffix_lemma(doc):
+    """Lemmatize by dropping a plural "s", recording every token seen."""
+    for token in doc:
+        lemmatized_forms.append(token.text)
+        token.lemma_ = token.text[:-1] if token.text.endswith('s') and len(token.text) > 3 else token.text
+    return doc
+
+
+recognized_texts = []
+
+
+@Language.component("test_recording_ner")
+def recording_ner(doc):
+    """Stand-in entity recognizer that records the documents it sees."""
+    recognized_texts.append(doc.text)
+    return doc
+
+
+class TestCleanText:
+    """Test cases for TextProcessor.clean_text."""
+    
+    def test_matches_legacy_on_edge_cases(self):
+        """Test byte-for-byte equality on whitespace, punctuation and non-ASCII input."""
+        texts = [
+            "",
+            "   ",
+            "  Hello,   world!  ",
+            'He said "hi" & left (quickly) <b>now</b>; ok? yes: no - maybe_not 42%',
+            "tabs\tand\nnewlines\r\nand\x0bvertical\x0cfeeds",
+            "ascii separators\x1c\x1d\x1e\x1fbetween",
+            "non-breaking\xa0space thin\u2009ideographic\u3000line\x85next\u2028para",
+            "“smart” ‘quotes’ — dashes … ellipsis",
+            "été naïve café Ωmega ½ ² ٣ 北京 ﬁ",
+            "combining e\u0301 and zero\u200bwidth",
+            "emoji 🚀 and ™ ® ©",
+            "\x00control\x07chars\x7f",
+        ]
+        
+        for text in texts:
+            assert TextProcessor.clean_text(text) == legacy_clean_text(text), repr(text)
+    
+    def test_matches_legacy_on_random_text(self):
+        """Test equality on random strings drawn from ASCII and the BMP."""
+        rng = random.Random(0)
+        alphabet = [chr(code) for code in range(128)] + [chr(rng.randrange(128, 0x3000)) for _ in range(200)]
+        
+        for ascii_only in (True, False):
+            pool = alphabet[:128] if ascii_only else alphabet
+            for _ in range(500):
+                text = ''.join(rng.choices(pool, k=rng.randrange(0, 60)))
+                assert TextProcessor.clean_text(text) == legacy_clean_text(text), repr(text)
+    
+    def test_clean_texts_is_lazy_and_ordered(self):
+        """Test that clean_texts yields cleaned texts in input order."""
+        cleaned = TextProcessor.clean_texts(iter(["  a  b ", "<c>", "d!"]))
+        
+        assert next(cleaned) == "a b"
+        assert list(cleaned) == ["c", "d!"]
+
+
+class TestReadability:
+    """Test cases for TextProcessor readability metrics."""
+    
+    @pytest.fixture(autouse=True)
+    def syllables(self):
+        """Count syllables without textstat's pronunciation dictionary."""
+        with patch('src.utils.text_processing._syllables', side_effect=vowel_groups):
+            yield
+    
+    @pytest.fixture
+    def processor(self):
+        """Create a processor using the rule-based sentencizer."""
+        return TextProcessor(spacy_model="missing_model", sentencizer_only=True)
+    
+    def test_metrics(self, processor):
+        """Test word_count on whitespace tokens and scores on lexical words."""
+        metrics = processor.calculate_readability("The cat sat - on the mat. Wasn't it lovely?")
+        
+        # Scores use 9 words without "-" in 2 sentences, and 11 syllables
+        words_per_sentence, syllables_per_word = 9 / 2, 11 / 9
+        assert metrics == {
+            "flesch_reading_ease": round(206.835 - 1.015 * words_per_sentence - 84.6 * syllables_per_word, 2),
+            "flesch_kincaid_grade": round(0.39 * words_per_sentence + 11.8 * syllables_per_word - 15.59, 2),
+            "word_count": 10,
+            "sentence_count": 2,
+            "avg_words_per_sentence": 5.0
+        }
+    
+    def test_text_without_words(self, processor):
+        """Test that empty and punctuation-only texts score 0.0 instead of failing."""
+        assert processor.calculate_readability("")["flesch_reading_ease"] == 0.0
+        assert processor.calculate_readability("")["avg_words_per_sentence"] == 0.0
+        metrics = processor.calculate_readability("... !")
+        assert metrics["flesch_kincaid_grade"] == 0.0
+        assert metrics["word_count"] == 2
+    
+    def test_doc_without_sentence_boundaries(self):
+        """Test that a doc from a pipeline without a parser gets sentences from a sentencizer."""
+        doc = spacy.blank("en")("One two three. Four five!")
+        
+        metrics = TextProcessor.readability_from_doc(doc)
+        
+        assert metrics["sentence_count"] == 2
+        assert metrics["avg_words_per_sentence"] == 2.5
+        assert not doc.has_annotation("SENT_START")
+    
+    def test_iter_readability_matches_single_texts(self, processor):
+        """Test that batched readability equals per-text readability, in order."""
+        texts = ["One two. Three.", "", "Hello world"]
+        
+        assert list(processor.iter_readability(texts, batch_size=2)) == [
+            processor.calculate_readability(text) for text in texts
+        ]
+
+
+class TestFastTokenization:
+    """Test cases for tokenization with the lemma cache."""
+    
+    @pytest.fixture
+    def nlp(self):
+        """Create a pipeline with a context-free lemmatizer and a stand-in senter."""
+        nlp = spacy.blank("en")
+        nlp.add_pipe("sentencizer", name="senter")
+        nlp.add_pipe("test_suffix_lemma")
+        lemmatized_forms.clear()
+        return nlp
+    
+    def test_matches_full_pipeline(self, nlp):
+        """Test that fast tokenization agrees with parsing when lemmas ignore context."""
+        full = TextProcessor(document_cache=DocumentCache(nlp))
+        fast = TextProcessor(document_cache=DocumentCache(nlp), fast_tokenization=True)
+        texts = ["The clusters hold many Shards and shards.  Queries run fast.", "", "shards shards"]
+        
+        for text in texts:
+            assert fast.extract_tokens(text, remove_stopwords=False) == full.extract_tokens(text, remove_stopwords=False)
+        assert list(fast.iter_tokens(texts, remove_stopwords=False)) == list(full.iter_tokens(texts, remove_stopwords=False))
+    
+    def test_lemma_cache_is_lru(self, nlp):
+        """Test that cached forms are not lemmatized again and the cache is bounded."""
+        processor = TextProcessor(document_cache=DocumentCache(nlp), fast_tokenization=True, lemma_cache_size=3)
+        
+        assert processor.extract_tokens("nodes nodes shards", remove_stopwords=False) == ["node", "node", "shard"]
+        assert lemmatized_forms == ["nodes", "shards"]
+        
+        lemmatized_forms.clear()
+        processor.extract_tokens("nodes index query", remove_stopwords=False)
+        
+        assert lemmatized_forms == ["index", "query"]
+        assert list(processor._lemmas) == ["nodes", "index", "query"]
+    
+    def test_lemmas_use_the_shared_model_without_unused_pipes(self, nlp, tmp_path):
+        """Test that lemma lookups reuse the loaded model and skip its NER."""
+        nlp.add_pipe("test_recording_ner", name="ner")
+        nlp.to_disk(tmp_path / "model")
+        recognized_texts.clear()
+        processor = TextProcessor(str(tmp_path / "model"), fast_tokenization=True)
+        
+        assert processor.extract_tokens("Shards", remove_stopwords=False) == ["shard"]
+        assert lemmatized_forms == ["Shards"]
+        assert recognized_texts == []
+        assert [key for key in model_registry._models if key[0] == str(tmp_path / "model")] == [
+            (str(tmp_path / "model"), (), ())
+        ]
+    
+    def test_count_phrases_bypasses_document_cache(self, nlp):
+        """Test that corpus phrase counting tokenizes in batches without the parse cache."""
+        processor = TextProcessor(document_cache=DocumentCache(nlp))
+        texts = ["search clusters scale, shards move", "search clusters scale"]
+        expected = Counter(phrase for text in texts for phrase in processor.iter_phrases(text, 2, 3))
+        processor.document_cache.parse = Mock(side_effect=AssertionError("document cache used"))
+        
+        counter = processor.count_phrases(texts, min_length=2, max_length=3, prune_stopwords=False, batch_size=1)
+        
+        assert dict(counter.most_common()) == dict(expected)
+    
+    def test_without_model(self):
+        """Test that lemmas fall back to lowercase forms without a spaCy model."""
+        processor = TextProcessor(spacy_model="missing_model", fast_tokenization=True)
+        
+        assert processor.extract_tokens("Hello, Shards", remove_stopwords=False) == ["hello", ",", "shards"]
\ No newline at end of file